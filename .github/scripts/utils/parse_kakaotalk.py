@@ -11,8 +11,10 @@ import re
 from pydantic import BaseModel
 from sqlalchemy import select, delete
 
+from core.cache_events import publish_invalidation
 from core.database import get_session_maker
 from core.models import RequestByWeek, SnsRaiseUser
+from core.response_cache import TAG_REQUEST_BY_WEEK
 from .date_helper import get_target_week_dates, format_date, get_week_start_date
 from .logger import setup_logger
 
@@ -155,6 +157,8 @@ async def save_to_database(parsed_data: list[KakaoTalk]) -> dict:
                 saved_count += 1
                 logger.debug(f"  💾 저장: {item.username} - {item.link[:50]}...")
 
+            # 커밋되면 API 프로세스들이 주간 요청 응답 캐시를 무효화
+            await publish_invalidation(session, TAG_REQUEST_BY_WEEK)
             await session.commit()
 
             logger.info(
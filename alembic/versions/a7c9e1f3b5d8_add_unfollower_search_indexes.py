@@ -0,0 +1,52 @@
+"""Add unfollower search indexes and unfollower_count
+
+Revision ID: a7c9e1f3b5d8
+Revises: d9f1b3c5e7a2
+Create Date: 2026-10-17 17:05:12.418337
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "a7c9e1f3b5d8"
+down_revision: Union[str, None] = "d9f1b3c5e7a2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "unfollower_service_user",
+        sa.Column(
+            "unfollower_count",
+            sa.Integer(),
+            nullable=True,
+            comment="unfollowers 행 수 (수집 반영 시 갱신)",
+        ),
+    )
+    op.execute("""
+        UPDATE unfollower_service_user AS s
+        SET unfollower_count = (
+            SELECT count(*) FROM unfollowers AS u WHERE u.owner = s.username
+        )
+        """)
+    op.create_index(
+        "idx_unfollowers_owner_username_prefix",
+        "unfollowers",
+        ["owner", sa.text("lower(unfollower_username) text_pattern_ops")],
+    )
+    op.create_index(
+        "idx_unfollowers_owner_fullname_prefix",
+        "unfollowers",
+        ["owner", sa.text("lower(unfollower_fullname) text_pattern_ops")],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_unfollowers_owner_fullname_prefix", table_name="unfollowers")
+    op.drop_index("idx_unfollowers_owner_username_prefix", table_name="unfollowers")
+    op.drop_column("unfollower_service_user", "unfollower_count")
@@ -0,0 +1,78 @@
+"""Add unfollower_history table
+
+Revision ID: a9c3e5f7b1d2
+Revises: f4b8d2e6a9c1
+Create Date: 2026-10-17 13:20:44.163508
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "a9c3e5f7b1d2"
+down_revision: Union[str, None] = "f4b8d2e6a9c1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "unfollower_history",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("owner", sa.String(length=50), nullable=False),
+        sa.Column("unfollower_username", sa.String(length=50), nullable=False),
+        sa.Column("unfollower_fullname", sa.String(length=255), nullable=False),
+        sa.Column("first_seen_at", sa.DateTime(), nullable=False),
+        sa.Column("last_seen_at", sa.DateTime(), nullable=False),
+        sa.Column(
+            "resolved_at",
+            sa.DateTime(),
+            nullable=True,
+            comment="다시 맞팔로우가 확인된 시각",
+        ),
+        sa.ForeignKeyConstraint(
+            ["owner"], ["sns_raise_user.username"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "idx_unfollower_history_open",
+        "unfollower_history",
+        ["owner", "unfollower_username"],
+        unique=True,
+        postgresql_where=sa.text("resolved_at IS NULL"),
+    )
+    op.create_index(
+        "idx_unfollower_history_owner_first_seen",
+        "unfollower_history",
+        ["owner", "first_seen_at"],
+        unique=False,
+    )
+    op.create_index(
+        "idx_unfollower_history_owner_resolved",
+        "unfollower_history",
+        ["owner", "resolved_at"],
+        unique=False,
+    )
+
+    # 현재 언팔로워를 진행 중인 구간으로 옮겨 이력의 시작점으로 사용
+    op.execute("""
+        INSERT INTO unfollower_history
+            (owner, unfollower_username, unfollower_fullname, first_seen_at, last_seen_at)
+        SELECT owner, unfollower_username, unfollower_fullname, created_at, updated_at
+        FROM unfollowers
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "idx_unfollower_history_owner_resolved", table_name="unfollower_history"
+    )
+    op.drop_index(
+        "idx_unfollower_history_owner_first_seen", table_name="unfollower_history"
+    )
+    op.drop_index("idx_unfollower_history_open", table_name="unfollower_history")
+    op.drop_table("unfollower_history")
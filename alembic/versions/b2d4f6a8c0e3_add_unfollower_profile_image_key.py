@@ -0,0 +1,34 @@
+"""Add profile_image_key to unfollowers
+
+Revision ID: b2d4f6a8c0e3
+Revises: a9c3e5f7b1d2
+Create Date: 2026-10-17 14:02:19.556820
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "b2d4f6a8c0e3"
+down_revision: Union[str, None] = "a9c3e5f7b1d2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "unfollowers",
+        sa.Column(
+            "profile_image_key",
+            sa.String(length=64),
+            nullable=True,
+            comment="core.avatar_cache 키 (sha256)",
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("unfollowers", "profile_image_key")
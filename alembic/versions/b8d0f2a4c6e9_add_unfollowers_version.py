@@ -0,0 +1,35 @@
+"""Add unfollower_service_user.unfollowers_version
+
+Revision ID: b8d0f2a4c6e9
+Revises: a7c9e1f3b5d8
+Create Date: 2026-10-17 19:22:40.512904
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "b8d0f2a4c6e9"
+down_revision: Union[str, None] = "a7c9e1f3b5d8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "unfollower_service_user",
+        sa.Column(
+            "unfollowers_version",
+            sa.Integer(),
+            server_default="0",
+            nullable=False,
+            comment="unfollowers가 바뀔 때마다 증가 (언팔로워 목록 ETag)",
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("unfollower_service_user", "unfollowers_version")
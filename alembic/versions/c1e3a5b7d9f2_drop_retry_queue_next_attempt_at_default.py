@@ -0,0 +1,40 @@
+"""Drop the now() server default of verification_retry_queue.next_attempt_at
+
+Revision ID: c1e3a5b7d9f2
+Revises: b8d0f2a4c6e9
+Create Date: 2026-10-17 20:48:13.216075
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "c1e3a5b7d9f2"
+down_revision: Union[str, None] = "b8d0f2a4c6e9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 다른 시각 컬럼처럼 애플리케이션이 naive KST(get_kst_now)로 채움
+    # now()는 서버 타임존 기준이라 claim_due_retries의 비교와 어긋남
+    op.alter_column(
+        "verification_retry_queue",
+        "next_attempt_at",
+        existing_type=sa.DateTime(),
+        server_default=None,
+        existing_nullable=False,
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        "verification_retry_queue",
+        "next_attempt_at",
+        existing_type=sa.DateTime(),
+        server_default=sa.text("now()"),
+        existing_nullable=False,
+    )
@@ -0,0 +1,67 @@
+"""Add collection_run table
+
+Revision ID: c3d8e1f2a4b5
+Revises: ab0519aad0a6
+Create Date: 2026-10-17 10:12:41.318204
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "c3d8e1f2a4b5"
+down_revision: Union[str, None] = "ab0519aad0a6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "collection_run",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("run_id", sa.String(length=32), nullable=False),
+        sa.Column("owner", sa.String(length=50), nullable=False),
+        sa.Column(
+            "outcome",
+            sa.String(length=20),
+            nullable=False,
+            comment="success, login_failed, scan_failed, ...",
+        ),
+        sa.Column("started_at", sa.DateTime(), nullable=False),
+        sa.Column("finished_at", sa.DateTime(), nullable=True),
+        sa.Column("total_ms", sa.Integer(), nullable=False),
+        sa.Column("login_ms", sa.Integer(), nullable=True),
+        sa.Column("navigation_ms", sa.Integer(), nullable=True),
+        sa.Column("scan_ms", sa.Integer(), nullable=True),
+        sa.Column("db_write_ms", sa.Integer(), nullable=True),
+        sa.Column("pages", sa.Integer(), nullable=False),
+        sa.Column("following_count", sa.Integer(), nullable=True),
+        sa.Column("unfollower_count", sa.Integer(), nullable=True),
+        sa.Column("added_count", sa.Integer(), nullable=False),
+        sa.Column("removed_count", sa.Integer(), nullable=False),
+        sa.Column("login_attempts", sa.Integer(), nullable=False),
+        sa.Column("scan_retries", sa.Integer(), nullable=False),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["owner"], ["sns_raise_user.username"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_collection_run_run_id"), "collection_run", ["run_id"], unique=False
+    )
+    op.create_index(
+        "idx_collection_run_owner_started",
+        "collection_run",
+        ["owner", "started_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_collection_run_owner_started", table_name="collection_run")
+    op.drop_index(op.f("ix_collection_run_run_id"), table_name="collection_run")
+    op.drop_table("collection_run")
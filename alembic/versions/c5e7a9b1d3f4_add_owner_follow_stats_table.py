@@ -0,0 +1,47 @@
+"""Add owner_follow_stats table
+
+Revision ID: c5e7a9b1d3f4
+Revises: b2d4f6a8c0e3
+Create Date: 2026-10-17 15:11:08.402917
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "c5e7a9b1d3f4"
+down_revision: Union[str, None] = "b2d4f6a8c0e3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "owner_follow_stats",
+        sa.Column("owner", sa.String(length=50), nullable=False),
+        sa.Column("following_count", sa.Integer(), nullable=False),
+        sa.Column("follower_count", sa.Integer(), nullable=False),
+        sa.Column(
+            "checked_at",
+            sa.DateTime(),
+            nullable=False,
+            comment="마지막으로 수를 확인한 시각",
+        ),
+        sa.Column(
+            "full_scan_at",
+            sa.DateTime(),
+            nullable=False,
+            comment="이 수로 전체 스캔을 마친 시각",
+        ),
+        sa.ForeignKeyConstraint(
+            ["owner"], ["sns_raise_user.username"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("owner"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("owner_follow_stats")
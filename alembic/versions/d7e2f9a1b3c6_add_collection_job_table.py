@@ -0,0 +1,53 @@
+"""Add collection_job table
+
+Revision ID: d7e2f9a1b3c6
+Revises: c3d8e1f2a4b5
+Create Date: 2026-10-17 11:04:52.774019
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "d7e2f9a1b3c6"
+down_revision: Union[str, None] = "c3d8e1f2a4b5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "collection_job",
+        sa.Column("owner", sa.String(length=50), nullable=False),
+        sa.Column(
+            "status",
+            sa.String(length=20),
+            nullable=False,
+            comment="pending, running, done, failed",
+        ),
+        sa.Column("available_at", sa.DateTime(), nullable=False),
+        sa.Column("lease_owner", sa.String(length=100), nullable=True),
+        sa.Column("lease_expires_at", sa.DateTime(), nullable=True),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["owner"], ["sns_raise_user.username"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("owner"),
+    )
+    op.create_index(
+        "idx_collection_job_status_available",
+        "collection_job",
+        ["status", "available_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_collection_job_status_available", table_name="collection_job")
+    op.drop_table("collection_job")
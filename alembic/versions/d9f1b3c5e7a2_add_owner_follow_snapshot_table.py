@@ -0,0 +1,38 @@
+"""Add owner_follow_snapshot table
+
+Revision ID: d9f1b3c5e7a2
+Revises: c5e7a9b1d3f4
+Create Date: 2026-10-17 15:48:31.270114
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "d9f1b3c5e7a2"
+down_revision: Union[str, None] = "c5e7a9b1d3f4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "owner_follow_snapshot",
+        sa.Column("owner", sa.String(length=50), nullable=False),
+        sa.Column("following_count", sa.Integer(), nullable=False),
+        sa.Column("follower_count", sa.Integer(), nullable=False),
+        sa.Column("following", sa.LargeBinary(), nullable=False),
+        sa.Column("followers", sa.LargeBinary(), nullable=False),
+        sa.Column("scanned_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["owner"], ["sns_raise_user.username"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("owner"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("owner_follow_snapshot")
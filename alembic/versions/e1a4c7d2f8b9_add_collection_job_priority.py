@@ -0,0 +1,39 @@
+"""Add priority and estimate_seconds to collection_job
+
+Revision ID: e1a4c7d2f8b9
+Revises: d7e2f9a1b3c6
+Create Date: 2026-10-17 11:48:20.512337
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "e1a4c7d2f8b9"
+down_revision: Union[str, None] = "d7e2f9a1b3c6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "collection_job",
+        sa.Column(
+            "priority",
+            sa.Float(),
+            server_default="0",
+            nullable=False,
+            comment="높을수록 먼저 점유 (데이터 경과 시간 / 예상 수집 시간)",
+        ),
+    )
+    op.add_column(
+        "collection_job", sa.Column("estimate_seconds", sa.Float(), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("collection_job", "estimate_seconds")
+    op.drop_column("collection_job", "priority")
@@ -0,0 +1,56 @@
+"""Store unfollower_history.last_seen_at only for resolved entries
+
+Revision ID: e3a5c7e9b1d4
+Revises: c1e3a5b7d9f2
+Create Date: 2026-10-17 21:36:52.874120
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "e3a5c7e9b1d4"
+down_revision: Union[str, None] = "c1e3a5b7d9f2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        "unfollower_history",
+        "last_seen_at",
+        existing_type=sa.DateTime(),
+        nullable=True,
+        comment="종료된 구간만 기록 (진행 중이면 소유자의 마지막 수집 시각)",
+    )
+    # 진행 중인 구간은 collection_run에서 계산하므로 수집마다 갱신하지 않음
+    op.execute(
+        "UPDATE unfollower_history SET last_seen_at = NULL WHERE resolved_at IS NULL"
+    )
+
+
+def downgrade() -> None:
+    op.execute("""
+        UPDATE unfollower_history
+        SET last_seen_at = COALESCE(
+            (
+                SELECT MAX(collection_run.finished_at)
+                FROM collection_run
+                WHERE collection_run.owner = unfollower_history.owner
+                  AND collection_run.outcome IN ('success', 'unchanged')
+            ),
+            first_seen_at
+        )
+        WHERE last_seen_at IS NULL
+    """)
+    op.alter_column(
+        "unfollower_history",
+        "last_seen_at",
+        existing_type=sa.DateTime(),
+        nullable=False,
+        comment=None,
+        existing_comment="종료된 구간만 기록 (진행 중이면 소유자의 마지막 수집 시각)",
+    )
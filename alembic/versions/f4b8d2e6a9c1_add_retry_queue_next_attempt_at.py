@@ -0,0 +1,60 @@
+"""Add next_attempt_at to verification_retry_queue
+
+Revision ID: f4b8d2e6a9c1
+Revises: e1a4c7d2f8b9
+Create Date: 2026-10-17 12:31:07.904415
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "f4b8d2e6a9c1"
+down_revision: Union[str, None] = "e1a4c7d2f8b9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "verification_retry_queue",
+        sa.Column(
+            "next_attempt_at",
+            sa.DateTime(),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+    )
+    op.alter_column(
+        "verification_retry_queue",
+        "batch_type",
+        existing_type=sa.String(length=20),
+        comment="verify, cleanup 또는 collect",
+        existing_comment="verify 또는 cleanup",
+        existing_nullable=False,
+    )
+    op.create_index(
+        "idx_verification_retry_queue_status_next_attempt",
+        "verification_retry_queue",
+        ["status", "next_attempt_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "idx_verification_retry_queue_status_next_attempt",
+        table_name="verification_retry_queue",
+    )
+    op.alter_column(
+        "verification_retry_queue",
+        "batch_type",
+        existing_type=sa.String(length=20),
+        comment="verify 또는 cleanup",
+        existing_comment="verify, cleanup 또는 collect",
+        existing_nullable=False,
+    )
+    op.drop_column("verification_retry_queue", "next_attempt_at")
@@ -3,7 +3,9 @@ from collections.abc import AsyncGenerator
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from core.config import get_settings
-from core.database import close_db
+from core.database import close_db, get_engine
+from core import cache_events
+from core.response_cache import get_response_cache
 from backend.router import api_router
 
 
@@ -11,8 +13,10 @@ from backend.router import api_router
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     settings = get_settings()
     print(f"Starting {settings.PROJECT_NAME}")
+    await cache_events.start_listener(get_engine(), get_response_cache())
     yield
     print(f"Shutting down {settings.PROJECT_NAME}")
+    await cache_events.stop_listener()
     await close_db()
 
 
@@ -10,23 +10,55 @@ import Link from 'next/link';
 import { useParams, useRouter } from 'next/navigation';
 import { useEffect, useState } from 'react';
 
+const PAGE_SIZE = 100;
+
+function UnfollowerAvatar({ unfollower }: { unfollower: Unfollower }) {
+  // 캐시된 사진을 불러오지 못하면 Instagram CDN 주소로 대체
+  const [useCached, setUseCached] = useState(Boolean(unfollower.unfollower_profile_image));
+
+  return (
+    <Image
+      src={
+        useCached && unfollower.unfollower_profile_image
+          ? unfollower.unfollower_profile_image
+          : unfollower.unfollower_profile_url
+      }
+      alt={unfollower.unfollower_username}
+      width={60}
+      height={60}
+      unoptimized={useCached}
+      onError={() => setUseCached(false)}
+      className="rounded-full"
+    />
+  );
+}
+
 export default function UnfollowerListPage() {
   const params = useParams();
   const router = useRouter();
   const owner = params.owner as string;
 
   const [data, setData] = useState<UnfollowersResponse | null>(null);
+  const [search, setSearch] = useState('');
+  const [query, setQuery] = useState('');
   const [isLoading, setIsLoading] = useState(true);
+  const [isLoadingMore, setIsLoadingMore] = useState(false);
   const [isDeleting, setIsDeleting] = useState(false);
   const [error, setError] = useState('');
   const [deleteSuccess, setDeleteSuccess] = useState('');
 
+  // 입력이 멈춘 뒤에 검색
+  useEffect(() => {
+    const timer = setTimeout(() => setQuery(search.trim()), 300);
+    return () => clearTimeout(timer);
+  }, [search]);
+
   useEffect(() => {
     const fetchUnfollowers = async () => {
       try {
         setIsLoading(true);
         setError('');
-        const response = await getUnfollowers(owner);
+        const response = await getUnfollowers(owner, { q: query, limit: PAGE_SIZE });
         setData(response);
       } catch (err: any) {
         setError(err.message || '언팔로워 목록을 불러오는데 실패했습니다');
@@ -38,7 +70,29 @@ export default function UnfollowerListPage() {
     if (owner) {
       fetchUnfollowers();
     }
-  }, [owner]);
+  }, [owner, query]);
+
+  const handleLoadMore = async () => {
+    if (!data?.next_cursor) return;
+
+    try {
+      setIsLoadingMore(true);
+      setError('');
+      const response: UnfollowersResponse = await getUnfollowers(owner, {
+        q: query,
+        after: data.next_cursor,
+        limit: PAGE_SIZE,
+      });
+      setData({
+        ...response,
+        unfollowers: [...data.unfollowers, ...response.unfollowers],
+      });
+    } catch (err: any) {
+      setError(err.message || '언팔로워 목록을 불러오는데 실패했습니다');
+    } finally {
+      setIsLoadingMore(false);
+    }
+  };
 
   const handleDelete = async () => {
     const confirmed = window.confirm(
@@ -64,7 +118,7 @@ export default function UnfollowerListPage() {
     }
   };
 
-  if (isLoading) {
+  if (isLoading && !data) {
     return (
       <div className="container mx-auto px-4 py-8">
         <div className="max-w-4xl mx-auto">
@@ -128,7 +182,7 @@ export default function UnfollowerListPage() {
               <div className="flex items-center justify-between">
                 <div>
                   <h2 className="text-xl font-bold text-blue-900">
-                    총 {data.count}명의 언팔로워
+                    {query ? `검색 결과 ${data.count}명` : `총 ${data.count}명의 언팔로워`}
                   </h2>
                   <p className="text-sm text-blue-700 mt-1">
                     나를 팔로우하지 않는 계정 목록입니다.
@@ -137,14 +191,31 @@ export default function UnfollowerListPage() {
               </div>
             </Card>
 
+            <input
+              type="search"
+              value={search}
+              onChange={(e) => setSearch(e.target.value)}
+              placeholder="아이디 또는 이름으로 검색"
+              maxLength={50}
+              className="w-full mb-6 px-4 py-2 border border-gray-300 rounded-lg focus:outline-none focus:ring-2 focus:ring-blue-500"
+            />
+
             {data.unfollowers.length === 0 ? (
               <Card className="text-center py-12">
-                <p className="text-gray-600 text-lg">
-                  🎉 언팔로워가 없습니다!
-                </p>
-                <p className="text-gray-500 text-sm mt-2">
-                  모든 사람이 나를 팔로우하고 있습니다.
-                </p>
+                {query ? (
+                  <p className="text-gray-600 text-lg">
+                    검색 결과가 없습니다.
+                  </p>
+                ) : (
+                  <>
+                    <p className="text-gray-600 text-lg">
+                      🎉 언팔로워가 없습니다!
+                    </p>
+                    <p className="text-gray-500 text-sm mt-2">
+                      모든 사람이 나를 팔로우하고 있습니다.
+                    </p>
+                  </>
+                )}
               </Card>
             ) : (
               <div className="grid gap-4">
@@ -155,13 +226,7 @@ export default function UnfollowerListPage() {
                   >
                     <div className="flex items-center gap-4">
                       <div className="flex-shrink-0">
-                        <Image
-                          src={unfollower.unfollower_profile_url}
-                          alt={unfollower.unfollower_username}
-                          width={60}
-                          height={60}
-                          className="rounded-full"
-                        />
+                        <UnfollowerAvatar unfollower={unfollower} />
                       </div>
                       <div className="flex-1 min-w-0">
                         <a
@@ -184,6 +249,15 @@ export default function UnfollowerListPage() {
                     </div>
                   </Card>
                 ))}
+                {data.next_cursor && (
+                  <Button
+                    variant="secondary"
+                    onClick={handleLoadMore}
+                    isLoading={isLoadingMore}
+                  >
+                    더 보기 ({data.unfollowers.length}/{data.count})
+                  </Button>
+                )}
               </div>
             )}
           </>
@@ -15,6 +15,7 @@ from core.schemas.announcement import (
 )
 from core.db import user_db, announcement_db
 from core.services import admin_service
+from core import cache_events, response_cache
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -52,6 +53,22 @@ async def admin_login(
     return AdminToken(access_token=access_token)
 
 
+async def _commit_and_invalidate(db: AsyncSession, *tags: str) -> None:
+    """
+    Commit an admin write, then drop the cached public responses it affects,
+    here and (through the notification sent with the commit) in every other
+    API process. Invalidating after the commit keeps a concurrent reader
+    from caching the old rows again.
+
+    Args:
+        db: Database session
+        tags: response_cache tags to invalidate
+    """
+    await cache_events.publish_invalidation(db, *tags)
+    await db.commit()
+    response_cache.get_response_cache().invalidate_tags(*tags)
+
+
 # SNS User Management
 @router.get("/sns-users")
 async def list_sns_users(
@@ -177,6 +194,13 @@ async def delete_sns_user(
             status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
         )
 
+    # 요청/검증 기록이 CASCADE로 함께 삭제됨
+    await _commit_and_invalidate(
+        db,
+        response_cache.TAG_REQUEST_BY_WEEK,
+        response_cache.TAG_USER_ACTION_VERIFICATION,
+    )
+
 
 # Announcement Management
 @router.get("/announcements", response_model=list[AnnouncementResponse])
@@ -221,6 +245,7 @@ async def create_announcement(
         kakao_qr_code_url=data.kakao_qr_code_url,
         is_active=data.is_active,
     )
+    await _commit_and_invalidate(db, response_cache.TAG_ANNOUNCEMENTS)
     return announcement
 
 
@@ -258,6 +283,7 @@ async def update_announcement(
             status_code=status.HTTP_404_NOT_FOUND, detail="Announcement not found"
         )
 
+    await _commit_and_invalidate(db, response_cache.TAG_ANNOUNCEMENTS)
     return announcement
 
 
@@ -283,3 +309,24 @@ async def delete_announcement(
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Announcement not found"
         )
+
+    await _commit_and_invalidate(db, response_cache.TAG_ANNOUNCEMENTS)
+
+
+# Response Cache
+@router.get("/cache-stats")
+async def get_cache_stats(
+    current_admin: Annotated[dict, Depends(get_current_admin)],
+) -> dict:
+    """
+    Get hit/miss statistics of this process's public response cache and
+    the state of its invalidation listener.
+
+    Returns:
+        Counters, hit ratio, current size and listener state
+    """
+    listener = cache_events.get_listener()
+    return {
+        **response_cache.get_response_cache().report(),
+        "listener": listener.report() if listener else None,
+    }
@@ -1,7 +1,9 @@
 """Public API routes (no authentication required)."""
 
+from datetime import date, datetime
 from typing import Annotated
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import FileResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from core.database import get_db
 from core.schemas.announcement import AnnouncementResponse
@@ -12,15 +14,26 @@ from core.schemas.unfollower_service_user import (
     UnfollowerServiceUserCreate,
     UnfollowerServiceUserResponse,
 )
+from core.schemas.unfollower import (
+    FollowRelationshipsResponse,
+    UnfollowerHistoryListResponse,
+    UnfollowerHistoryResponse,
+)
 from core.db import (
     announcement_db,
+    collection_run_db,
+    follow_snapshot_db,
     user_db,
     consumer_db,
     producer_db,
     unfollower_service_user_db,
     unfollower_db,
+    unfollower_history_db,
 )
 from core.crypto import encrypt_data
+from core.config import get_settings
+from core import avatar_cache, cache_events, conditional, response_cache
+from core.collector import snapshot
 
 
 router = APIRouter()
@@ -29,26 +42,35 @@ router = APIRouter()
 @router.get("/announcements", response_model=list[AnnouncementResponse])
 async def get_announcements(
     db: Annotated[AsyncSession, Depends(get_db)],
-) -> list[AnnouncementResponse]:
+) -> Response:
     """
     Get all active announcements.
+    Served from the response cache until an admin changes announcements.
 
     Returns:
         List of active announcements
     """
-    announcements = await announcement_db.get_active_announcements(db)
-    return announcements
+
+    async def load() -> bytes:
+        announcements = await announcement_db.get_active_announcements(db)
+        return response_cache.dump_models(AnnouncementResponse, announcements)
+
+    return await response_cache.cached_response(
+        "announcements", [response_cache.TAG_ANNOUNCEMENTS], load
+    )
 
 
 @router.get("/request-by-week", response_model=list[RequestByWeekResponse])
 async def get_request_by_week(
+    request: Request,
     db: Annotated[AsyncSession, Depends(get_db)],
     username: str | None = Query(None, description="Filter by username"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of results"),
     offset: int = Query(0, ge=0, description="Number of results to skip"),
-) -> list[RequestByWeekResponse]:
+) -> Response:
     """
     Get weekly link requests with optional username filter.
+    Answers 304 when the client's ETag is still current.
 
     Args:
         username: Optional username filter
@@ -58,21 +80,47 @@ async def get_request_by_week(
     Returns:
         List of weekly requests
     """
-    requests = await user_db.get_requests_by_week(db, username, limit, offset)
-    return requests
+    count, max_id, last_created = await user_db.get_requests_by_week_version(
+        db, username
+    )
+    validator = conditional.make_validator(
+        "request-by-week",
+        count,
+        max_id,
+        last_created,
+        username,
+        limit,
+        offset,
+    )
+    if conditional.is_not_modified(request, validator):
+        return conditional.not_modified(validator)
+
+    async def load() -> bytes:
+        requests = await user_db.get_requests_by_week(db, username, limit, offset)
+        return response_cache.dump_models(RequestByWeekResponse, requests)
+
+    # 키에 검증자가 들어가므로 데이터가 바뀌면 새 키로 조회
+    return await response_cache.cached_response(
+        f"request-by-week:{validator.etag}",
+        [response_cache.TAG_REQUEST_BY_WEEK],
+        load,
+        validator.headers,
+    )
 
 
 @router.get(
     "/user-action-verification", response_model=list[UserActionVerificationResponse]
 )
 async def get_user_action_verification(
+    request: Request,
     db: Annotated[AsyncSession, Depends(get_db)],
     username: str | None = Query(None, description="Filter by username"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of results"),
     offset: int = Query(0, ge=0, description="Number of results to skip"),
-) -> list[UserActionVerificationResponse]:
+) -> Response:
     """
     Get user action verification data with optional username filter.
+    Answers 304 when the client's ETag is still current.
 
     Args:
         username: Optional username filter
@@ -82,10 +130,33 @@ async def get_user_action_verification(
     Returns:
         List of verification records
     """
-    verifications = await user_db.get_user_action_verifications(
-        db, username, limit, offset
+    count, max_id, last_created = await user_db.get_user_action_verifications_version(
+        db, username
+    )
+    validator = conditional.make_validator(
+        "user-action-verification",
+        count,
+        max_id,
+        last_created,
+        username,
+        limit,
+        offset,
+    )
+    if conditional.is_not_modified(request, validator):
+        return conditional.not_modified(validator)
+
+    async def load() -> bytes:
+        verifications = await user_db.get_user_action_verifications(
+            db, username, limit, offset
+        )
+        return response_cache.dump_models(UserActionVerificationResponse, verifications)
+
+    return await response_cache.cached_response(
+        f"user-action-verification:{validator.etag}",
+        [response_cache.TAG_USER_ACTION_VERIFICATION],
+        load,
+        validator.headers,
     )
-    return verifications
 
 
 @router.post(
@@ -351,15 +422,31 @@ async def register_unfollower_service_user(
 
 
 @router.get("/unfollowers/{owner}")
-async def get_unfollowers(owner: str, db: Annotated[AsyncSession, Depends(get_db)]):
+async def get_unfollowers(
+    owner: str,
+    request: Request,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    q: str | None = Query(
+        None, max_length=50, description="아이디/이름 접두어 검색 (대소문자 무시)"
+    ),
+    after: str | None = Query(
+        None, max_length=50, description="이전 페이지의 next_cursor"
+    ),
+    limit: int = Query(100, ge=1, le=500, description="Maximum number of results"),
+) -> Response:
     """
-    Get unfollowers for a specific owner.
+    Get one page of unfollowers for a specific owner, ordered by username.
+    Answers 304 when the client's ETag is still current.
 
     Args:
         owner: Instagram username (owner)
+        q: Optional username/fullname prefix
+        after: Cursor returned as next_cursor by the previous page
+        limit: Page size
 
     Returns:
-        List of unfollowers
+        Total count, one page of unfollowers and the cursor of the next page
+        (None on the last page)
 
     Raises:
         HTTPException: If owner not registered in unfollower service
@@ -376,23 +463,69 @@ async def get_unfollowers(owner: str, db: Annotated[AsyncSession, Depends(get_db
             detail="언팔로워 서비스에 등록되지 않은 사용자입니다.",
         )
 
-    try:
-        unfollowers = await unfollower_db.get_unfollowers_by_owner(db, owner)
+    search = q.strip() if q else None
+    # 수집 반영/사진 캐시 때마다 증가하는 버전으로 검증 (행을 읽지 않음)
+    validator = conditional.make_validator(
+        "unfollowers",
+        owner,
+        service_user.unfollowers_version,
+        service_user.unfollower_count,
+        search,
+        after,
+        limit,
+    )
+    if conditional.is_not_modified(request, validator):
+        return conditional.not_modified(validator)
 
-        return {
-            "owner": owner,
-            "count": len(unfollowers),
-            "unfollowers": [
-                {
-                    "unfollower_username": u.unfollower_username,
-                    "unfollower_fullname": u.unfollower_fullname,
-                    "unfollower_profile_url": u.unfollower_profile_url,
-                    "created_at": u.created_at.isoformat() if u.created_at else None,
-                    "updated_at": u.updated_at.isoformat() if u.updated_at else None,
-                }
-                for u in unfollowers
-            ],
-        }
+    async def load() -> bytes:
+        # 다음 페이지 존재 여부를 알기 위해 1행 더 조회
+        unfollowers = await unfollower_db.get_unfollowers_page(
+            db, owner, limit + 1, after=after, search=search
+        )
+        next_cursor = None
+        if len(unfollowers) > limit:
+            unfollowers = unfollowers[:limit]
+            next_cursor = unfollowers[-1].unfollower_username
+
+        if search or service_user.unfollower_count is None:
+            count = await unfollower_db.count_unfollowers(db, owner, search)
+        else:
+            count = service_user.unfollower_count
+
+        return response_cache.dump_json(
+            {
+                "owner": owner,
+                "count": count,
+                "next_cursor": next_cursor,
+                "unfollowers": [
+                    {
+                        "unfollower_username": u.unfollower_username,
+                        "unfollower_fullname": u.unfollower_fullname,
+                        "unfollower_profile_url": u.unfollower_profile_url,
+                        "unfollower_profile_image": (
+                            f"{get_settings().API_V1_PREFIX}/avatars/{u.profile_image_key}"
+                            if u.profile_image_key
+                            else None
+                        ),
+                        "created_at": (
+                            u.created_at.isoformat() if u.created_at else None
+                        ),
+                        "updated_at": (
+                            u.updated_at.isoformat() if u.updated_at else None
+                        ),
+                    }
+                    for u in unfollowers
+                ],
+            }
+        )
+
+    try:
+        return await response_cache.cached_response(
+            f"unfollowers:{validator.etag}",
+            [response_cache.unfollowers_tag(owner)],
+            load,
+            validator.headers,
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -400,6 +533,214 @@ async def get_unfollowers(owner: str, db: Annotated[AsyncSession, Depends(get_db
         )
 
 
+@router.get("/avatars/{key}")
+async def get_avatar(key: str) -> FileResponse:
+    """
+    Serve a cached unfollower avatar.
+
+    Keys are content hashes, so the response never changes and can be
+    cached by browsers and proxies indefinitely.
+
+    Args:
+        key: Avatar key (profile_image_key)
+
+    Returns:
+        JPEG image
+
+    Raises:
+        HTTPException: If the avatar is not cached
+    """
+    path = avatar_cache.touch_avatar(key)
+    if path is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="프로필 사진을 찾을 수 없습니다.",
+        )
+
+    return FileResponse(
+        path,
+        media_type="image/jpeg",
+        headers={
+            "Cache-Control": "public, max-age=31536000, immutable",
+            "ETag": f'"{key}"',
+        },
+    )
+
+
+async def _require_unfollower_service_user(db: AsyncSession, owner: str) -> None:
+    """
+    Ensure the owner is registered in the unfollower service.
+
+    Raises:
+        HTTPException: If owner not registered in unfollower service
+    """
+    service_user = (
+        await unfollower_service_user_db.get_unfollower_service_user_by_username(
+            db, owner
+        )
+    )
+    if not service_user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="언팔로워 서비스에 등록되지 않은 사용자입니다.",
+        )
+
+
+async def _history_entries(
+    db: AsyncSession, owner: str, entries: list
+) -> list[UnfollowerHistoryResponse]:
+    """
+    Convert history rows to responses. Open entries store no last_seen_at;
+    they were last seen by the owner's latest completed scan.
+
+    Args:
+        db: Database session
+        owner: Owner username
+        entries: UnfollowerHistory instances
+
+    Returns:
+        History responses
+    """
+    last_scan_at = None
+    if any(entry.resolved_at is None for entry in entries):
+        last_scan_at = await collection_run_db.get_last_completed_at(db, owner)
+
+    responses = []
+    for entry in entries:
+        response = UnfollowerHistoryResponse.model_validate(entry)
+        if entry.resolved_at is None:
+            response.last_seen_at = max(
+                entry.first_seen_at, last_scan_at or entry.first_seen_at
+            )
+        elif response.last_seen_at is None:
+            response.last_seen_at = entry.first_seen_at
+        responses.append(response)
+    return responses
+
+
+@router.get("/unfollowers/{owner}/new", response_model=UnfollowerHistoryListResponse)
+async def get_new_unfollowers(
+    owner: str,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    since: date = Query(..., description="이 날짜(KST) 이후 새로 언팔로우한 계정"),
+    limit: int = Query(1000, ge=1, le=5000, description="Maximum number of results"),
+) -> UnfollowerHistoryListResponse:
+    """
+    Get accounts that stopped following the owner back since a date.
+
+    Args:
+        owner: Instagram username (owner)
+        since: Start date (KST)
+        limit: Maximum number of results
+
+    Returns:
+        Newly seen unfollowers, newest first
+
+    Raises:
+        HTTPException: If owner not registered in unfollower service
+    """
+    await _require_unfollower_service_user(db, owner)
+
+    since_at = datetime.combine(since, datetime.min.time())
+    entries = await unfollower_history_db.get_new_unfollowers_since(
+        db, owner, since_at, limit
+    )
+    return UnfollowerHistoryListResponse(
+        owner=owner,
+        since=since_at,
+        count=len(entries),
+        unfollowers=await _history_entries(db, owner, entries),
+    )
+
+
+@router.get(
+    "/unfollowers/{owner}/resolved", response_model=UnfollowerHistoryListResponse
+)
+async def get_resolved_unfollowers(
+    owner: str,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    since: date = Query(..., description="이 날짜(KST) 이후 다시 맞팔로우한 계정"),
+    limit: int = Query(1000, ge=1, le=5000, description="Maximum number of results"),
+) -> UnfollowerHistoryListResponse:
+    """
+    Get former unfollowers that follow the owner back again since a date.
+
+    Args:
+        owner: Instagram username (owner)
+        since: Start date (KST)
+        limit: Maximum number of results
+
+    Returns:
+        Resolved unfollowers, most recently resolved first
+
+    Raises:
+        HTTPException: If owner not registered in unfollower service
+    """
+    await _require_unfollower_service_user(db, owner)
+
+    since_at = datetime.combine(since, datetime.min.time())
+    entries = await unfollower_history_db.get_resolved_unfollowers_since(
+        db, owner, since_at, limit
+    )
+    return UnfollowerHistoryListResponse(
+        owner=owner,
+        since=since_at,
+        count=len(entries),
+        unfollowers=await _history_entries(db, owner, entries),
+    )
+
+
+@router.get(
+    "/unfollowers/{owner}/relationships", response_model=FollowRelationshipsResponse
+)
+async def get_follow_relationships(
+    owner: str, db: Annotated[AsyncSession, Depends(get_db)]
+) -> FollowRelationshipsResponse:
+    """
+    Get both non-mutual lists of an owner from the latest follow snapshot:
+    accounts not following the owner back, and followers the owner does
+    not follow back.
+
+    Args:
+        owner: Instagram username (owner)
+
+    Returns:
+        Non-mutual relationships of the latest dual-edge scan
+
+    Raises:
+        HTTPException: If owner not registered or never scanned with both lists
+    """
+    await _require_unfollower_service_user(db, owner)
+
+    stored = await follow_snapshot_db.get_follow_snapshot(db, owner)
+    if stored is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="팔로잉/팔로워 수집 기록이 없습니다.",
+        )
+
+    analysis = snapshot.analyze(
+        snapshot.FollowSnapshot(
+            following=snapshot.decode_users(stored.following),
+            followers=snapshot.decode_users(stored.followers),
+        )
+    )
+
+    def accounts(users: list[snapshot.CompactUser]) -> list[dict]:
+        return [
+            {"username": u[0], "fullname": u[1], "profile_url": u[2]} for u in users
+        ]
+
+    return FollowRelationshipsResponse(
+        owner=owner,
+        scanned_at=stored.scanned_at,
+        following_count=stored.following_count,
+        follower_count=stored.follower_count,
+        not_following_back=accounts(analysis.not_following_back),
+        not_followed_back=accounts(analysis.not_followed_back),
+    )
+
+
 @router.delete("/unfollower-service/{username}")
 async def delete_unfollower_service_account(
     username: str, db: Annotated[AsyncSession, Depends(get_db)]
@@ -436,8 +777,14 @@ async def delete_unfollower_service_account(
 
         # Delete service user
         await unfollower_service_user_db.delete_unfollower_service_user(db, username)
+        await cache_events.publish_invalidation(
+            db, response_cache.unfollowers_tag(username)
+        )
 
         await db.commit()
+        response_cache.get_response_cache().invalidate_tags(
+            response_cache.unfollowers_tag(username)
+        )
 
         return {
             "message": f"계정이 성공적으로 삭제되었습니다. (언팔로워 {unfollowers_count}명 삭제됨)",
@@ -0,0 +1,148 @@
+"""
+Content-addressed on-disk cache of downscaled unfollower avatars.
+
+The collector stores every avatar as a small JPEG named after the SHA-256 of
+its bytes, so identical images (e.g. the default silhouette) are kept once
+and a key never changes meaning; the API can therefore serve them with
+immutable cache headers. Serving an avatar refreshes its mtime, and
+evict_to_budget() removes the least recently used files once the cache
+exceeds AVATAR_CACHE_MAX_MB. AVATAR_CACHE_DIR must be shared by the
+collector and the API.
+"""
+
+import hashlib
+import io
+import os
+import re
+from pathlib import Path
+from PIL import Image, ImageOps
+from .config import get_settings
+
+AVATAR_KEY_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+# 예산을 넘으면 여유를 두고 이 비율까지 줄여서 매 저장마다 eviction이 돌지 않게 함
+EVICTION_TARGET_RATIO = 0.9
+
+
+def avatar_path(key: str) -> Path:
+    """
+    Get the file path of an avatar key (two-level fan-out).
+
+    Args:
+        key: SHA-256 hex digest
+
+    Returns:
+        Path of the JPEG file
+
+    Raises:
+        ValueError: If the key is not a SHA-256 hex digest
+    """
+    if not AVATAR_KEY_PATTERN.match(key):
+        raise ValueError(f"Invalid avatar key: {key}")
+    return Path(get_settings().AVATAR_CACHE_DIR) / key[:2] / f"{key}.jpg"
+
+
+def downscale_avatar(data: bytes) -> bytes:
+    """
+    Downscale an image to fit AVATAR_SIZE_PX and re-encode it as JPEG.
+
+    Args:
+        data: Original image bytes
+
+    Returns:
+        JPEG bytes
+
+    Raises:
+        OSError: If the data is not a readable image
+    """
+    size = get_settings().AVATAR_SIZE_PX
+    with Image.open(io.BytesIO(data)) as image:
+        image = ImageOps.exif_transpose(image).convert("RGB")
+        image.thumbnail((size, size), Image.Resampling.LANCZOS)
+        output = io.BytesIO()
+        image.save(output, format="JPEG", quality=82, optimize=True)
+    return output.getvalue()
+
+
+def store_avatar(data: bytes) -> str:
+    """
+    Downscale and store an avatar under its content hash.
+    Storing the same image twice writes it once.
+
+    Args:
+        data: Original image bytes
+
+    Returns:
+        Avatar key (SHA-256 hex digest of the stored JPEG)
+    """
+    jpeg = downscale_avatar(data)
+    key = hashlib.sha256(jpeg).hexdigest()
+    path = avatar_path(key)
+    if path.exists():
+        os.utime(path)
+        return key
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp_path.write_bytes(jpeg)
+    os.replace(tmp_path, path)
+    return key
+
+
+def touch_avatar(key: str) -> Path | None:
+    """
+    Look up an avatar for serving and mark it as recently used.
+
+    Args:
+        key: Avatar key
+
+    Returns:
+        Path of the avatar, or None if it is not cached
+    """
+    try:
+        path = avatar_path(key)
+        os.utime(path)
+    except (ValueError, FileNotFoundError):
+        return None
+    return path
+
+
+def evict_to_budget(max_bytes: int | None = None) -> int:
+    """
+    Remove least recently used avatars until the cache fits its budget.
+
+    Args:
+        max_bytes: Budget in bytes (defaults to AVATAR_CACHE_MAX_MB)
+
+    Returns:
+        Number of removed files
+    """
+    if max_bytes is None:
+        max_bytes = get_settings().AVATAR_CACHE_MAX_MB * 1024 * 1024
+
+    root = Path(get_settings().AVATAR_CACHE_DIR)
+    if not root.exists():
+        return 0
+
+    entries = []
+    total = 0
+    for path in root.glob("*/*.jpg"):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+        total += stat.st_size
+
+    if total <= max_bytes:
+        return 0
+
+    target = max_bytes * EVICTION_TARGET_RATIO
+    removed = 0
+    for _, size, path in sorted(entries):
+        if total <= target:
+            break
+        path.unlink(missing_ok=True)
+        total -= size
+        removed += 1
+
+    return removed
@@ -0,0 +1,192 @@
+"""
+Cross-process invalidation of the response cache over Postgres LISTEN/NOTIFY.
+
+Writers (admin routes, the KakaoTalk batch, the collector) call
+publish_invalidation() inside their transaction: pg_notify is delivered
+when the transaction commits and dropped if it rolls back, so listeners
+never evict for a write that did not happen. Every API process runs an
+InvalidationListener that evicts the notified tags from its own
+core.response_cache. Notifications sent while a listener is disconnected
+are lost, so the listener clears its whole cache on every (re)connect.
+"""
+
+import asyncio
+import json
+import os
+import socket
+import uuid
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from core.config import get_settings
+from core.response_cache import ResponseCache
+
+# 자기 프로세스가 보낸 알림은 이미 로컬에서 무효화했으므로 무시
+ORIGIN = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+# 연결이 조용히 끊긴 경우를 감지하기 위한 ping 간격
+KEEPALIVE_SECONDS = 60
+MAX_RECONNECT_DELAY_SECONDS = 60
+
+
+async def publish_invalidation(db: AsyncSession, *tags: str) -> None:
+    """
+    Queue an invalidation of response cache tags in the current transaction.
+    It reaches the listeners when the caller commits.
+
+    Args:
+        db: Database session of the write
+        tags: core.response_cache tags to invalidate
+    """
+    if not tags or db.get_bind().dialect.name != "postgresql":
+        return
+
+    payload = json.dumps({"origin": ORIGIN, "tags": sorted(set(tags))})
+    await db.execute(
+        text("SELECT pg_notify(:channel, :payload)"),
+        {"channel": get_settings().CACHE_INVALIDATION_CHANNEL, "payload": payload},
+    )
+
+
+class InvalidationListener:
+    """Background task applying invalidation notifications to a cache."""
+
+    def __init__(self, engine: AsyncEngine, cache: ResponseCache, channel: str):
+        self.engine = engine
+        self.cache = cache
+        self.channel = channel
+        self.connected = False
+        self.received = 0
+        self.reconnects = 0
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        """Start listening in the background."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop listening and close the connection."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def report(self) -> dict:
+        """
+        Get the state of the listener.
+
+        Returns:
+            Dict with connection state and counters
+        """
+        return {
+            "channel": self.channel,
+            "connected": self.connected,
+            "received": self.received,
+            "reconnects": self.reconnects,
+        }
+
+    def handle(self, payload: str) -> None:
+        """
+        Apply one notification payload.
+
+        Args:
+            payload: JSON {"origin": ..., "tags": [...]}
+        """
+        try:
+            event = json.loads(payload)
+        except ValueError:
+            print(f"[cache] 잘못된 무효화 알림 무시: {payload[:200]}")
+            return
+
+        self.received += 1
+        if event.get("origin") == ORIGIN:
+            return
+        self.cache.invalidate_tags(*event.get("tags", []))
+
+    async def _connect(self):
+        """
+        Open a dedicated asyncpg connection with the engine's URL.
+        LISTEN keeps the connection for the life of the process, so it is
+        not taken from the API's small pool.
+        """
+        import asyncpg
+
+        url = self.engine.url.set(drivername="postgresql")
+        return await asyncpg.connect(url.render_as_string(hide_password=False))
+
+    async def _run(self) -> None:
+        delay = 1
+        while True:
+            connection = None
+            try:
+                connection = await self._connect()
+                closed = asyncio.Event()
+                connection.add_termination_listener(lambda _: closed.set())
+                await connection.add_listener(
+                    self.channel, lambda _c, _pid, _ch, payload: self.handle(payload)
+                )
+                # 연결이 끊긴 동안 놓친 알림이 있을 수 있음
+                self.cache.clear()
+                self.connected = True
+                delay = 1
+                print(f"[cache] 무효화 채널 구독 시작: {self.channel}")
+
+                while not closed.is_set():
+                    try:
+                        await asyncio.wait_for(closed.wait(), KEEPALIVE_SECONDS)
+                    except asyncio.TimeoutError:
+                        await asyncio.wait_for(
+                            connection.fetchval("SELECT 1"), KEEPALIVE_SECONDS
+                        )
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"[cache] 무효화 채널 연결 실패, {delay}초 후 재시도: {str(e)}")
+            finally:
+                self.connected = False
+                if connection is not None and not connection.is_closed():
+                    await connection.close()
+
+            self.reconnects += 1
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, MAX_RECONNECT_DELAY_SECONDS)
+
+
+_listener: InvalidationListener | None = None
+
+
+def get_listener() -> InvalidationListener | None:
+    """
+    Get the listener of this process, if started.
+
+    Returns:
+        InvalidationListener or None
+    """
+    return _listener
+
+
+async def start_listener(engine: AsyncEngine, cache: ResponseCache) -> None:
+    """
+    Start this process's listener (API lifespan startup).
+
+    Args:
+        engine: Engine whose database to listen on
+        cache: Response cache to evict from
+    """
+    global _listener
+    settings = get_settings()
+    if not settings.CACHE_INVALIDATION_LISTEN or engine.dialect.name != "postgresql":
+        return
+    _listener = InvalidationListener(engine, cache, settings.CACHE_INVALIDATION_CHANNEL)
+    _listener.start()
+
+
+async def stop_listener() -> None:
+    """Stop this process's listener (API lifespan shutdown)."""
+    global _listener
+    if _listener is not None:
+        await _listener.stop()
+        _listener = None
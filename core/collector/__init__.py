@@ -0,0 +1 @@
+"""Building blocks for the Playwright unfollower collector."""
@@ -0,0 +1,46 @@
+"""
+Concurrent avatar download for the collector.
+
+Avatars are fetched through the browser context's APIRequestContext, which
+keeps a pooled keep-alive connection per CDN host, and are stored with
+core.avatar_cache. Downscaling runs in a worker thread so the event loop
+keeps serving the other accounts.
+"""
+
+import asyncio
+from core import avatar_cache
+
+
+async def fetch_avatars(
+    request_context, avatars: list[tuple[str, str]], concurrency: int
+) -> dict[str, str]:
+    """
+    Download, downscale and store avatars, at most `concurrency` at a time.
+    Failed downloads are skipped and retried on the next run.
+
+    Args:
+        request_context: Playwright APIRequestContext (e.g. context.request)
+        avatars: List of (unfollower_username, profile picture URL)
+        concurrency: Maximum concurrent downloads
+
+    Returns:
+        Dict of unfollower_username -> avatar key for the stored avatars
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def fetch(username: str, url: str) -> tuple[str, str] | None:
+        async with semaphore:
+            try:
+                response = await request_context.get(url, timeout=15000)
+                if not response.ok:
+                    return None
+                body = await response.body()
+                key = await asyncio.to_thread(avatar_cache.store_avatar, body)
+            except Exception:
+                return None
+            return username, key
+
+    results = await asyncio.gather(
+        *(fetch(username, url) for username, url in avatars if url)
+    )
+    return dict(result for result in results if result is not None)
@@ -0,0 +1,185 @@
+"""
+Local checkpoints for resumable follow-graph scans.
+
+Each owner gets one append-only JSONL file per scanned connection under
+COLLECTOR_CHECKPOINT_DIR (the following list at the top level, the
+follower list under followers/).
+The first line records who is scanning; every following line is one page
+(end_cursor and the compact nodes of that page). Appending keeps the cost
+per page constant, and a line torn by a crash is cut off on load so the
+resumed scan appends after the last complete page.
+"""
+
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from core.config import get_settings
+
+# 체크포인트에 저장할 노드 필드 (나머지는 버려서 파일 크기를 줄임)
+NODE_FIELDS = ("id", "username", "full_name", "profile_pic_url")
+EDGE_FOLLOWING = "following"
+EDGE_FOLLOWERS = "followers"
+EDGES = (EDGE_FOLLOWING, EDGE_FOLLOWERS)
+
+
+@dataclass
+class ScanCheckpoint:
+    """Progress of an interrupted (or finished but unsaved) scan."""
+
+    owner: str
+    user_id: str
+    end_cursor: str | None = None
+    has_next_page: bool = True
+    count: int = 0
+    pages: int = 0
+    nodes: list[dict] = field(default_factory=list)
+
+
+def _checkpoint_path(owner: str, edge: str = EDGE_FOLLOWING) -> Path:
+    """
+    Get the checkpoint file path for an owner.
+
+    Args:
+        owner: Owner username
+        edge: Scanned connection (following or followers)
+
+    Returns:
+        Path of the checkpoint file
+    """
+    settings = get_settings()
+    directory = Path(settings.COLLECTOR_CHECKPOINT_DIR)
+    if edge != EDGE_FOLLOWING:
+        directory = directory / edge
+    return directory / f"{owner}.jsonl"
+
+
+def compact_node(node: dict) -> dict:
+    """
+    Strip a GraphQL user node down to the fields the collector uses.
+
+    Args:
+        node: GraphQL user node
+
+    Returns:
+        Compact node dict
+    """
+    return {key: node.get(key) for key in NODE_FIELDS}
+
+
+def load_checkpoint(
+    owner: str, user_id: str, edge: str = EDGE_FOLLOWING
+) -> ScanCheckpoint | None:
+    """
+    Load a fresh checkpoint for an owner.
+    Stale checkpoints, or ones written for another viewer id, are cleared.
+
+    Args:
+        owner: Owner username
+        user_id: Viewer id the cursors must belong to
+        edge: Scanned connection (following or followers)
+
+    Returns:
+        ScanCheckpoint or None if there is nothing to resume
+    """
+    path = _checkpoint_path(owner, edge)
+    if not path.exists():
+        return None
+
+    settings = get_settings()
+    max_age = settings.COLLECTOR_CHECKPOINT_MAX_AGE_HOURS * 60 * 60
+    if time.time() - path.stat().st_mtime > max_age:
+        path.unlink(missing_ok=True)
+        return None
+
+    checkpoint = None
+    # 마지막으로 완전히 기록된 줄의 끝 (바이트)
+    complete_bytes = 0
+    with open(path, "rb") as f:
+        for line in f:
+            if not line.endswith(b"\n"):
+                # 마지막 줄이 기록 도중 중단된 경우
+                break
+            try:
+                record = json.loads(line)
+            except ValueError:
+                break
+
+            if checkpoint is None:
+                if record.get("user_id") != user_id:
+                    break
+                checkpoint = ScanCheckpoint(owner=owner, user_id=user_id)
+                complete_bytes += len(line)
+                continue
+
+            checkpoint.end_cursor = record["end_cursor"]
+            checkpoint.has_next_page = record["has_next_page"]
+            checkpoint.count = record["count"]
+            checkpoint.pages += 1
+            checkpoint.nodes.extend(record["nodes"])
+            complete_bytes += len(line)
+
+    if checkpoint is None or checkpoint.pages == 0:
+        path.unlink(missing_ok=True)
+        return None
+
+    # 잘린 줄을 잘라내야 이어서 추가한 페이지가 그 뒤에 붙지 않음
+    if path.stat().st_size > complete_bytes:
+        os.truncate(path, complete_bytes)
+    return checkpoint
+
+
+def start_checkpoint(owner: str, user_id: str, edge: str = EDGE_FOLLOWING) -> None:
+    """
+    Start a new checkpoint file, replacing any previous one.
+
+    Args:
+        owner: Owner username
+        user_id: Viewer id the cursors belong to
+        edge: Scanned connection (following or followers)
+    """
+    path = _checkpoint_path(owner, edge)
+    path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(json.dumps({"owner": owner, "user_id": user_id}) + "\n")
+
+
+def append_page(
+    owner: str,
+    end_cursor: str | None,
+    has_next_page: bool,
+    count: int,
+    nodes: list[dict],
+    edge: str = EDGE_FOLLOWING,
+) -> None:
+    """
+    Append one scanned page to the owner's checkpoint.
+
+    Args:
+        owner: Owner username
+        end_cursor: Cursor to continue from after this page
+        has_next_page: Whether more pages follow
+        count: Total edge count reported by the page
+        nodes: GraphQL user nodes of this page
+        edge: Scanned connection (following or followers)
+    """
+    record = {
+        "end_cursor": end_cursor,
+        "has_next_page": has_next_page,
+        "count": count,
+        "nodes": [compact_node(node) for node in nodes],
+    }
+    with open(_checkpoint_path(owner, edge), "a", encoding="utf-8") as f:
+        f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+def clear_checkpoint(owner: str) -> None:
+    """
+    Delete the owner's checkpoints once its result has been saved.
+
+    Args:
+        owner: Owner username
+    """
+    for edge in EDGES:
+        _checkpoint_path(owner, edge).unlink(missing_ok=True)
@@ -0,0 +1,147 @@
+"""
+Helpers for Instagram's follow-graph GraphQL endpoint.
+
+The query hash and page size match the ones used by search_unfollower.js,
+so the network scan reads exactly the pages the injected UI would fetch.
+"""
+
+import json
+from dataclasses import dataclass
+from urllib.parse import urlencode
+from core.config import get_settings
+
+# 벤치마크에서는 INSTAGRAM_BASE_URL로 로컬 가짜 서버를 가리킴
+INSTAGRAM_URL = get_settings().INSTAGRAM_BASE_URL.rstrip("/")
+FOLLOWING_QUERY_HASH = "3dec7e2c57367ef3da3d987d89f9dbc8"
+FOLLOWERS_QUERY_HASH = "c76146de99bb02f6415203be841dd25a"
+PAGE_SIZE = 24
+EDGE_FOLLOW = "edge_follow"
+EDGE_FOLLOWED_BY = "edge_followed_by"
+
+RESPONSE_OK = "ok"
+RESPONSE_THROTTLED = "throttled"
+# 계정 확인(checkpoint/challenge)이 필요해 사람이 풀기 전까지 계속 실패하는 상태
+RESPONSE_CHECKPOINT = "checkpoint"
+RESPONSE_ERROR = "error"
+THROTTLE_MESSAGES = ("please wait", "feedback_required", "rate limit", "spam")
+CHECKPOINT_MESSAGES = ("checkpoint_required", "challenge_required", "login_required")
+
+
+@dataclass
+class FollowPage:
+    """One parsed page of the edge_follow connection."""
+
+    count: int
+    nodes: list[dict]
+    has_next_page: bool
+    end_cursor: str | None
+
+
+def build_following_url(
+    user_id: str, after: str | None = None, first: int = PAGE_SIZE
+) -> str:
+    """
+    Build the GraphQL URL for one page of accounts the user follows.
+
+    Args:
+        user_id: Instagram numeric user id (ds_user_id cookie)
+        after: Optional end_cursor of the previous page
+        first: Page size
+
+    Returns:
+        Absolute GraphQL query URL
+    """
+    return _build_query_url(FOLLOWING_QUERY_HASH, user_id, after, first)
+
+
+def build_followers_url(
+    user_id: str, after: str | None = None, first: int = PAGE_SIZE
+) -> str:
+    """
+    Build the GraphQL URL for one page of accounts following the user.
+
+    Args:
+        user_id: Instagram numeric user id (ds_user_id cookie)
+        after: Optional end_cursor of the previous page
+        first: Page size
+
+    Returns:
+        Absolute GraphQL query URL
+    """
+    return _build_query_url(FOLLOWERS_QUERY_HASH, user_id, after, first)
+
+
+def _build_query_url(
+    query_hash: str, user_id: str, after: str | None, first: int
+) -> str:
+    """Build a graphql/query URL for one page of a follow connection."""
+    variables = {
+        "id": user_id,
+        "include_reel": "true",
+        "fetch_mutual": "false",
+        "first": str(first),
+    }
+    if after:
+        variables["after"] = after
+
+    query = urlencode(
+        {
+            "query_hash": query_hash,
+            "variables": json.dumps(variables, separators=(",", ":")),
+        }
+    )
+    return f"{INSTAGRAM_URL}/graphql/query/?{query}"
+
+
+def parse_following_page(payload: dict, edge: str = EDGE_FOLLOW) -> FollowPage:
+    """
+    Parse a graphql/query response for a follow connection.
+
+    Args:
+        payload: Decoded JSON response body
+        edge: Connection name (edge_follow or edge_followed_by)
+
+    Returns:
+        Parsed FollowPage
+
+    Raises:
+        ValueError: If the payload does not contain the connection
+    """
+    try:
+        connection = payload["data"]["user"][edge]
+    except (KeyError, TypeError):
+        raise ValueError(f"Unexpected GraphQL response: {str(payload)[:200]}")
+
+    page_info = connection.get("page_info") or {}
+    return FollowPage(
+        count=connection.get("count", 0),
+        nodes=[item["node"] for item in connection.get("edges", [])],
+        has_next_page=bool(page_info.get("has_next_page")),
+        end_cursor=page_info.get("end_cursor"),
+    )
+
+
+def classify_response(status: int, payload: dict | None) -> str:
+    """
+    Classify a graphql/query response for the pacing controller.
+
+    Args:
+        status: HTTP status code
+        payload: Decoded JSON body, or None if it was not JSON
+
+    Returns:
+        RESPONSE_OK, RESPONSE_THROTTLED, RESPONSE_CHECKPOINT or RESPONSE_ERROR
+    """
+    message = ""
+    if isinstance(payload, dict):
+        message = str(payload.get("message") or "").lower()
+        if payload.get("checkpoint_url") or payload.get("challenge"):
+            return RESPONSE_CHECKPOINT
+
+    if any(text in message for text in CHECKPOINT_MESSAGES):
+        return RESPONSE_CHECKPOINT
+    if status == 429 or any(text in message for text in THROTTLE_MESSAGES):
+        return RESPONSE_THROTTLED
+    if 200 <= status < 300 and payload is not None:
+        return RESPONSE_OK
+    return RESPONSE_ERROR
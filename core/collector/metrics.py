@@ -0,0 +1,178 @@
+"""
+Per-user metrics and run report for the unfollower collector.
+
+Every processed owner gets a UserRunMetrics record with phase timings,
+page and retry counts and the outcome. The run writes them as JSONL (one
+line per owner plus a closing summary line) and to the collection_run table.
+"""
+
+import json
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from core.collector.routing import RequestBlockingStats
+from core.utils import get_kst_now
+
+OUTCOME_SUCCESS = "success"
+OUTCOME_LOGIN_FAILED = "login_failed"
+OUTCOME_SCAN_FAILED = "scan_failed"
+OUTCOME_DB_FAILED = "db_failed"
+OUTCOME_ERROR = "error"
+# 실행 시간 예산 안에 끝나지 않아 다음 실행으로 넘긴 계정
+OUTCOME_DEFERRED = "deferred"
+# 팔로잉/팔로워 수가 지난 전체 스캔과 같아 스캔을 생략한 계정
+OUTCOME_UNCHANGED = "unchanged"
+# 작업 큐/재시도 큐에서 완료로 처리하는 결과
+COMPLETED_OUTCOMES = {OUTCOME_SUCCESS, OUTCOME_UNCHANGED}
+
+
+@dataclass
+class UserRunMetrics:
+    """Timings, counters and outcome of one owner in one run."""
+
+    owner: str
+    outcome: str = OUTCOME_ERROR
+    started_at: datetime = field(default_factory=get_kst_now)
+    finished_at: datetime | None = None
+    phases: dict[str, float] = field(default_factory=dict)
+    pages: int = 0
+    following_count: int | None = None
+    follower_count: int | None = None
+    unfollower_count: int | None = None
+    added_count: int = 0
+    removed_count: int = 0
+    updated_count: int = 0
+    avatars_cached: int = 0
+    login_attempts: int = 0
+    scan_retries: int = 0
+    throttle_count: int = 0
+    pages_per_second: float | None = None
+    login_steps: dict[str, float] = field(default_factory=dict)
+    requests: RequestBlockingStats = field(
+        default_factory=lambda: RequestBlockingStats(mode="off")
+    )
+    error: str | None = None
+
+    @contextmanager
+    def phase(self, name: str):
+        """
+        Measure a phase (login, navigation, scan, db_write) in milliseconds.
+        Repeated phases accumulate.
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = (time.perf_counter() - started) * 1000
+            self.phases[name] = round(self.phases.get(name, 0.0) + elapsed, 1)
+
+    def finish(self, outcome: str, error: str | None = None) -> None:
+        """Mark the owner as finished with the given outcome."""
+        self.outcome = outcome
+        self.error = error
+        self.finished_at = get_kst_now()
+
+    @property
+    def total_ms(self) -> float:
+        """Wall-clock milliseconds between start and finish."""
+        if self.finished_at is None:
+            return 0.0
+        return (self.finished_at - self.started_at).total_seconds() * 1000
+
+    def to_dict(self) -> dict:
+        """JSON-serializable representation."""
+        data = asdict(self)
+        # asdict() rebuilds Counter from (key, value) pairs, so copy it as-is.
+        data["requests"] = {
+            "mode": self.requests.mode,
+            "requests": dict(self.requests.requests),
+            "bytes": self.requests.bytes,
+            "milliseconds": round(self.requests.milliseconds, 1),
+        }
+        data["started_at"] = self.started_at.isoformat()
+        data["finished_at"] = self.finished_at.isoformat() if self.finished_at else None
+        data["total_ms"] = round(self.total_ms, 1)
+        return data
+
+
+@dataclass
+class RunReport:
+    """All per-user metrics of one collector run."""
+
+    workers: int
+    run_id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    started_at: datetime = field(default_factory=get_kst_now)
+    finished_at: datetime | None = None
+    users: list[UserRunMetrics] = field(default_factory=list)
+    # Playwright 드라이버 시작(driver)과 Chromium 실행(launch)에 걸린 시간
+    startup_ms: dict[str, float] = field(default_factory=dict)
+
+    def startup_saved_s(self) -> float:
+        """
+        Estimate the startup time saved by sharing one driver and browser.
+
+        Starting a driver per user and launching the browser again on every
+        login attempt would have paid the driver cost once per user and the
+        launch cost once per attempt; this run paid each once.
+
+        Returns:
+            Estimated seconds saved
+        """
+        started = [user for user in self.users if user.outcome != OUTCOME_DEFERRED]
+        if not started:
+            return 0.0
+        launches = sum(max(1, user.login_attempts) for user in started)
+        saved_ms = self.startup_ms.get("driver", 0.0) * (len(started) - 1)
+        saved_ms += self.startup_ms.get("launch", 0.0) * (launches - 1)
+        return saved_ms / 1000
+
+    def summary(self) -> dict:
+        """Aggregate numbers for the closing report line."""
+        wall_clock = (
+            (self.finished_at - self.started_at).total_seconds()
+            if self.finished_at
+            else 0.0
+        )
+        sequential = sum(user.total_ms for user in self.users) / 1000
+        outcomes: dict[str, int] = {}
+        for user in self.users:
+            outcomes[user.outcome] = outcomes.get(user.outcome, 0) + 1
+
+        return {
+            "type": "run",
+            "run_id": self.run_id,
+            "started_at": self.started_at.isoformat(),
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "workers": self.workers,
+            "users": len(self.users),
+            "outcomes": outcomes,
+            "pages": sum(user.pages for user in self.users),
+            "wall_clock_s": round(wall_clock, 1),
+            "sequential_s": round(sequential, 1),
+            "startup_ms": {k: round(v, 1) for k, v in self.startup_ms.items()},
+            "startup_saved_s": round(self.startup_saved_s(), 1),
+        }
+
+    def write_jsonl(self, directory: Path) -> Path:
+        """
+        Write the report as JSONL.
+
+        Args:
+            directory: Directory to write the report into
+
+        Returns:
+            Path of the written report
+        """
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f"collection_run_{self.started_at:%Y%m%d_%H%M%S}.jsonl"
+
+        with open(path, "w", encoding="utf-8") as f:
+            for user in self.users:
+                record = {"type": "user", "run_id": self.run_id, **user.to_dict()}
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            f.write(json.dumps(self.summary(), ensure_ascii=False) + "\n")
+
+        return path
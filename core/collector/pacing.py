@@ -0,0 +1,146 @@
+"""
+Adaptive page pacing for the collector.
+
+Every owner's scan draws from two token buckets: one per account (shared
+by the concurrent following and follower scans of that owner) and one per
+egress IP (shared by every account this process scans, since Instagram
+also throttles by address). A page starts once both buckets have a token.
+
+Rates adapt AIMD-style: each healthy page raises them additively up to
+their ceiling, and a throttling signal (429, "Please wait" or feedback
+responses) halves them and puts both buckets into a cooldown debt, so
+every account behind the same IP pauses, not only the one that was
+throttled. Scans therefore run as fast as the responses show is safe.
+Checkpoint responses are not paced around: scan_edge aborts the scan.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from core.config import get_settings
+
+
+@dataclass
+class TokenBucket:
+    """Token bucket whose refill rate can change while it is in use."""
+
+    rate: float
+    capacity: float
+    min_rate: float
+    max_rate: float
+    tokens: float = 0.0
+    updated: float = field(default_factory=time.monotonic)
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self) -> float:
+        """
+        Take one token, going into debt if none is available.
+
+        Returns:
+            Seconds the caller has to wait before using the token
+        """
+        self._refill(time.monotonic())
+        self.tokens -= 1
+        return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    def increase(self, step: float) -> None:
+        """Raise the rate additively after a healthy response."""
+        self._refill(time.monotonic())
+        self.rate = min(self.max_rate, self.rate + step)
+
+    def decrease(self, factor: float, cooldown_s: float) -> None:
+        """
+        Cut the rate multiplicatively after a throttling signal and make
+        every following reservation wait at least cooldown_s.
+        """
+        self._refill(time.monotonic())
+        self.rate = max(self.min_rate, self.rate * factor)
+        self.tokens = min(self.tokens, -cooldown_s * self.rate)
+
+
+_egress_bucket: TokenBucket | None = None
+
+
+def get_egress_bucket() -> TokenBucket:
+    """
+    Get the bucket shared by all accounts scanned from this process's IP.
+
+    Returns:
+        TokenBucket
+    """
+    global _egress_bucket
+    if _egress_bucket is None:
+        settings = get_settings()
+        _egress_bucket = TokenBucket(
+            rate=settings.COLLECTOR_EGRESS_MAX_RATE / 2,
+            capacity=settings.COLLECTOR_PACING_BURST,
+            min_rate=settings.COLLECTOR_PACING_MIN_RATE,
+            max_rate=settings.COLLECTOR_EGRESS_MAX_RATE,
+        )
+    return _egress_bucket
+
+
+@dataclass
+class AdaptivePacer:
+    """Pacing of one account: its own bucket plus the egress bucket."""
+
+    account: TokenBucket
+    egress: TokenBucket
+    pages: int = 0
+    throttles: int = 0
+    waited_s: float = 0.0
+    started: float = field(default_factory=time.monotonic)
+
+    @classmethod
+    def for_account(cls) -> "AdaptivePacer":
+        """
+        Create the pacer of one account from the COLLECTOR_PACING_* settings.
+
+        Returns:
+            AdaptivePacer sharing this process's egress bucket
+        """
+        settings = get_settings()
+        account = TokenBucket(
+            rate=settings.COLLECTOR_PACING_START_RATE,
+            capacity=settings.COLLECTOR_PACING_BURST,
+            min_rate=settings.COLLECTOR_PACING_MIN_RATE,
+            max_rate=settings.COLLECTOR_PACING_MAX_RATE,
+        )
+        return cls(account=account, egress=get_egress_bucket())
+
+    async def wait(self) -> None:
+        """Wait until the next page of this account may be requested."""
+        delay = max(self.account.reserve(), self.egress.reserve())
+        if delay > 0:
+            self.waited_s += delay
+            await asyncio.sleep(delay)
+        self.pages += 1
+
+    def record_success(self) -> None:
+        """Speed up after a healthy page."""
+        step = get_settings().COLLECTOR_PACING_INCREASE
+        self.account.increase(step)
+        self.egress.increase(step)
+
+    def record_throttle(self) -> None:
+        """Back off the account and the whole egress IP."""
+        settings = get_settings()
+        self.throttles += 1
+        for bucket in (self.account, self.egress):
+            bucket.decrease(
+                settings.COLLECTOR_PACING_DECREASE,
+                settings.COLLECTOR_THROTTLE_COOLDOWN_SECONDS,
+            )
+
+    def achieved_rate(self) -> float:
+        """
+        Pages per second actually achieved since the pacer was created.
+
+        Returns:
+            Pages per second
+        """
+        elapsed = time.monotonic() - self.started
+        return self.pages / elapsed if elapsed > 0 else 0.0
@@ -0,0 +1,52 @@
+"""
+Cheap precheck that decides whether an owner needs a full scan.
+
+Before paging the whole following list the collector reads the
+edge_follow and edge_followed_by counts (one item per query). When both
+match the counts of the last full scan nothing can have been followed,
+unfollowed or followed back without the totals moving, except for exact
+swaps; COLLECTOR_PRECHECK_MAX_SKIP_DAYS bounds how long such a swap can
+go unnoticed by forcing a full scan once the last one is that old.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from core.config import get_settings
+
+
+@dataclass
+class FollowCounts:
+    """edge_follow and edge_followed_by counts of an owner."""
+
+    following: int
+    followers: int
+
+
+def can_skip_full_scan(
+    counts: FollowCounts,
+    stored_following: int | None,
+    stored_followers: int | None,
+    last_full_scan_at: datetime | None,
+    now: datetime,
+) -> bool:
+    """
+    Decide whether the full scan of an owner can be skipped.
+
+    Args:
+        counts: Counts read by the precheck
+        stored_following: following_count of the last full scan
+        stored_followers: follower_count of the last full scan
+        last_full_scan_at: Time of the last full scan
+        now: Current time (KST)
+
+    Returns:
+        True if the counts are unchanged and the last full scan is recent
+    """
+    if last_full_scan_at is None:
+        return False
+
+    max_skip = timedelta(days=get_settings().COLLECTOR_PRECHECK_MAX_SKIP_DAYS)
+    if now - last_full_scan_at >= max_skip:
+        return False
+
+    return counts.following == stored_following and counts.followers == stored_followers
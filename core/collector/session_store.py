@@ -0,0 +1,92 @@
+"""
+Encrypted on-disk store for per-user Playwright storage_state.
+
+Sessions are saved under INSTAGRAM_SESSION_DIR, one file per Instagram
+username, encrypted with the same Fernet key as the stored passwords.
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+from cryptography.fernet import InvalidToken
+from core.config import get_settings
+from core.crypto import decrypt_data, encrypt_data
+
+
+def _session_path(username: str) -> Path:
+    """
+    Get the session file path for a username.
+
+    Args:
+        username: Instagram username
+
+    Returns:
+        Path of the encrypted session file
+    """
+    settings = get_settings()
+    return Path(settings.INSTAGRAM_SESSION_DIR) / f"{username}.session"
+
+
+def load_session(username: str) -> dict | None:
+    """
+    Load and decrypt the stored storage_state for a user.
+    Expired or unreadable sessions are evicted.
+
+    Args:
+        username: Instagram username
+
+    Returns:
+        Playwright storage_state dict or None if no usable session exists
+    """
+    path = _session_path(username)
+    if not path.exists():
+        return None
+
+    settings = get_settings()
+    max_age = settings.INSTAGRAM_SESSION_MAX_AGE_DAYS * 24 * 60 * 60
+    if time.time() - path.stat().st_mtime > max_age:
+        evict_session(username)
+        return None
+
+    try:
+        return json.loads(decrypt_data(path.read_text(encoding="utf-8")))
+    except (InvalidToken, ValueError):
+        evict_session(username)
+        return None
+
+
+def save_session(username: str, storage_state: dict) -> None:
+    """
+    Encrypt and save the storage_state for a user.
+    The file is written atomically so a crash never leaves a partial session.
+
+    Args:
+        username: Instagram username
+        storage_state: Playwright storage_state dict (cookies, origins)
+    """
+    path = _session_path(username)
+    path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_text(encrypt_data(json.dumps(storage_state)), encoding="utf-8")
+    os.chmod(tmp_path, 0o600)
+    os.replace(tmp_path, path)
+
+
+def evict_session(username: str) -> bool:
+    """
+    Delete the stored session for a user.
+
+    Args:
+        username: Instagram username
+
+    Returns:
+        True if a session file was deleted, False if none existed
+    """
+    path = _session_path(username)
+    try:
+        path.unlink()
+        return True
+    except FileNotFoundError:
+        return False
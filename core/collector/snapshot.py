@@ -0,0 +1,113 @@
+"""
+Compact follow-graph snapshots and mutual analysis.
+
+A snapshot keeps both sides of an owner's follow graph as lists of
+[username, full_name, profile_pic_url], gzip-compressed JSON when stored.
+The non-mutual sets are computed here rather than in the browser, so the
+API can answer both "not following back" and "I don't follow back" from
+the latest snapshot without another scan.
+"""
+
+import gzip
+import json
+from dataclasses import dataclass
+
+# [username, full_name, profile_pic_url]
+CompactUser = list[str]
+
+
+@dataclass
+class FollowSnapshot:
+    """Accounts the owner follows and accounts following the owner."""
+
+    following: list[CompactUser]
+    followers: list[CompactUser]
+
+
+@dataclass
+class MutualAnalysis:
+    """Non-mutual relationships of a snapshot, in scan order."""
+
+    # 내가 팔로우하지만 나를 팔로우하지 않는 계정 (언팔로워)
+    not_following_back: list[CompactUser]
+    # 나를 팔로우하지만 내가 팔로우하지 않는 계정
+    not_followed_back: list[CompactUser]
+
+
+def compact_user(node: dict) -> CompactUser:
+    """
+    Reduce a (checkpoint-compacted) GraphQL user node to a snapshot entry.
+
+    Args:
+        node: GraphQL user node
+
+    Returns:
+        [username, full_name, profile_pic_url]
+    """
+    return [
+        node["username"],
+        node.get("full_name") or "",
+        node.get("profile_pic_url") or "",
+    ]
+
+
+def analyze(snapshot: FollowSnapshot) -> MutualAnalysis:
+    """
+    Compute both non-mutual sets of a snapshot.
+
+    Args:
+        snapshot: FollowSnapshot
+
+    Returns:
+        MutualAnalysis
+    """
+    following = {user[0] for user in snapshot.following}
+    followers = {user[0] for user in snapshot.followers}
+    return MutualAnalysis(
+        not_following_back=[u for u in snapshot.following if u[0] not in followers],
+        not_followed_back=[u for u in snapshot.followers if u[0] not in following],
+    )
+
+
+def to_unfollower(user: CompactUser) -> dict:
+    """
+    Convert a snapshot entry to the unfollower dict stored in the DB.
+
+    Args:
+        user: [username, full_name, profile_pic_url]
+
+    Returns:
+        Dict with unfollower_username, unfollower_fullname, unfollower_profile_url
+    """
+    return {
+        "unfollower_username": user[0],
+        "unfollower_fullname": user[1],
+        "unfollower_profile_url": user[2],
+    }
+
+
+def encode_users(users: list[CompactUser]) -> bytes:
+    """
+    Serialize snapshot entries for storage.
+
+    Args:
+        users: Snapshot entries
+
+    Returns:
+        gzip-compressed JSON
+    """
+    data = json.dumps(users, ensure_ascii=False, separators=(",", ":"))
+    return gzip.compress(data.encode("utf-8"))
+
+
+def decode_users(data: bytes) -> list[CompactUser]:
+    """
+    Deserialize snapshot entries written by encode_users().
+
+    Args:
+        data: gzip-compressed JSON
+
+    Returns:
+        Snapshot entries
+    """
+    return json.loads(gzip.decompress(data).decode("utf-8"))
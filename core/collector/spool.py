@@ -0,0 +1,240 @@
+"""
+Write-ahead spool of finished scans.
+
+Every scan result is written to a gzip-compressed JSONL file under
+COLLECTOR_SPOOL_DIR/pending before the database is touched: the first line
+is a header (owner, scanned_at, count), every following line one unfollower,
+and dual-edge scans end with one line per side of the follow snapshot.
+Files are written to a temporary name and renamed, so a pending file is
+always complete. The loader applies the newest pending result of an owner
+and moves all of that owner's pending files to done/, where they are kept
+for COLLECTOR_SPOOL_KEEP_DAYS. Moving a file from done/ back to pending/
+replays it on the next load.
+"""
+
+import gzip
+import json
+import os
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from core.collector.snapshot import FollowSnapshot
+from core.config import get_settings
+
+PENDING_DIR = "pending"
+DONE_DIR = "done"
+# 헤더를 읽을 수 없는 파일은 로더가 계속 실패하지 않도록 격리
+REJECTED_DIR = "rejected"
+SPOOL_SUFFIX = ".jsonl.gz"
+
+
+@dataclass
+class SpooledResult:
+    """Header of one spooled scan result."""
+
+    path: Path
+    owner: str
+    scanned_at: datetime
+    count: int
+
+
+def _spool_dir(name: str) -> Path:
+    """
+    Get a spool subdirectory.
+
+    Args:
+        name: pending, done or rejected
+
+    Returns:
+        Path of the subdirectory
+    """
+    return Path(get_settings().COLLECTOR_SPOOL_DIR) / name
+
+
+def _move(path: Path, name: str) -> Path:
+    """
+    Move a spool file into another spool subdirectory.
+
+    Args:
+        path: Spool file
+        name: Target subdirectory
+
+    Returns:
+        New path of the file
+    """
+    target_dir = _spool_dir(name)
+    target_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+    target = target_dir / path.name
+    os.replace(path, target)
+    return target
+
+
+def write_result(
+    owner: str,
+    unfollowers: list[dict],
+    scanned_at: datetime,
+    snapshot: FollowSnapshot | None = None,
+) -> SpooledResult:
+    """
+    Durably spool a scan result before it is applied to the database.
+
+    Args:
+        owner: Owner username
+        unfollowers: Unfollower dicts of the scan
+        scanned_at: Time the scan finished
+        snapshot: Follow snapshot of a dual-edge scan
+
+    Returns:
+        SpooledResult of the pending file
+    """
+    pending_dir = _spool_dir(PENDING_DIR)
+    pending_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+    path = pending_dir / f"{owner}.{scanned_at:%Y%m%dT%H%M%S%f}{SPOOL_SUFFIX}"
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+
+    header = {
+        "owner": owner,
+        "scanned_at": scanned_at.isoformat(),
+        "count": len(unfollowers),
+    }
+    with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+        f.write(json.dumps(header, ensure_ascii=False) + "\n")
+        for unfollower in unfollowers:
+            f.write(json.dumps(unfollower, ensure_ascii=False) + "\n")
+        if snapshot is not None:
+            for side in ("following", "followers"):
+                record = {"snapshot": side, "users": getattr(snapshot, side)}
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+    return SpooledResult(path, owner, scanned_at, len(unfollowers))
+
+
+def _read_header(path: Path) -> SpooledResult:
+    """
+    Read the header line of a spool file.
+
+    Args:
+        path: Spool file
+
+    Returns:
+        SpooledResult
+
+    Raises:
+        OSError, ValueError, KeyError: If the file is not a valid spool file
+    """
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        header = json.loads(f.readline())
+    return SpooledResult(
+        path=path,
+        owner=header["owner"],
+        scanned_at=datetime.fromisoformat(header["scanned_at"]),
+        count=header["count"],
+    )
+
+
+def list_pending(owner: str | None = None) -> list[SpooledResult]:
+    """
+    List pending results, oldest scan first.
+    Files whose header cannot be read are moved to rejected/.
+
+    Args:
+        owner: Only list results of this owner
+
+    Returns:
+        List of SpooledResult
+    """
+    pending_dir = _spool_dir(PENDING_DIR)
+    if not pending_dir.exists():
+        return []
+
+    pattern = f"{owner}.*{SPOOL_SUFFIX}" if owner else f"*{SPOOL_SUFFIX}"
+    results = []
+    for path in pending_dir.glob(pattern):
+        try:
+            result = _read_header(path)
+        except FileNotFoundError:
+            # 다른 로더가 방금 처리함
+            continue
+        except (OSError, ValueError, KeyError):
+            _move(path, REJECTED_DIR)
+            continue
+        if owner is None or result.owner == owner:
+            results.append(result)
+
+    return sorted(results, key=lambda result: result.scanned_at)
+
+
+def read_result(result: SpooledResult) -> tuple[list[dict], FollowSnapshot | None]:
+    """
+    Read the unfollowers and follow snapshot of a spooled result.
+
+    Args:
+        result: SpooledResult
+
+    Returns:
+        Tuple of (unfollower dicts in scan order, snapshot or None)
+    """
+    unfollowers = []
+    sides = {}
+    with gzip.open(result.path, "rt", encoding="utf-8") as f:
+        f.readline()
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if "snapshot" in record:
+                sides[record["snapshot"]] = record["users"]
+            else:
+                unfollowers.append(record)
+
+    snapshot = None
+    if "following" in sides and "followers" in sides:
+        snapshot = FollowSnapshot(sides["following"], sides["followers"])
+    return unfollowers, snapshot
+
+
+def mark_done(result: SpooledResult) -> None:
+    """
+    Move an applied (or superseded) result to done/.
+
+    Args:
+        result: SpooledResult
+    """
+    try:
+        # 보관 기간은 적용된 시점부터 계산
+        os.utime(_move(result.path, DONE_DIR))
+    except FileNotFoundError:
+        pass
+
+
+def prune_done(max_age_days: int | None = None) -> int:
+    """
+    Delete applied results older than the retention period.
+
+    Args:
+        max_age_days: Retention in days (defaults to COLLECTOR_SPOOL_KEEP_DAYS)
+
+    Returns:
+        Number of deleted files
+    """
+    if max_age_days is None:
+        max_age_days = get_settings().COLLECTOR_SPOOL_KEEP_DAYS
+
+    done_dir = _spool_dir(DONE_DIR)
+    if not done_dir.exists():
+        return 0
+
+    cutoff = time.time() - max_age_days * 24 * 60 * 60
+    removed = 0
+    for path in done_dir.glob(f"*{SPOOL_SUFFIX}"):
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+                removed += 1
+        except FileNotFoundError:
+            continue
+    return removed
@@ -0,0 +1,81 @@
+"""
+Conditional GET support (ETag / If-None-Match) for read endpoints.
+
+Endpoints compute a validator from one cheap query (a version column or a
+count/max(id) aggregate) before loading any rows, and answer 304 without
+running the real query while the client's If-None-Match still matches.
+Responses carry Cache-Control: no-cache, so browsers keep the body but
+revalidate on every page view.
+
+Last-Modified is deliberately not sent: the timestamps available here do
+not move when rows are deleted, so If-Modified-Since would answer 304 for
+data that has changed.
+"""
+
+import hashlib
+from dataclasses import dataclass
+from fastapi import Request, Response, status
+
+
+@dataclass
+class Validator:
+    """ETag of one response."""
+
+    etag: str
+
+    @property
+    def headers(self) -> dict[str, str]:
+        """Validator headers to send with 200 and 304 responses."""
+        return {"ETag": self.etag, "Cache-Control": "no-cache"}
+
+
+def make_validator(*parts) -> Validator:
+    """
+    Build a weak validator from the values that determine a response.
+
+    Args:
+        parts: Version values and request parameters (anything with a
+               stable repr)
+
+    Returns:
+        Validator
+    """
+    digest = hashlib.sha256(repr(parts).encode("utf-8")).hexdigest()[:32]
+    return Validator(etag=f'W/"{digest}"')
+
+
+def is_not_modified(request: Request, validator: Validator) -> bool:
+    """
+    Check the request's If-None-Match header against a validator.
+
+    Args:
+        request: Incoming request
+        validator: Validator of the current data
+
+    Returns:
+        True if the client's copy is still current
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is None:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+
+    # 약한 비교: W/ 접두어 무시
+    current = validator.etag.removeprefix("W/")
+    return any(
+        tag.strip().removeprefix("W/") == current for tag in if_none_match.split(",")
+    )
+
+
+def not_modified(validator: Validator) -> Response:
+    """
+    Build a 304 response carrying the validator headers.
+
+    Args:
+        validator: Validator of the current data
+
+    Returns:
+        Empty 304 response
+    """
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=validator.headers)
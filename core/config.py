@@ -29,7 +29,81 @@ class Settings(BaseSettings):
     ]
 
     # Instagram
+    INSTAGRAM_BASE_URL: str = "https://www.instagram.com"
     INSTAGRAM_SESSION_DIR: str = "/tmp/instagram_sessions"
+    INSTAGRAM_SESSION_MAX_AGE_DAYS: int = 30
+
+    # Unfollower collector
+    COLLECTOR_WORKERS: int = 3  # 하나의 Chromium 안에서 동시에 처리할 계정 수
+    # network: GraphQL 직접 조회, dom: search_unfollower.js UI 스크래핑
+    COLLECTOR_SCAN_MODE: str = "network"
+    COLLECTOR_CHECKPOINT_DIR: str = "/tmp/instagram_checkpoints"
+    COLLECTOR_CHECKPOINT_MAX_AGE_HOURS: int = 12
+    # 스캔 결과를 DB 반영 전에 먼저 기록하는 스풀 (pending/ -> done/)
+    COLLECTOR_SPOOL_DIR: str = "/tmp/instagram_spool"
+    COLLECTOR_SPOOL_KEEP_DAYS: int = 7
+    # off: 차단 안 함, observe: 차단 대상 요청의 크기/시간만 측정, block: 차단
+    COLLECTOR_REQUEST_BLOCKING: str = "block"
+    COLLECTOR_BLOCKED_RESOURCE_TYPES: list[str] = ["image", "media", "font"]
+    COLLECTOR_BLOCKED_HOSTS: list[str] = [
+        "connect.facebook.net",
+        "pixel.facebook.com",
+        "an.facebook.com",
+        "www.google-analytics.com",
+        "www.googletagmanager.com",
+    ]
+    COLLECTOR_REPORT_DIR: str = "logs"  # 상대 경로는 프로젝트 루트 기준
+    # --worker 모드: 작업 lease 유지 시간 (lease_seconds / 3 마다 갱신)
+    COLLECTOR_JOB_LEASE_SECONDS: int = 300
+    # lease가 이 횟수만큼 만료된 작업은 다시 가져가지 않고 실패 처리
+    COLLECTOR_MAX_ATTEMPTS: int = 3
+    # 실행 시간 예산 (0: 무제한), 예산 안에 끝나지 않을 계정은 다음 실행으로 미룸
+    COLLECTOR_RUN_BUDGET_MINUTES: int = 0
+    COLLECTOR_DEFAULT_SCAN_SECONDS: int = 120  # 수집 이력이 없는 계정의 예상 시간
+    COLLECTOR_SECONDS_PER_FOLLOWING: float = 0.06
+    # 팔로잉/팔로워 수가 지난 전체 스캔과 같으면 스캔 생략 (--force로 무시)
+    COLLECTOR_PRECHECK: bool = True
+    COLLECTOR_PRECHECK_MAX_SKIP_DAYS: int = 28
+    # 적응형 페이지 속도 (초당 페이지): 정상 응답마다 +INCREASE, 요청 제한 시 ×DECREASE
+    COLLECTOR_PACING_START_RATE: float = 0.8
+    COLLECTOR_PACING_MIN_RATE: float = 0.1
+    COLLECTOR_PACING_MAX_RATE: float = 2.0
+    COLLECTOR_PACING_INCREASE: float = 0.05
+    COLLECTOR_PACING_DECREASE: float = 0.5
+    COLLECTOR_PACING_BURST: int = 3
+    # 같은 IP에서 수집하는 모든 계정의 합계 상한
+    COLLECTOR_EGRESS_MAX_RATE: float = 3.0
+    COLLECTOR_THROTTLE_COOLDOWN_SECONDS: int = 30
+    # 수집기 전용 커넥션 풀 (스캔 중에는 커넥션을 잡지 않고 쓰기 때만 사용)
+    COLLECTOR_DB_POOL_SIZE: int = 2
+    COLLECTOR_DB_MAX_OVERFLOW: int = 0
+    COLLECTOR_DB_POOL_TIMEOUT_SECONDS: int = 120
+    COLLECTOR_DB_POOL_RECYCLE_SECONDS: int = 1800
+
+    # Avatar cache (수집기와 API가 같은 디렉터리를 봐야 함)
+    # 수집기와 API가 AVATAR_CACHE_DIR을 공유하는 배포에서만 켤 것
+    AVATAR_CACHE_ENABLED: bool = False
+    AVATAR_CACHE_DIR: str = "/tmp/autogram_avatars"
+    AVATAR_CACHE_MAX_MB: int = 512
+    AVATAR_SIZE_PX: int = 150
+    AVATAR_DOWNLOAD_CONCURRENCY: int = 16
+
+    # Retry queue (verification_retry_queue)
+    RETRY_MAX_ATTEMPTS: int = 5
+    RETRY_BASE_DELAY_SECONDS: int = 300  # 2^n 배로 증가, 절반은 무작위 jitter
+    RETRY_MAX_DELAY_SECONDS: int = 21600
+    RETRY_POLL_SECONDS: int = 60
+    RETRY_STALE_PROCESSING_SECONDS: int = (
+        7200  # 이 시간 넘게 processing이면 재시도 대상
+    )
+
+    # 공개 API 응답 캐시 (프로세스 메모리, 관리자 수정 시 태그로 무효화)
+    RESPONSE_CACHE_ENABLED: bool = True
+    RESPONSE_CACHE_MAX_ENTRIES: int = 512
+    RESPONSE_CACHE_TTL_SECONDS: int = 300
+    # 다른 워커/배치/수집기의 쓰기를 Postgres LISTEN/NOTIFY로 전달받아 무효화
+    CACHE_INVALIDATION_LISTEN: bool = True
+    CACHE_INVALIDATION_CHANNEL: str = "autogram_cache_invalidation"
 
     # API
     API_V1_PREFIX: str = "/api"
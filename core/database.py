@@ -47,6 +47,31 @@ def get_engine() -> AsyncEngine:
     return _engine
 
 
+def create_collector_engine() -> AsyncEngine:
+    """
+    Create the engine of the unfollower collector.
+
+    The collector runs as a separate process next to the API, so it gets
+    its own small pool (COLLECTOR_DB_*) instead of the API's settings.
+    It checks connections out only for short transactions; idle ones are
+    recycled so a multi-hour run never reuses a connection the server
+    has dropped.
+
+    Returns:
+        AsyncEngine instance (dispose it when the run ends)
+    """
+    settings = get_settings()
+    return create_async_engine(
+        settings.DATABASE_URL,
+        echo=False,
+        pool_pre_ping=True,
+        pool_size=settings.COLLECTOR_DB_POOL_SIZE,
+        max_overflow=settings.COLLECTOR_DB_MAX_OVERFLOW,
+        pool_timeout=settings.COLLECTOR_DB_POOL_TIMEOUT_SECONDS,
+        pool_recycle=settings.COLLECTOR_DB_POOL_RECYCLE_SECONDS,
+    )
+
+
 def get_session_maker() -> async_sessionmaker[AsyncSession]:
     """
     Get or create async session maker.
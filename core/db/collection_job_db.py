@@ -0,0 +1,270 @@
+"""Database access layer for the collector job queue.
+
+Any number of collector processes claim owners from collection_job with
+SELECT ... FOR UPDATE SKIP LOCKED, so two workers never pick the same row.
+A claimed job carries a lease; a worker that crashes stops renewing it and
+the job becomes claimable again once the lease expires, until it has been
+claimed max_attempts times. An owner that keeps crashing its worker is then
+marked failed instead of being reclaimed forever.
+"""
+
+from datetime import datetime, timedelta
+from sqlalchemy import and_, func, or_, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from core.collector.scheduler import ScheduledOwner
+from core.models import CollectionJob
+from core.utils import get_kst_now
+
+JOB_PENDING = "pending"
+JOB_RUNNING = "running"
+JOB_DONE = "done"
+JOB_FAILED = "failed"
+
+
+async def enqueue_collection_jobs(
+    db: AsyncSession,
+    owners: list[str],
+    schedule: dict[str, ScheduledOwner] | None = None,
+) -> int:
+    """
+    Queue owners for collection.
+    Finished jobs are reset to pending; jobs that are running are left alone.
+
+    Args:
+        db: Database session
+        owners: Owner usernames
+        schedule: Optional ranking per owner (priority and estimated seconds)
+
+    Returns:
+        Number of jobs created or reset
+    """
+    if not owners:
+        return 0
+
+    schedule = schedule or {}
+    now = get_kst_now()
+    stmt = insert(CollectionJob).values(
+        [
+            {
+                "owner": owner,
+                "status": JOB_PENDING,
+                "available_at": now,
+                "attempts": 0,
+                "priority": schedule[owner].priority if owner in schedule else 0.0,
+                "estimate_seconds": (
+                    schedule[owner].estimate_s if owner in schedule else None
+                ),
+                "created_at": now,
+                "updated_at": now,
+            }
+            for owner in owners
+        ]
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["owner"],
+        set_={
+            "status": JOB_PENDING,
+            "available_at": now,
+            "attempts": 0,
+            "priority": stmt.excluded.priority,
+            "estimate_seconds": stmt.excluded.estimate_seconds,
+            "last_error": None,
+            "updated_at": now,
+        },
+        where=CollectionJob.status != JOB_RUNNING,
+    )
+    result = await db.execute(stmt)
+    await db.flush()
+    return result.rowcount
+
+
+async def fail_exhausted_collection_jobs(
+    db: AsyncSession, max_attempts: int, now: datetime | None = None
+) -> int:
+    """
+    Mark running jobs whose lease expired after max_attempts claims as failed.
+
+    Args:
+        db: Database session
+        max_attempts: Claims allowed per job
+        now: Current time (KST), defaults to now
+
+    Returns:
+        Number of jobs failed
+    """
+    now = now or get_kst_now()
+    result = await db.execute(
+        update(CollectionJob)
+        .where(
+            CollectionJob.status == JOB_RUNNING,
+            CollectionJob.lease_expires_at < now,
+            CollectionJob.attempts >= max_attempts,
+        )
+        .values(
+            status=JOB_FAILED,
+            lease_owner=None,
+            lease_expires_at=None,
+            last_error=f"lease expired after {max_attempts} attempts",
+            updated_at=now,
+        )
+    )
+    return result.rowcount
+
+
+def _claimable(now: datetime, max_attempts: int):
+    """Pending jobs and expired leases with attempts left."""
+    return and_(
+        CollectionJob.attempts < max_attempts,
+        or_(
+            and_(
+                CollectionJob.status == JOB_PENDING,
+                CollectionJob.available_at <= now,
+            ),
+            and_(
+                CollectionJob.status == JOB_RUNNING,
+                CollectionJob.lease_expires_at < now,
+            ),
+        ),
+    )
+
+
+async def claim_collection_job(
+    db: AsyncSession,
+    worker_id: str,
+    lease_seconds: int,
+    max_attempts: int,
+    max_estimate_seconds: float | None = None,
+    default_estimate_seconds: float = 0.0,
+) -> CollectionJob | None:
+    """
+    Claim the next available job for a worker, highest priority first.
+    Pending jobs and running jobs whose lease has expired are claimable
+    while they have been claimed fewer than max_attempts times; expired
+    jobs that used up their attempts are marked failed first.
+    With max_estimate_seconds, jobs estimated to take longer are skipped,
+    so a worker with little budget left still picks up cheaper owners.
+    The caller commits to release the row lock.
+
+    Args:
+        db: Database session
+        worker_id: Unique id of the claiming worker
+        lease_seconds: Lease duration
+        max_attempts: Claims allowed per job
+        max_estimate_seconds: Remaining run budget (None for unlimited)
+        default_estimate_seconds: Estimate of jobs that have none
+
+    Returns:
+        Claimed CollectionJob or None if no job is available (or fits)
+    """
+    now = get_kst_now()
+    await fail_exhausted_collection_jobs(db, max_attempts, now)
+
+    stmt = select(CollectionJob).where(_claimable(now, max_attempts))
+    if max_estimate_seconds is not None:
+        stmt = stmt.where(
+            func.coalesce(CollectionJob.estimate_seconds, default_estimate_seconds)
+            <= max_estimate_seconds
+        )
+    result = await db.execute(
+        stmt.order_by(CollectionJob.priority.desc(), CollectionJob.available_at)
+        .limit(1)
+        .with_for_update(skip_locked=True)
+    )
+    job = result.scalar_one_or_none()
+    if job is None:
+        return None
+
+    job.status = JOB_RUNNING
+    job.lease_owner = worker_id
+    job.lease_expires_at = now + timedelta(seconds=lease_seconds)
+    job.attempts += 1
+    await db.flush()
+    return job
+
+
+async def list_claimable_collection_jobs(
+    db: AsyncSession, max_attempts: int
+) -> list[CollectionJob]:
+    """
+    List the jobs that are claimable now, in claim order, without claiming them.
+
+    Args:
+        db: Database session
+        max_attempts: Claims allowed per job
+
+    Returns:
+        List of CollectionJob instances
+    """
+    result = await db.execute(
+        select(CollectionJob)
+        .where(_claimable(get_kst_now(), max_attempts))
+        .order_by(CollectionJob.priority.desc(), CollectionJob.available_at)
+    )
+    return list(result.scalars().all())
+
+
+async def renew_collection_job_lease(
+    db: AsyncSession, owner: str, worker_id: str, lease_seconds: int
+) -> bool:
+    """
+    Extend the lease of a job still held by the worker.
+
+    Args:
+        db: Database session
+        owner: Owner username of the job
+        worker_id: Worker holding the lease
+        lease_seconds: New lease duration from now
+
+    Returns:
+        True if renewed, False if the lease was lost to another worker
+    """
+    now = get_kst_now()
+    result = await db.execute(
+        update(CollectionJob)
+        .where(
+            CollectionJob.owner == owner,
+            CollectionJob.status == JOB_RUNNING,
+            CollectionJob.lease_owner == worker_id,
+        )
+        .values(lease_expires_at=now + timedelta(seconds=lease_seconds), updated_at=now)
+    )
+    return result.rowcount > 0
+
+
+async def complete_collection_job(
+    db: AsyncSession,
+    owner: str,
+    worker_id: str,
+    success: bool,
+    error: str | None = None,
+) -> bool:
+    """
+    Mark a job held by the worker as done or failed and release its lease.
+
+    Args:
+        db: Database session
+        owner: Owner username of the job
+        worker_id: Worker holding the lease
+        success: Whether the collection succeeded
+        error: Error message for failed jobs
+
+    Returns:
+        True if updated, False if the lease was lost to another worker
+    """
+    result = await db.execute(
+        update(CollectionJob)
+        .where(
+            CollectionJob.owner == owner,
+            CollectionJob.status == JOB_RUNNING,
+            CollectionJob.lease_owner == worker_id,
+        )
+        .values(
+            status=JOB_DONE if success else JOB_FAILED,
+            lease_owner=None,
+            lease_expires_at=None,
+            last_error=error,
+            updated_at=get_kst_now(),
+        )
+    )
+    return result.rowcount > 0
@@ -0,0 +1,132 @@
+"""Database access layer for collector run metrics."""
+
+from datetime import datetime
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from core.collector.metrics import COMPLETED_OUTCOMES, OUTCOME_SUCCESS, UserRunMetrics
+from core.collector.scheduler import OwnerStats
+from core.models import CollectionRun
+
+
+def _phase_ms(metrics: UserRunMetrics, name: str) -> int | None:
+    """Get a phase duration in whole milliseconds, or None if not measured."""
+    value = metrics.phases.get(name)
+    return None if value is None else int(value)
+
+
+async def create_collection_runs(
+    db: AsyncSession, run_id: str, users: list[UserRunMetrics]
+) -> int:
+    """
+    Persist per-user metrics of a collector run.
+
+    Args:
+        db: Database session
+        run_id: Run identifier shared by all rows
+        users: Per-user metrics
+
+    Returns:
+        Number of rows created
+    """
+    for metrics in users:
+        db.add(
+            CollectionRun(
+                run_id=run_id,
+                owner=metrics.owner,
+                outcome=metrics.outcome,
+                started_at=metrics.started_at,
+                finished_at=metrics.finished_at,
+                total_ms=int(metrics.total_ms),
+                login_ms=_phase_ms(metrics, "login"),
+                navigation_ms=_phase_ms(metrics, "navigation"),
+                scan_ms=_phase_ms(metrics, "scan"),
+                db_write_ms=_phase_ms(metrics, "db_write"),
+                pages=metrics.pages,
+                following_count=metrics.following_count,
+                unfollower_count=metrics.unfollower_count,
+                added_count=metrics.added_count,
+                removed_count=metrics.removed_count,
+                login_attempts=metrics.login_attempts,
+                scan_retries=metrics.scan_retries,
+                error=metrics.error,
+            )
+        )
+
+    await db.flush()
+    return len(users)
+
+
+async def get_owner_stats(db: AsyncSession, owners: list[str]) -> dict[str, OwnerStats]:
+    """
+    Get scheduling statistics of each owner.
+
+    Freshness comes from the latest completed run (a full scan or a precheck
+    that found the counts unchanged); the duration and following count come
+    from the latest full scan, since an unchanged run only measures the
+    precheck. Owners that never completed get empty statistics.
+
+    Args:
+        db: Database session
+        owners: Owner usernames
+
+    Returns:
+        Dict of owner -> OwnerStats
+    """
+    stats = {owner: OwnerStats(owner=owner) for owner in owners}
+    if not owners:
+        return stats
+
+    result = await db.execute(
+        select(
+            CollectionRun.owner,
+            CollectionRun.total_ms,
+            CollectionRun.following_count,
+        )
+        .distinct(CollectionRun.owner)
+        .where(
+            CollectionRun.owner.in_(owners),
+            CollectionRun.outcome == OUTCOME_SUCCESS,
+        )
+        .order_by(CollectionRun.owner, CollectionRun.started_at.desc())
+    )
+    for owner, total_ms, following_count in result.all():
+        stats[owner].last_duration_s = total_ms / 1000
+        stats[owner].following_count = following_count
+
+    result = await db.execute(
+        select(CollectionRun.owner, CollectionRun.finished_at)
+        .distinct(CollectionRun.owner)
+        .where(
+            CollectionRun.owner.in_(owners),
+            CollectionRun.outcome.in_(COMPLETED_OUTCOMES),
+        )
+        .order_by(CollectionRun.owner, CollectionRun.started_at.desc())
+    )
+    for owner, finished_at in result.all():
+        stats[owner].last_success_at = finished_at
+
+    return stats
+
+
+async def get_last_completed_at(db: AsyncSession, owner: str) -> datetime | None:
+    """
+    Get when the latest completed run (success or unchanged) of an owner
+    finished, i.e. when its unfollowers were last confirmed.
+
+    Args:
+        db: Database session
+        owner: Owner username
+
+    Returns:
+        Finish time, or None if the owner never completed a run
+    """
+    result = await db.execute(
+        select(CollectionRun.finished_at)
+        .where(
+            CollectionRun.owner == owner,
+            CollectionRun.outcome.in_(COMPLETED_OUTCOMES),
+        )
+        .order_by(CollectionRun.started_at.desc())
+        .limit(1)
+    )
+    return result.scalar_one_or_none()
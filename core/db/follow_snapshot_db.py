@@ -0,0 +1,54 @@
+"""Database access layer for owner follow snapshots."""
+
+from datetime import datetime
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from core.collector.snapshot import FollowSnapshot, encode_users
+from core.models import OwnerFollowSnapshot
+
+
+async def upsert_follow_snapshot(
+    db: AsyncSession, owner: str, snapshot: FollowSnapshot, scanned_at: datetime
+) -> None:
+    """
+    Replace the stored snapshot of an owner.
+
+    Args:
+        db: Database session
+        owner: Owner username
+        snapshot: FollowSnapshot of the scan
+        scanned_at: Time of the scan
+    """
+    values = {
+        "following_count": len(snapshot.following),
+        "follower_count": len(snapshot.followers),
+        "following": encode_users(snapshot.following),
+        "followers": encode_users(snapshot.followers),
+        "scanned_at": scanned_at,
+    }
+    await db.execute(
+        insert(OwnerFollowSnapshot)
+        .values(owner=owner, **values)
+        .on_conflict_do_update(index_elements=["owner"], set_=values)
+    )
+    await db.flush()
+
+
+async def get_follow_snapshot(
+    db: AsyncSession, owner: str
+) -> OwnerFollowSnapshot | None:
+    """
+    Get the latest snapshot of an owner.
+
+    Args:
+        db: Database session
+        owner: Owner username
+
+    Returns:
+        OwnerFollowSnapshot instance or None if never scanned with both lists
+    """
+    result = await db.execute(
+        select(OwnerFollowSnapshot).where(OwnerFollowSnapshot.owner == owner)
+    )
+    return result.scalar_one_or_none()
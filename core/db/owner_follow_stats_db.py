@@ -0,0 +1,76 @@
+"""Database access layer for owner follow statistics."""
+
+from datetime import datetime
+from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from core.models import OwnerFollowStats
+
+
+async def get_owner_follow_stats(
+    db: AsyncSession, owner: str
+) -> OwnerFollowStats | None:
+    """
+    Get the follow counts recorded for an owner.
+
+    Args:
+        db: Database session
+        owner: Owner username
+
+    Returns:
+        OwnerFollowStats instance or None if never recorded
+    """
+    result = await db.execute(
+        select(OwnerFollowStats).where(OwnerFollowStats.owner == owner)
+    )
+    return result.scalar_one_or_none()
+
+
+async def record_full_scan(
+    db: AsyncSession,
+    owner: str,
+    following_count: int,
+    follower_count: int,
+    scanned_at: datetime,
+) -> None:
+    """
+    Record the follow counts a full scan was taken with.
+
+    Args:
+        db: Database session
+        owner: Owner username
+        following_count: edge_follow count
+        follower_count: edge_followed_by count
+        scanned_at: Time of the scan
+    """
+    values = {
+        "following_count": following_count,
+        "follower_count": follower_count,
+        "checked_at": scanned_at,
+        "full_scan_at": scanned_at,
+    }
+    await db.execute(
+        insert(OwnerFollowStats)
+        .values(owner=owner, **values)
+        .on_conflict_do_update(index_elements=["owner"], set_=values)
+    )
+    await db.flush()
+
+
+async def record_unchanged_check(
+    db: AsyncSession, owner: str, checked_at: datetime
+) -> None:
+    """
+    Record that the counts were checked and found unchanged.
+
+    Args:
+        db: Database session
+        owner: Owner username
+        checked_at: Time of the check
+    """
+    await db.execute(
+        update(OwnerFollowStats)
+        .where(OwnerFollowStats.owner == owner)
+        .values(checked_at=checked_at)
+    )
+    await db.flush()
@@ -0,0 +1,232 @@
+"""Database access layer for the verification_retry_queue table."""
+
+from datetime import datetime, timedelta
+from sqlalchemy import func, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from core.models import VerificationRetryQueue
+from core.utils import get_kst_now
+
+RETRY_PENDING = "pending"
+RETRY_PROCESSING = "processing"
+RETRY_COMPLETED = "completed"
+RETRY_FAILED = "failed"
+
+
+async def enqueue_retry(
+    db: AsyncSession,
+    batch_type: str,
+    shortcode: str,
+    instagram_link: str,
+    next_attempt_at: datetime,
+    link_owner_username: str | None = None,
+    error: str | None = None,
+) -> bool:
+    """
+    Add an item to the retry queue.
+    An item that is already pending or processing for the same
+    (shortcode, batch_type) is kept as-is.
+
+    Args:
+        db: Database session
+        batch_type: Batch type (verify, cleanup, collect)
+        shortcode: Post shortcode, or owner username for collect
+        instagram_link: Instagram URL of the item
+        next_attempt_at: Earliest time of the first retry
+        link_owner_username: Link owner for verify items
+        error: Error message of the failed run
+
+    Returns:
+        True if queued, False if an active item already exists
+    """
+    now = get_kst_now()
+    stmt = (
+        insert(VerificationRetryQueue)
+        .values(
+            instagram_link=instagram_link,
+            shortcode=shortcode,
+            batch_type=batch_type,
+            link_owner_username=link_owner_username,
+            retry_count=0,
+            last_error_message=error,
+            next_attempt_at=next_attempt_at,
+            status=RETRY_PENDING,
+            created_at=now,
+            updated_at=now,
+        )
+        .on_conflict_do_nothing(
+            index_elements=["shortcode", "batch_type"],
+            index_where=VerificationRetryQueue.status.in_(
+                [RETRY_PENDING, RETRY_PROCESSING]
+            ),
+        )
+    )
+    result = await db.execute(stmt)
+    await db.flush()
+    return result.rowcount > 0
+
+
+async def claim_due_retries(
+    db: AsyncSession, batch_types: list[str], limit: int
+) -> list[VerificationRetryQueue]:
+    """
+    Claim due pending items and mark them processing.
+    Rows locked by another worker are skipped. The caller commits.
+
+    Args:
+        db: Database session
+        batch_types: Batch types this worker can handle
+        limit: Maximum number of items
+
+    Returns:
+        List of claimed VerificationRetryQueue instances
+    """
+    now = get_kst_now()
+    result = await db.execute(
+        select(VerificationRetryQueue)
+        .where(
+            VerificationRetryQueue.status == RETRY_PENDING,
+            VerificationRetryQueue.batch_type.in_(batch_types),
+            VerificationRetryQueue.next_attempt_at <= now,
+        )
+        .order_by(VerificationRetryQueue.next_attempt_at)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    items = list(result.scalars().all())
+
+    for item in items:
+        item.status = RETRY_PROCESSING
+        item.last_attempt_at = now
+
+    await db.flush()
+    return items
+
+
+async def mark_retry_completed(db: AsyncSession, item_id: int) -> None:
+    """
+    Mark an item as completed.
+
+    Args:
+        db: Database session
+        item_id: Queue item id
+    """
+    await db.execute(
+        update(VerificationRetryQueue)
+        .where(VerificationRetryQueue.id == item_id)
+        .values(status=RETRY_COMPLETED, updated_at=get_kst_now())
+    )
+
+
+async def complete_pending_retries(
+    db: AsyncSession, batch_type: str, shortcodes: list[str]
+) -> int:
+    """
+    Mark pending items as completed because the work succeeded elsewhere
+    (e.g. a scheduled collection of the same owner).
+    Items a retry worker is processing are left to that worker.
+
+    Args:
+        db: Database session
+        batch_type: Batch type of the items
+        shortcodes: Post shortcodes, or owner usernames for collect
+
+    Returns:
+        Number of completed items
+    """
+    if not shortcodes:
+        return 0
+
+    result = await db.execute(
+        update(VerificationRetryQueue)
+        .where(
+            VerificationRetryQueue.status == RETRY_PENDING,
+            VerificationRetryQueue.batch_type == batch_type,
+            VerificationRetryQueue.shortcode.in_(shortcodes),
+        )
+        .values(status=RETRY_COMPLETED, updated_at=get_kst_now())
+    )
+    return result.rowcount
+
+
+async def mark_retry_failed(
+    db: AsyncSession,
+    item_id: int,
+    error: str,
+    next_attempt_at: datetime | None,
+) -> None:
+    """
+    Record a failed attempt.
+    The item goes back to pending until next_attempt_at, or to failed when
+    next_attempt_at is None (attempts exhausted).
+
+    Args:
+        db: Database session
+        item_id: Queue item id
+        error: Error message of this attempt
+        next_attempt_at: Time of the next attempt, None to give up
+    """
+    values = {
+        "retry_count": VerificationRetryQueue.retry_count + 1,
+        "last_error_message": error,
+        "updated_at": get_kst_now(),
+        "status": RETRY_FAILED if next_attempt_at is None else RETRY_PENDING,
+    }
+    if next_attempt_at is not None:
+        values["next_attempt_at"] = next_attempt_at
+
+    await db.execute(
+        update(VerificationRetryQueue)
+        .where(VerificationRetryQueue.id == item_id)
+        .values(**values)
+    )
+
+
+async def release_stale_retries(
+    db: AsyncSession, batch_types: list[str], stale_after_seconds: int
+) -> int:
+    """
+    Return items stuck in processing (worker crashed mid-attempt) to pending.
+
+    Args:
+        db: Database session
+        batch_types: Batch types to release
+        stale_after_seconds: Seconds after last_attempt_at an item counts as stuck
+
+    Returns:
+        Number of released items
+    """
+    now = get_kst_now()
+    result = await db.execute(
+        update(VerificationRetryQueue)
+        .where(
+            VerificationRetryQueue.status == RETRY_PROCESSING,
+            VerificationRetryQueue.batch_type.in_(batch_types),
+            VerificationRetryQueue.last_attempt_at
+            < now - timedelta(seconds=stale_after_seconds),
+        )
+        .values(status=RETRY_PENDING, next_attempt_at=now, updated_at=now)
+    )
+    return result.rowcount
+
+
+async def count_active_retries(db: AsyncSession, batch_types: list[str]) -> int:
+    """
+    Count items that are pending or processing.
+
+    Args:
+        db: Database session
+        batch_types: Batch types to count
+
+    Returns:
+        Number of active items
+    """
+    result = await db.execute(
+        select(func.count())
+        .select_from(VerificationRetryQueue)
+        .where(
+            VerificationRetryQueue.status.in_([RETRY_PENDING, RETRY_PROCESSING]),
+            VerificationRetryQueue.batch_type.in_(batch_types),
+        )
+    )
+    return result.scalar_one()
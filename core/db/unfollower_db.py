@@ -1,16 +1,28 @@
 """Database access layer for unfollower operations."""
 
-from sqlalchemy import select
+from sqlalchemy import delete, func, or_, select, update
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from core.models import Unfollower
+from core.utils import chunked, get_kst_now
+
+# asyncpg는 statement 하나에 최대 32,767개의 bind parameter만 허용
+MAX_BIND_PARAMS = 32767
+# 행마다 owner, username, fullname, profile_url, created_at, updated_at
+UPSERT_PARAMS_PER_ROW = 6
+UPSERT_CHUNK_SIZE = 2000
 
 
 async def upsert_unfollowers(
-    db: AsyncSession, owner: str, unfollowers: list[dict]
+    db: AsyncSession,
+    owner: str,
+    unfollowers: list[dict],
+    chunk_size: int = UPSERT_CHUNK_SIZE,
 ) -> int:
     """
     Upsert unfollowers (insert or update on conflict).
+    Rows are written in chunks so that no statement exceeds the asyncpg
+    bind parameter limit and no single statement holds the session for long.
 
     Args:
         db: Database session
@@ -19,6 +31,7 @@ async def upsert_unfollowers(
                     - unfollower_username
                     - unfollower_fullname
                     - unfollower_profile_url
+        chunk_size: Maximum rows per INSERT statement
 
     Returns:
         Number of unfollowers inserted/updated
@@ -26,26 +39,32 @@ async def upsert_unfollowers(
     if not unfollowers:
         return 0
 
+    chunk_size = max(1, min(chunk_size, MAX_BIND_PARAMS // UPSERT_PARAMS_PER_ROW))
+    now = get_kst_now()
     values = [
         {
             "owner": owner,
             "unfollower_username": u["unfollower_username"],
             "unfollower_fullname": u["unfollower_fullname"],
             "unfollower_profile_url": u["unfollower_profile_url"],
+            "created_at": now,
+            "updated_at": now,
         }
         for u in unfollowers
     ]
 
-    stmt = insert(Unfollower).values(values)
-    stmt = stmt.on_conflict_do_update(
-        index_elements=["owner", "unfollower_username"],
-        set_={
-            "unfollower_fullname": stmt.excluded.unfollower_fullname,
-            "unfollower_profile_url": stmt.excluded.unfollower_profile_url,
-        },
-    )
+    for chunk in chunked(values, chunk_size):
+        stmt = insert(Unfollower).values(chunk)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["owner", "unfollower_username"],
+            set_={
+                "unfollower_fullname": stmt.excluded.unfollower_fullname,
+                "unfollower_profile_url": stmt.excluded.unfollower_profile_url,
+                "updated_at": stmt.excluded.updated_at,
+            },
+        )
+        await db.execute(stmt)
 
-    await db.execute(stmt)
     await db.flush()
     return len(values)
 
@@ -65,6 +84,230 @@ async def get_unfollowers_by_owner(db: AsyncSession, owner: str) -> list[Unfollo
     return list(result.scalars().all())
 
 
+def _search_filter(search: str):
+    """
+    Build a case-insensitive prefix filter on username and fullname that the
+    idx_unfollowers_owner_*_prefix indexes can serve.
+
+    Args:
+        search: Prefix typed by the user
+
+    Returns:
+        SQL boolean expression
+    """
+    escaped = (
+        search.lower().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    )
+    pattern = f"{escaped}%"
+    return or_(
+        func.lower(Unfollower.unfollower_username).like(pattern, escape="\\"),
+        func.lower(Unfollower.unfollower_fullname).like(pattern, escape="\\"),
+    )
+
+
+async def get_unfollowers_page(
+    db: AsyncSession,
+    owner: str,
+    limit: int,
+    after: str | None = None,
+    search: str | None = None,
+) -> list[Unfollower]:
+    """
+    Get one page of an owner's unfollowers ordered by username (keyset).
+
+    Args:
+        db: Database session
+        owner: Owner username
+        limit: Maximum number of rows
+        after: Last unfollower_username of the previous page
+        search: Optional username/fullname prefix
+
+    Returns:
+        List of Unfollower instances
+    """
+    query = select(Unfollower).where(Unfollower.owner == owner)
+    if after:
+        query = query.where(Unfollower.unfollower_username > after)
+    if search:
+        query = query.where(_search_filter(search))
+    query = query.order_by(Unfollower.unfollower_username).limit(limit)
+
+    result = await db.execute(query)
+    return list(result.scalars().all())
+
+
+async def count_unfollowers(
+    db: AsyncSession, owner: str, search: str | None = None
+) -> int:
+    """
+    Count an owner's unfollowers.
+
+    Args:
+        db: Database session
+        owner: Owner username
+        search: Optional username/fullname prefix
+
+    Returns:
+        Number of matching unfollowers
+    """
+    query = (
+        select(func.count()).select_from(Unfollower).where(Unfollower.owner == owner)
+    )
+    if search:
+        query = query.where(_search_filter(search))
+    result = await db.execute(query)
+    return result.scalar_one()
+
+
+async def get_unfollower_snapshot(
+    db: AsyncSession, owner: str
+) -> dict[str, tuple[str, str]]:
+    """
+    Get the stored unfollower set for an owner without loading ORM objects.
+
+    Args:
+        db: Database session
+        owner: Owner username
+
+    Returns:
+        Dict of unfollower_username -> (unfollower_fullname, unfollower_profile_url)
+    """
+    result = await db.execute(
+        select(
+            Unfollower.unfollower_username,
+            Unfollower.unfollower_fullname,
+            Unfollower.unfollower_profile_url,
+        ).where(Unfollower.owner == owner)
+    )
+    return {row[0]: (row[1], row[2]) for row in result.all()}
+
+
+async def update_unfollowers(
+    db: AsyncSession,
+    owner: str,
+    unfollowers: list[dict],
+    reset_avatars: set[str] = frozenset(),
+) -> int:
+    """
+    Update fullname and profile URL of existing unfollowers.
+
+    Args:
+        db: Database session
+        owner: Owner username
+        unfollowers: List of unfollower data dicts (same keys as upsert_unfollowers)
+        reset_avatars: Usernames whose profile picture changed; their cached
+                       avatar key is cleared so the next run downloads it again
+
+    Returns:
+        Number of unfollowers updated
+    """
+    if not unfollowers:
+        return 0
+
+    now = get_kst_now()
+    rows = [
+        {
+            "owner": owner,
+            "unfollower_username": u["unfollower_username"],
+            "unfollower_fullname": u["unfollower_fullname"],
+            "unfollower_profile_url": u["unfollower_profile_url"],
+            "updated_at": now,
+        }
+        for u in unfollowers
+    ]
+    # 서명만 바뀐 URL은 같은 사진이므로 캐시 키 유지
+    kept = [row for row in rows if row["unfollower_username"] not in reset_avatars]
+    reset = [
+        {**row, "profile_image_key": None}
+        for row in rows
+        if row["unfollower_username"] in reset_avatars
+    ]
+    for batch in (kept, reset):
+        if batch:
+            await db.execute(update(Unfollower), batch)
+    await db.flush()
+    return len(unfollowers)
+
+
+async def get_unfollowers_without_avatar(
+    db: AsyncSession, owner: str
+) -> list[tuple[str, str]]:
+    """
+    Get unfollowers whose avatar is not cached yet.
+
+    Args:
+        db: Database session
+        owner: Owner username
+
+    Returns:
+        List of (unfollower_username, unfollower_profile_url)
+    """
+    result = await db.execute(
+        select(Unfollower.unfollower_username, Unfollower.unfollower_profile_url).where(
+            Unfollower.owner == owner, Unfollower.profile_image_key.is_(None)
+        )
+    )
+    return [(row[0], row[1]) for row in result.all()]
+
+
+async def set_profile_image_keys(
+    db: AsyncSession, owner: str, keys: dict[str, str]
+) -> int:
+    """
+    Store cached avatar keys of unfollowers.
+
+    Args:
+        db: Database session
+        owner: Owner username
+        keys: Dict of unfollower_username -> avatar key
+
+    Returns:
+        Number of unfollowers updated
+    """
+    if not keys:
+        return 0
+
+    await db.execute(
+        update(Unfollower),
+        [
+            {"owner": owner, "unfollower_username": username, "profile_image_key": key}
+            for username, key in keys.items()
+        ],
+    )
+    await db.flush()
+    return len(keys)
+
+
+async def delete_unfollowers_by_usernames(
+    db: AsyncSession, owner: str, usernames: list[str]
+) -> int:
+    """
+    Delete specific unfollowers of an owner.
+
+    Args:
+        db: Database session
+        owner: Owner username
+        usernames: Unfollower usernames to delete
+
+    Returns:
+        Number of deleted records
+    """
+    if not usernames:
+        return 0
+
+    deleted = 0
+    for chunk in chunked(usernames, MAX_BIND_PARAMS - 1):
+        result = await db.execute(
+            delete(Unfollower).where(
+                Unfollower.owner == owner, Unfollower.unfollower_username.in_(chunk)
+            )
+        )
+        deleted += result.rowcount
+
+    await db.flush()
+    return deleted
+
+
 async def delete_unfollowers_by_owner(db: AsyncSession, owner: str) -> int:
     """
     Delete all unfollowers for a specific owner.
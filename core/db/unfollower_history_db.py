@@ -0,0 +1,159 @@
+"""Database access layer for unfollower history operations."""
+
+from datetime import datetime
+from sqlalchemy import DateTime, func, literal, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from core.db.unfollower_db import MAX_BIND_PARAMS
+from core.models import UnfollowerHistory
+from core.utils import chunked
+
+# 행마다 owner, username, fullname, first_seen_at
+OPEN_PARAMS_PER_ROW = 4
+
+
+async def open_unfollower_history(
+    db: AsyncSession, owner: str, unfollowers: list[dict], seen_at: datetime
+) -> int:
+    """
+    Start a history entry for each newly seen unfollower.
+    Unfollowers that already have an open entry are skipped. Open entries
+    have no last_seen_at; it is the owner's latest completed scan.
+
+    Args:
+        db: Database session
+        owner: Owner username
+        unfollowers: New unfollower dicts (unfollower_username, unfollower_fullname)
+        seen_at: Time of the scan
+
+    Returns:
+        Number of entries opened
+    """
+    if not unfollowers:
+        return 0
+
+    values = [
+        {
+            "owner": owner,
+            "unfollower_username": u["unfollower_username"],
+            "unfollower_fullname": u["unfollower_fullname"],
+            "first_seen_at": seen_at,
+        }
+        for u in unfollowers
+    ]
+
+    opened = 0
+    for chunk in chunked(values, MAX_BIND_PARAMS // OPEN_PARAMS_PER_ROW):
+        result = await db.execute(
+            insert(UnfollowerHistory)
+            .values(chunk)
+            .on_conflict_do_nothing(
+                index_elements=["owner", "unfollower_username"],
+                index_where=UnfollowerHistory.resolved_at.is_(None),
+            )
+        )
+        opened += result.rowcount
+
+    await db.flush()
+    return opened
+
+
+async def resolve_unfollower_history(
+    db: AsyncSession,
+    owner: str,
+    usernames: list[str],
+    resolved_at: datetime,
+    last_seen_at: datetime | None = None,
+) -> int:
+    """
+    Close the open history entries of accounts that follow back again.
+
+    Args:
+        db: Database session
+        owner: Owner username
+        usernames: Unfollower usernames no longer in the scan
+        resolved_at: Time of the scan
+        last_seen_at: Time of the owner's previous completed scan, the last
+                      one that still saw them (None if unknown)
+
+    Returns:
+        Number of entries resolved
+    """
+    if not usernames:
+        return 0
+
+    # 이전 수집 기록이 없으면 first_seen_at (greatest는 NULL을 무시)
+    seen = func.greatest(
+        UnfollowerHistory.first_seen_at, literal(last_seen_at, DateTime)
+    )
+    resolved = 0
+    for chunk in chunked(usernames, MAX_BIND_PARAMS - 4):
+        result = await db.execute(
+            update(UnfollowerHistory)
+            .where(
+                UnfollowerHistory.owner == owner,
+                UnfollowerHistory.unfollower_username.in_(chunk),
+                UnfollowerHistory.resolved_at.is_(None),
+            )
+            .values(resolved_at=resolved_at, last_seen_at=seen)
+        )
+        resolved += result.rowcount
+
+    await db.flush()
+    return resolved
+
+
+async def get_new_unfollowers_since(
+    db: AsyncSession, owner: str, since: datetime, limit: int = 1000
+) -> list[UnfollowerHistory]:
+    """
+    Get accounts that started not following back at or after `since`.
+    Reads only the matching range of idx_unfollower_history_owner_first_seen.
+
+    Args:
+        db: Database session
+        owner: Owner username
+        since: Start of the range
+        limit: Maximum number of results
+
+    Returns:
+        List of UnfollowerHistory instances, newest first
+    """
+    result = await db.execute(
+        select(UnfollowerHistory)
+        .where(
+            UnfollowerHistory.owner == owner,
+            UnfollowerHistory.first_seen_at >= since,
+        )
+        .order_by(UnfollowerHistory.first_seen_at.desc())
+        .limit(limit)
+    )
+    return list(result.scalars().all())
+
+
+async def get_resolved_unfollowers_since(
+    db: AsyncSession, owner: str, since: datetime, limit: int = 1000
+) -> list[UnfollowerHistory]:
+    """
+    Get accounts that followed back again at or after `since`.
+    Reads only the matching range of idx_unfollower_history_owner_resolved.
+
+    Args:
+        db: Database session
+        owner: Owner username
+        since: Start of the range
+        limit: Maximum number of results
+
+    Returns:
+        List of UnfollowerHistory instances, newest first
+    """
+    result = await db.execute(
+        select(UnfollowerHistory)
+        .where(
+            UnfollowerHistory.owner == owner,
+            UnfollowerHistory.resolved_at >= since,
+        )
+        .order_by(UnfollowerHistory.resolved_at.desc())
+        .limit(limit)
+    )
+    return list(result.scalars().all())
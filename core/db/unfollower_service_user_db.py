@@ -1,6 +1,6 @@
 """Database access layer for unfollower service user operations."""
 
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from core.models import UnfollowerServiceUser
 
@@ -95,3 +95,27 @@ async def delete_unfollower_service_user(db: AsyncSession, username: str) -> boo
         await db.flush()
         return True
     return False
+
+
+async def bump_unfollowers_version(
+    db: AsyncSession, username: str, unfollower_count: int | None = None
+) -> None:
+    """
+    Record that a user's unfollower rows changed. The version is the
+    validator of the unfollower list, and the stored count lets the list
+    report its total without counting rows.
+
+    Args:
+        db: Database session
+        username: Username
+        unfollower_count: New number of rows in unfollowers (None keeps it)
+    """
+    values = {"unfollowers_version": UnfollowerServiceUser.unfollowers_version + 1}
+    if unfollower_count is not None:
+        values["unfollower_count"] = unfollower_count
+    await db.execute(
+        update(UnfollowerServiceUser)
+        .where(UnfollowerServiceUser.username == username)
+        .values(**values)
+    )
+    await db.flush()
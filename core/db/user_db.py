@@ -1,5 +1,6 @@
 """Database access layer for SNS user operations."""
 
+from datetime import datetime
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from core.models import SnsRaiseUser, RequestByWeek, UserActionVerification
@@ -171,6 +172,28 @@ async def get_requests_by_week(
     return list(result.scalars().all())
 
 
+async def get_requests_by_week_version(
+    db: AsyncSession, username: str | None = None
+) -> tuple[int, int | None, datetime | None]:
+    """
+    Get the values that change whenever the weekly requests change.
+
+    Args:
+        db: Database session
+        username: Optional username filter
+
+    Returns:
+        Tuple of (row count, max id, max created_at)
+    """
+    query = select(
+        func.count(), func.max(RequestByWeek.id), func.max(RequestByWeek.created_at)
+    )
+    if username:
+        query = query.where(RequestByWeek.username == username)
+    result = await db.execute(query)
+    return tuple(result.one())
+
+
 async def get_user_action_verifications(
     db: AsyncSession, username: str | None = None, limit: int = 100, offset: int = 0
 ) -> list[UserActionVerification]:
@@ -196,3 +219,27 @@ async def get_user_action_verifications(
     query = query.limit(limit).offset(offset)
     result = await db.execute(query)
     return list(result.scalars().all())
+
+
+async def get_user_action_verifications_version(
+    db: AsyncSession, username: str | None = None
+) -> tuple[int, int | None, datetime | None]:
+    """
+    Get the values that change whenever the verification records change.
+
+    Args:
+        db: Database session
+        username: Optional username filter
+
+    Returns:
+        Tuple of (row count, max id, max created_at)
+    """
+    query = select(
+        func.count(),
+        func.max(UserActionVerification.id),
+        func.max(UserActionVerification.created_at),
+    )
+    if username:
+        query = query.where(UserActionVerification.username == username)
+    result = await db.execute(query)
+    return tuple(result.one())
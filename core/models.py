@@ -14,6 +14,9 @@ from sqlalchemy import (
     ForeignKey,
     Index,
     Enum,
+    Float,
+    LargeBinary,
+    text,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from .database import Base
@@ -221,6 +224,16 @@ class UnfollowerServiceUser(Base):
     )
     password: Mapped[str] = mapped_column(String(150), nullable=False)
     totp_secret: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    unfollower_count: Mapped[int | None] = mapped_column(
+        Integer, nullable=True, comment="unfollowers 행 수 (수집 반영 시 갱신)"
+    )
+    unfollowers_version: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        server_default="0",
+        nullable=False,
+        comment="unfollowers가 바뀔 때마다 증가 (언팔로워 목록 ETag)",
+    )
 
     # Relationship
     sns_raise_user: Mapped["SnsRaiseUser"] = relationship("SnsRaiseUser")
@@ -242,6 +255,9 @@ class Unfollower(Base):
     )
     unfollower_fullname: Mapped[str] = mapped_column(String(255), nullable=False)
     unfollower_profile_url: Mapped[str] = mapped_column(String(512), nullable=False)
+    profile_image_key: Mapped[str | None] = mapped_column(
+        String(64), nullable=True, comment="core.avatar_cache 키 (sha256)"
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime, default=get_kst_now, nullable=False
     )
@@ -251,3 +267,227 @@ class Unfollower(Base):
 
     # Relationship
     owner_user: Mapped["SnsRaiseUser"] = relationship("SnsRaiseUser")
+
+    __table_args__ = (
+        # 아이디/이름 접두어 검색 (lower(...) LIKE 'q%')
+        Index(
+            "idx_unfollowers_owner_username_prefix",
+            "owner",
+            text("lower(unfollower_username) text_pattern_ops"),
+        ),
+        Index(
+            "idx_unfollowers_owner_fullname_prefix",
+            "owner",
+            text("lower(unfollower_fullname) text_pattern_ops"),
+        ),
+    )
+
+
+class CollectionRun(Base):
+    """언팔로워 수집 실행 기록 (사용자별)."""
+
+    __tablename__ = "collection_run"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    run_id: Mapped[str] = mapped_column(String(32), nullable=False, index=True)
+    owner: Mapped[str] = mapped_column(
+        String(50),
+        ForeignKey("sns_raise_user.username", ondelete="CASCADE"),
+        nullable=False,
+    )
+    outcome: Mapped[str] = mapped_column(
+        String(20), nullable=False, comment="success, login_failed, scan_failed, ..."
+    )
+    started_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    total_ms: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    login_ms: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    navigation_ms: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    scan_ms: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    db_write_ms: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    pages: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    following_count: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    unfollower_count: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    added_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    removed_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    login_attempts: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    scan_retries: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    __table_args__ = (Index("idx_collection_run_owner_started", "owner", "started_at"),)
+
+
+class CollectionJob(Base):
+    """언팔로워 수집 작업 큐 (owner당 1건, 워커가 lease로 점유)."""
+
+    __tablename__ = "collection_job"
+
+    owner: Mapped[str] = mapped_column(
+        String(50),
+        ForeignKey("sns_raise_user.username", ondelete="CASCADE"),
+        primary_key=True,
+        nullable=False,
+    )
+    status: Mapped[str] = mapped_column(
+        String(20),
+        default="pending",
+        nullable=False,
+        comment="pending, running, done, failed",
+    )
+    available_at: Mapped[datetime] = mapped_column(
+        DateTime, default=get_kst_now, nullable=False
+    )
+    lease_owner: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    lease_expires_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    attempts: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    priority: Mapped[float] = mapped_column(
+        Float,
+        default=0.0,
+        server_default="0",
+        nullable=False,
+        comment="높을수록 먼저 점유 (데이터 경과 시간 / 예상 수집 시간)",
+    )
+    estimate_seconds: Mapped[float | None] = mapped_column(Float, nullable=True)
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=get_kst_now, nullable=False
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=get_kst_now, onupdate=get_kst_now, nullable=False
+    )
+
+    __table_args__ = (
+        Index("idx_collection_job_status_available", "status", "available_at"),
+    )
+
+
+class VerificationRetryQueue(Base):
+    """실패한 배치 작업 재시도 큐 (verify, cleanup, collect)."""
+
+    __tablename__ = "verification_retry_queue"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    instagram_link: Mapped[str] = mapped_column(String(500), nullable=False, index=True)
+    shortcode: Mapped[str] = mapped_column(
+        String(50),
+        nullable=False,
+        index=True,
+        comment="collect 배치의 경우 owner username",
+    )
+    batch_type: Mapped[str] = mapped_column(
+        String(20), nullable=False, comment="verify, cleanup 또는 collect"
+    )
+    link_owner_username: Mapped[str | None] = mapped_column(
+        String(50), nullable=True, comment="verify 배치의 경우 링크 소유자"
+    )
+    retry_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    last_error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
+    last_attempt_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    next_attempt_at: Mapped[datetime] = mapped_column(
+        DateTime, default=get_kst_now, nullable=False
+    )
+    status: Mapped[str] = mapped_column(
+        String(20),
+        default="pending",
+        nullable=False,
+        index=True,
+        comment="pending, processing, completed, failed",
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=get_kst_now, nullable=False
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=get_kst_now, onupdate=get_kst_now, nullable=False
+    )
+
+    __table_args__ = (
+        Index("idx_verification_retry_queue_shortcode", "shortcode"),
+        Index("idx_verification_retry_queue_status_batch", "status", "batch_type"),
+        Index(
+            "idx_verification_retry_queue_status_next_attempt",
+            "status",
+            "next_attempt_at",
+        ),
+        # shortcode + batch_type은 pending/processing 상태에서만 유니크
+        Index(
+            "idx_unique_pending_shortcode_batch",
+            "shortcode",
+            "batch_type",
+            unique=True,
+            postgresql_where=text("status IN ('pending', 'processing')"),
+        ),
+    )
+
+
+class UnfollowerHistory(Base):
+    """언팔로워 이력 (언팔로우 구간마다 1행, 다시 맞팔하면 resolved_at 기록)."""
+
+    __tablename__ = "unfollower_history"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    owner: Mapped[str] = mapped_column(
+        String(50),
+        ForeignKey("sns_raise_user.username", ondelete="CASCADE"),
+        nullable=False,
+    )
+    unfollower_username: Mapped[str] = mapped_column(String(50), nullable=False)
+    unfollower_fullname: Mapped[str] = mapped_column(String(255), nullable=False)
+    first_seen_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    last_seen_at: Mapped[datetime | None] = mapped_column(
+        DateTime,
+        nullable=True,
+        comment="종료된 구간만 기록 (진행 중이면 소유자의 마지막 수집 시각)",
+    )
+    resolved_at: Mapped[datetime | None] = mapped_column(
+        DateTime, nullable=True, comment="다시 맞팔로우가 확인된 시각"
+    )
+
+    __table_args__ = (
+        # 진행 중인 구간은 (owner, unfollower_username)당 하나
+        Index(
+            "idx_unfollower_history_open",
+            "owner",
+            "unfollower_username",
+            unique=True,
+            postgresql_where=text("resolved_at IS NULL"),
+        ),
+        Index("idx_unfollower_history_owner_first_seen", "owner", "first_seen_at"),
+        Index("idx_unfollower_history_owner_resolved", "owner", "resolved_at"),
+    )
+
+
+class OwnerFollowStats(Base):
+    """소유자별 팔로잉/팔로워 수 (전체 스캔 생략 여부 판단용)."""
+
+    __tablename__ = "owner_follow_stats"
+
+    owner: Mapped[str] = mapped_column(
+        String(50),
+        ForeignKey("sns_raise_user.username", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    following_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    follower_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    checked_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, comment="마지막으로 수를 확인한 시각"
+    )
+    full_scan_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, comment="이 수로 전체 스캔을 마친 시각"
+    )
+
+
+class OwnerFollowSnapshot(Base):
+    """소유자별 최신 팔로잉/팔로워 목록 (core.collector.snapshot 형식, gzip JSON)."""
+
+    __tablename__ = "owner_follow_snapshot"
+
+    owner: Mapped[str] = mapped_column(
+        String(50),
+        ForeignKey("sns_raise_user.username", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    following_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    follower_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    following: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    followers: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    scanned_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
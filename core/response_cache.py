@@ -0,0 +1,307 @@
+"""
+In-process cache of serialized public responses.
+
+Entries hold the final JSON bytes of a response, so a hit skips both the
+query and serialization. Entries expire after RESPONSE_CACHE_TTL_SECONDS,
+the least recently used ones are evicted beyond RESPONSE_CACHE_MAX_ENTRIES,
+and every entry carries tags (e.g. "announcements", "unfollowers:<owner>")
+that writers invalidate after they commit.
+
+Concurrent misses of the same key share one load (a cancelled loader hands
+over to the next waiter instead of failing it), and a load that overlaps
+an invalidation of one of its tags is returned but not stored, so a reader
+that started before a write cannot put the old data back.
+"""
+
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter
+from core.config import get_settings
+
+TAG_ANNOUNCEMENTS = "announcements"
+TAG_REQUEST_BY_WEEK = "request_by_week"
+TAG_USER_ACTION_VERIFICATION = "user_action_verification"
+
+
+def unfollowers_tag(owner: str) -> str:
+    """
+    Get the tag of an owner's unfollower responses.
+
+    Args:
+        owner: Owner username
+
+    Returns:
+        Tag name
+    """
+    return f"unfollowers:{owner}"
+
+
+@dataclass
+class CacheStats:
+    """Counters since the process started."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+
+
+@dataclass
+class _Entry:
+    body: bytes
+    tags: frozenset[str]
+    expires_at: float
+
+
+@dataclass
+class ResponseCache:
+    """TTL + LRU cache of response bodies with tag invalidation."""
+
+    max_entries: int
+    ttl_seconds: float
+    stats: CacheStats = field(default_factory=CacheStats)
+    _entries: OrderedDict[str, _Entry] = field(default_factory=OrderedDict)
+    _inflight: dict[str, asyncio.Future] = field(default_factory=dict)
+    # 태그별 무효화 횟수 (로드 중에 무효화되었는지 확인용)
+    _tag_versions: dict[str, int] = field(default_factory=dict)
+    _clears: int = 0
+
+    def get(self, key: str) -> bytes | None:
+        """
+        Get a fresh entry and mark it recently used.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached body or None
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.monotonic():
+            del self._entries[key]
+            self.stats.expirations += 1
+            return None
+        self._entries.move_to_end(key)
+        return entry.body
+
+    def set(self, key: str, body: bytes, tags: Iterable[str] = ()) -> None:
+        """
+        Store a body, evicting the least recently used entries beyond max_entries.
+
+        Args:
+            key: Cache key
+            body: Serialized response
+            tags: Tags to invalidate the entry by
+        """
+        self._entries[key] = _Entry(
+            body=body,
+            tags=frozenset(tags),
+            expires_at=time.monotonic() + self.ttl_seconds,
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    async def get_or_load(
+        self,
+        key: str,
+        tags: Iterable[str],
+        loader: Callable[[], Awaitable[bytes]],
+    ) -> tuple[bytes, bool]:
+        """
+        Get a cached body or load it once for all concurrent callers.
+
+        Each caller passes a loader bound to its own request. Waiters never
+        inherit the cancellation of the caller that is loading: if it is
+        cancelled (e.g. its client disconnected), the next waiter loads
+        with its own loader.
+
+        Args:
+            key: Cache key
+            tags: Tags of the entry
+            loader: Coroutine function producing the serialized body
+
+        Returns:
+            Tuple of (body, whether it was a cache hit)
+        """
+        body = self.get(key)
+        if body is not None:
+            self.stats.hits += 1
+            return body, True
+
+        self.stats.misses += 1
+        tags = frozenset(tags)
+        while True:
+            inflight = self._inflight.get(key)
+            if inflight is None:
+                return await self._load(key, tags, loader), False
+
+            # 대기자 자신이 취소되어도 진행 중인 로드는 취소하지 않음
+            await asyncio.wait([inflight])
+            if not inflight.cancelled():
+                return inflight.result(), False
+
+    async def _load(
+        self,
+        key: str,
+        tags: frozenset[str],
+        loader: Callable[[], Awaitable[bytes]],
+    ) -> bytes:
+        """Run a loader as the single in-flight load of a key."""
+        versions = self._versions(tags)
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            body = await loader()
+        except asyncio.CancelledError:
+            # 취소는 이 호출자에게만 전파, 대기자는 다시 로드
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # 대기자가 없으면 "exception was never retrieved" 경고 방지
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+        future.set_result(body)
+        if self._versions(tags) == versions:
+            self.set(key, body, tags)
+        return body
+
+    def _versions(self, tags: frozenset[str]) -> tuple:
+        """Invalidation counters a load of these tags must not overlap."""
+        return (self._clears, *(self._tag_versions.get(tag, 0) for tag in sorted(tags)))
+
+    def invalidate_tags(self, *tags: str) -> int:
+        """
+        Drop every entry carrying one of the tags.
+
+        Args:
+            tags: Tags to invalidate
+
+        Returns:
+            Number of dropped entries
+        """
+        for tag in tags:
+            self._tag_versions[tag] = self._tag_versions.get(tag, 0) + 1
+
+        targets = set(tags)
+        keys = [key for key, entry in self._entries.items() if entry.tags & targets]
+        for key in keys:
+            del self._entries[key]
+        self.stats.invalidations += len(keys)
+        return len(keys)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self.stats.invalidations += len(self._entries)
+        self._entries.clear()
+        self._clears += 1
+
+    def report(self) -> dict:
+        """
+        Get the statistics of the cache.
+
+        Returns:
+            Dict with counters, hit ratio and current size
+        """
+        lookups = self.stats.hits + self.stats.misses
+        return {
+            **asdict(self.stats),
+            "hit_ratio": round(self.stats.hits / lookups, 3) if lookups else None,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+        }
+
+
+@lru_cache
+def get_response_cache() -> ResponseCache:
+    """
+    Get the response cache of this process.
+
+    Returns:
+        ResponseCache configured from RESPONSE_CACHE_* settings
+    """
+    settings = get_settings()
+    return ResponseCache(
+        max_entries=settings.RESPONSE_CACHE_MAX_ENTRIES,
+        ttl_seconds=settings.RESPONSE_CACHE_TTL_SECONDS,
+    )
+
+
+def dump_json(payload) -> bytes:
+    """
+    Serialize a JSON-compatible payload the way FastAPI's JSONResponse does.
+
+    Args:
+        payload: Dicts, lists and scalars
+
+    Returns:
+        UTF-8 JSON
+    """
+    return json.dumps(
+        payload, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+@lru_cache
+def _list_adapter(schema: type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(list[schema])
+
+
+def dump_models(schema: type[BaseModel], rows: list) -> bytes:
+    """
+    Serialize ORM rows through a response schema, as response_model would.
+
+    Args:
+        schema: Pydantic response model with from_attributes
+        rows: ORM instances
+
+    Returns:
+        UTF-8 JSON of the list
+    """
+    adapter = _list_adapter(schema)
+    return adapter.dump_json(adapter.validate_python(rows, from_attributes=True))
+
+
+async def cached_response(
+    key: str,
+    tags: Iterable[str],
+    loader: Callable[[], Awaitable[bytes]],
+    headers: dict[str, str] | None = None,
+) -> Response:
+    """
+    Serve a JSON body from the response cache, loading it on a miss.
+
+    Args:
+        key: Cache key (include every parameter the body depends on)
+        tags: Tags of the entry
+        loader: Coroutine function producing the serialized body
+        headers: Extra response headers (e.g. validators)
+
+    Returns:
+        JSON response with an X-Cache: HIT/MISS header
+    """
+    if get_settings().RESPONSE_CACHE_ENABLED:
+        body, hit = await get_response_cache().get_or_load(key, tags, loader)
+    else:
+        body, hit = await loader(), False
+
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={**(headers or {}), "X-Cache": "HIT" if hit else "MISS"},
+    )
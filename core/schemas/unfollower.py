@@ -0,0 +1,45 @@
+"""Pydantic schemas for unfollower operations."""
+
+from datetime import datetime
+from pydantic import BaseModel, ConfigDict
+
+
+class UnfollowerHistoryResponse(BaseModel):
+    """One period during which an account did not follow the owner back."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    unfollower_username: str
+    unfollower_fullname: str
+    first_seen_at: datetime
+    # 진행 중인 구간은 소유자의 마지막 수집 시각
+    last_seen_at: datetime | None
+    resolved_at: datetime | None
+
+
+class UnfollowerHistoryListResponse(BaseModel):
+    """Unfollower history entries of an owner since a date."""
+
+    owner: str
+    since: datetime
+    count: int
+    unfollowers: list[UnfollowerHistoryResponse]
+
+
+class FollowAccountResponse(BaseModel):
+    """One account of a follow snapshot."""
+
+    username: str
+    fullname: str
+    profile_url: str
+
+
+class FollowRelationshipsResponse(BaseModel):
+    """Non-mutual relationships of an owner from the latest dual-edge scan."""
+
+    owner: str
+    scanned_at: datetime
+    following_count: int
+    follower_count: int
+    not_following_back: list[FollowAccountResponse]
+    not_followed_back: list[FollowAccountResponse]
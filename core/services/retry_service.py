@@ -0,0 +1,151 @@
+"""Business logic for retrying failed batch work through verification_retry_queue.
+
+Each batch type (collect, verify, cleanup) registers an async handler that
+re-runs one queue item and raises on failure. Failed attempts are
+rescheduled with jittered exponential backoff until RETRY_MAX_ATTEMPTS.
+"""
+
+import random
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import timedelta
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from core.config import get_settings
+from core.db import retry_queue_db
+from core.models import VerificationRetryQueue
+from core.utils import get_kst_now
+
+RetryHandler = Callable[[VerificationRetryQueue], Awaitable[None]]
+
+_handlers: dict[str, RetryHandler] = {}
+
+
+@dataclass
+class RetryBatchResult:
+    """Outcome counts of one pass over due retry items."""
+
+    claimed: int = 0
+    completed: int = 0
+    rescheduled: int = 0
+    failed: int = 0
+
+
+def register_retry_handler(batch_type: str, handler: RetryHandler) -> None:
+    """
+    Register the handler that re-runs items of a batch type.
+
+    Args:
+        batch_type: Batch type (verify, cleanup, collect)
+        handler: Async callable taking the queue item, raising on failure
+    """
+    _handlers[batch_type] = handler
+
+
+def backoff_seconds(retry_count: int, rng: random.Random | None = None) -> float:
+    """
+    Delay before the next attempt using "equal jitter" exponential backoff:
+    half of the capped exponential delay is fixed, the other half random,
+    so retries spread out without ever firing immediately.
+
+    Args:
+        retry_count: Number of attempts already made
+        rng: Random source (for tests)
+
+    Returns:
+        Delay in seconds
+    """
+    settings = get_settings()
+    ceiling = min(
+        settings.RETRY_MAX_DELAY_SECONDS,
+        settings.RETRY_BASE_DELAY_SECONDS * (2**retry_count),
+    )
+    return ceiling / 2 + (rng or random).uniform(0, ceiling / 2)
+
+
+async def schedule_retry(
+    db: AsyncSession,
+    batch_type: str,
+    shortcode: str,
+    instagram_link: str,
+    error: str | None = None,
+    link_owner_username: str | None = None,
+) -> bool:
+    """
+    Queue a failed item for its first retry.
+
+    Args:
+        db: Database session
+        batch_type: Batch type (verify, cleanup, collect)
+        shortcode: Post shortcode, or owner username for collect
+        instagram_link: Instagram URL of the item
+        error: Error message of the failed run
+        link_owner_username: Link owner for verify items
+
+    Returns:
+        True if queued, False if the item is already queued
+    """
+    return await retry_queue_db.enqueue_retry(
+        db,
+        batch_type,
+        shortcode,
+        instagram_link,
+        get_kst_now() + timedelta(seconds=backoff_seconds(0)),
+        link_owner_username=link_owner_username,
+        error=error,
+    )
+
+
+async def process_due_retries(
+    session_maker: async_sessionmaker[AsyncSession], limit: int = 10
+) -> RetryBatchResult:
+    """
+    Claim due items of every registered batch type and run their handlers.
+
+    Items are claimed and recorded in short transactions so that no row
+    lock is held while a handler runs.
+
+    Args:
+        session_maker: Session maker
+        limit: Maximum number of items claimed in this pass
+
+    Returns:
+        RetryBatchResult
+    """
+    settings = get_settings()
+    batch_types = list(_handlers)
+    result = RetryBatchResult()
+    if not batch_types:
+        return result
+
+    async with session_maker() as db:
+        items = await retry_queue_db.claim_due_retries(db, batch_types, limit)
+        await db.commit()
+    result.claimed = len(items)
+
+    for item in items:
+        try:
+            await _handlers[item.batch_type](item)
+        except Exception as e:
+            attempts = item.retry_count + 1
+            next_attempt_at = None
+            if attempts < settings.RETRY_MAX_ATTEMPTS:
+                next_attempt_at = get_kst_now() + timedelta(
+                    seconds=backoff_seconds(attempts)
+                )
+                result.rescheduled += 1
+            else:
+                result.failed += 1
+
+            async with session_maker() as db:
+                await retry_queue_db.mark_retry_failed(
+                    db, item.id, str(e), next_attempt_at
+                )
+                await db.commit()
+            continue
+
+        async with session_maker() as db:
+            await retry_queue_db.mark_retry_completed(db, item.id)
+            await db.commit()
+        result.completed += 1
+
+    return result
@@ -0,0 +1,126 @@
+"""Business logic for keeping stored unfollowers in sync with scans."""
+
+from dataclasses import dataclass, field
+from urllib.parse import urlsplit
+from sqlalchemy.ext.asyncio import AsyncSession
+from core.db import (
+    collection_run_db,
+    unfollower_db,
+    unfollower_history_db,
+    unfollower_service_user_db,
+)
+from core.utils import get_kst_now
+
+
+@dataclass
+class UnfollowerDiff:
+    """Difference between the stored unfollower set and a new scan."""
+
+    added: list[dict] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    updated: list[dict] = field(default_factory=list)
+    # updated 중 프로필 사진 자체가 바뀐 사용자 (캐시된 사진을 다시 내려받음)
+    avatar_changed: set[str] = field(default_factory=set)
+    unchanged: int = 0
+
+    @property
+    def is_empty(self) -> bool:
+        """Whether applying the diff would change nothing."""
+        return not (self.added or self.removed or self.updated)
+
+
+def profile_picture_asset(url: str) -> str:
+    """
+    Get the part of a profile picture URL that identifies the image.
+    Instagram CDN URLs are signed and their query string changes on every
+    fetch, while the path only changes with the picture.
+
+    Args:
+        url: Profile picture URL
+
+    Returns:
+        URL without query string and fragment
+    """
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}{parts.path}"
+
+
+def compute_unfollower_diff(
+    existing: dict[str, tuple[str, str]], scanned: list[dict]
+) -> UnfollowerDiff:
+    """
+    Compare a new scan against the stored unfollower set.
+
+    Args:
+        existing: Stored set as returned by unfollower_db.get_unfollower_snapshot
+        scanned: Unfollower dicts from the latest scan
+
+    Returns:
+        UnfollowerDiff with rows to insert, delete and update
+    """
+    # 같은 사용자가 여러 번 수집된 경우 마지막 값을 사용
+    latest = {u["unfollower_username"]: u for u in scanned}
+
+    diff = UnfollowerDiff()
+    for username, unfollower in latest.items():
+        stored = existing.get(username)
+        if stored is None:
+            diff.added.append(unfollower)
+        elif stored != (
+            unfollower["unfollower_fullname"],
+            unfollower["unfollower_profile_url"],
+        ):
+            diff.updated.append(unfollower)
+            if profile_picture_asset(stored[1]) != profile_picture_asset(
+                unfollower["unfollower_profile_url"]
+            ):
+                diff.avatar_changed.add(username)
+        else:
+            diff.unchanged += 1
+
+    diff.removed = [username for username in existing if username not in latest]
+    return diff
+
+
+async def sync_unfollowers(
+    db: AsyncSession, owner: str, scanned: list[dict]
+) -> UnfollowerDiff:
+    """
+    Apply a scan to the unfollowers table by writing only what changed.
+    Unchanged rows keep their created_at/updated_at. The same diff opens and
+    resolves unfollower_history entries, leaving unchanged entries untouched,
+    and bumps the owner's unfollowers_version and unfollower_count. The
+    caller commits, so the whole diff is applied in one transaction.
+
+    Args:
+        db: Database session
+        owner: Owner username
+        scanned: Unfollower dicts from the latest scan
+
+    Returns:
+        Applied UnfollowerDiff
+    """
+    existing = await unfollower_db.get_unfollower_snapshot(db, owner)
+    diff = compute_unfollower_diff(existing, scanned)
+
+    await unfollower_db.upsert_unfollowers(db, owner, diff.added)
+    await unfollower_db.delete_unfollowers_by_usernames(db, owner, diff.removed)
+    await unfollower_db.update_unfollowers(db, owner, diff.updated, diff.avatar_changed)
+    if not diff.is_empty:
+        await unfollower_service_user_db.bump_unfollowers_version(
+            db, owner, len(existing) + len(diff.added) - len(diff.removed)
+        )
+
+    # 이력은 바뀐 행만 기록 (진행 중인 구간의 last_seen_at은 마지막 수집 시각)
+    seen_at = get_kst_now()
+    if diff.removed:
+        await unfollower_history_db.resolve_unfollower_history(
+            db,
+            owner,
+            diff.removed,
+            seen_at,
+            await collection_run_db.get_last_completed_at(db, owner),
+        )
+    await unfollower_history_db.open_unfollower_history(db, owner, diff.added, seen_at)
+
+    return diff
@@ -20,3 +20,18 @@ def get_kst_now() -> datetime:
         timezone-naive KST datetime 객체
     """
     return datetime.now(KST).replace(tzinfo=None)
+
+
+def chunked(items: list, size: int):
+    """
+    Yield consecutive slices of at most size items.
+
+    Args:
+        items: List to split
+        size: Maximum slice length
+
+    Yields:
+        Slices of items
+    """
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
@@ -200,8 +200,18 @@ export const getErrorMessage = (error: unknown): string => {
 };
 
 // Unfollowers API
-export const getUnfollowers = async (owner: string) => {
-  const response = await fetch(`${API_BASE_URL}/api/unfollowers/${owner}`);
+export const getUnfollowers = async (
+  owner: string,
+  options: { q?: string; after?: string | null; limit?: number } = {}
+) => {
+  const params = new URLSearchParams();
+  if (options.q) params.set('q', options.q);
+  if (options.after) params.set('after', options.after);
+  if (options.limit) params.set('limit', String(options.limit));
+  const query = params.toString();
+  const response = await fetch(
+    `${API_BASE_URL}/api/unfollowers/${owner}${query ? `?${query}` : ''}`
+  );
   if (!response.ok) {
     const error = await response.json();
     throw new Error(error.detail || 'Failed to fetch unfollowers');
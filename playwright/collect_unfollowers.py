@@ -2,18 +2,46 @@
 Playwright script to collect unfollowers from Instagram.
 
 This script:
-1. Fetches all users from unfollower_service_user table
-2. Logs into Instagram using Playwright
+1. Fetches all users from unfollower_service_user table and orders them by
+   data age and expected scan time, deferring owners beyond the run budget
+2. Logs into Instagram using Playwright (one shared Chromium, one isolated
+   BrowserContext per account, COLLECTOR_WORKERS accounts at a time)
 3. Handles 2FA with TOTP if needed
-4. Executes search_unfollower.js script
-5. Clicks the search button
-6. Collects unfollower data
-7. Saves to unfollowers table
+4. Collects unfollower data, either by paging the graphql/query endpoint
+   (COLLECTOR_SCAN_MODE=network) or by executing search_unfollower.js,
+   clicking the search button and reading the rendered list (dom)
+5. Spools the result to COLLECTOR_SPOOL_DIR, then saves only the
+   difference to the unfollowers table
+
+Usage:
+    python playwright/collect_unfollowers.py            # all users, this process
+    python playwright/collect_unfollowers.py --enqueue  # queue all users as jobs
+    python playwright/collect_unfollowers.py --worker   # claim queued jobs
+    python playwright/collect_unfollowers.py --retry    # re-run failed owners
+    python playwright/collect_unfollowers.py --load     # apply spooled results
+
+Worker processes can run on any number of machines. Each one claims owners
+from collection_job with SKIP LOCKED and holds a lease that it renews while
+collecting; a crashed worker's jobs are reclaimed once the lease expires.
+Owners that fail are queued in verification_retry_queue and re-run by
+--retry with jittered exponential backoff up to RETRY_MAX_ATTEMPTS.
+Results whose database write failed stay in the spool and are applied by
+the loader at the start of every run, by --load, or by --retry before it
+would scan the owner again. Owners collected successfully by a scheduled
+run have their pending retries completed.
 """
 
+import argparse
 import asyncio
 import os
+import socket
 import sys
+import time
+import uuid
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from functools import cache
+from enum import Enum
 from pathlib import Path
 
 project_root = Path(__file__).parent.parent
@@ -21,113 +49,385 @@ sys.path.insert(0, str(project_root))
 
 from dotenv import load_dotenv
 from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeout
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.ext.asyncio import async_sessionmaker
 from core.config import get_settings
-from core.db import unfollower_db
+from core.database import create_collector_engine
+from core.db import (
+    collection_job_db,
+    collection_run_db,
+    follow_snapshot_db,
+    owner_follow_stats_db,
+    retry_queue_db,
+    unfollower_db,
+    unfollower_service_user_db,
+)
+from core.services import retry_service, unfollower_service
+from core.utils import get_kst_now
 from core.crypto import decrypt_data, generate_totp
+from core import avatar_cache, cache_events, response_cache
+from core.collector import (
+    avatars,
+    checkpoint,
+    graphql,
+    pacing,
+    precheck,
+    scheduler,
+    session_store,
+    snapshot,
+    spool,
+)
+from core.collector.metrics import (
+    COMPLETED_OUTCOMES,
+    OUTCOME_DB_FAILED,
+    OUTCOME_DEFERRED,
+    OUTCOME_ERROR,
+    OUTCOME_LOGIN_FAILED,
+    OUTCOME_SCAN_FAILED,
+    OUTCOME_SUCCESS,
+    OUTCOME_UNCHANGED,
+    RunReport,
+    UserRunMetrics,
+)
+from core.collector.routing import (
+    MODE_OFF,
+    BlockingPolicy,
+    RequestBlockingStats,
+    install_request_policy,
+)
 
 env_path = project_root / ".env"
 load_dotenv(dotenv_path=env_path)
 
 HEADLESS_MODE = os.getenv("HEADLESS", "false").lower() == "true"
+SCAN_TIMEOUT_SECONDS = 3600
+# --force: 팔로잉/팔로워 수가 같아도 전체 스캔
+FORCE_FULL_SCAN = False
+BLOCKING_POLICY = BlockingPolicy.from_settings()
+
+TWO_FACTOR_SELECTOR = 'input[name="verificationCode"]'
+NOT_NOW_SELECTOR = (
+    'button:has-text("나중에 하기"), button:has-text("Not Now"), '
+    'div[role="button"]:has-text("나중에 하기"), div[role="button"]:has-text("Not Now")'
+)
+HOME_FEED_SELECTOR = 'svg[aria-label="홈"], svg[aria-label="Home"]'
+LOGIN_ERROR_SELECTOR = "#slfErrorAlert"
+LOGIN_STEP_TIMEOUT_MS = 20000
+# 2FA -> 로그인 정보 저장 팝업 -> 알림 팝업 -> 홈 순서를 모두 거쳐도 충분한 횟수
+MAX_LOGIN_STEPS = 6
+UNFOLLOWER_SCRIPT_ENTRY = "__autogramRunUnfollowerScript"
+
+# verification_retry_queue의 수집 재시도 (shortcode 컬럼에 owner username 저장)
+RETRY_BATCH_COLLECT = "collect"
+# DB 저장 실패(OUTCOME_DB_FAILED)는 결과가 스풀에 남아 있으므로 다시 스캔하지 않고
+# 다음 실행 시작 시(또는 --load) 로더가 적용함
+RETRYABLE_OUTCOMES = {
+    OUTCOME_LOGIN_FAILED,
+    OUTCOME_SCAN_FAILED,
+    OUTCOME_ERROR,
+}
+
+
+class LoginState(str, Enum):
+    """Outcomes the login flow can observe after submitting a form."""
+
+    TWO_FACTOR = "two_factor"
+    POPUP = "popup"
+    HOME = "home"
+    CHALLENGE = "challenge"
+    ERROR = "error"
+    TIMEOUT = "timeout"
+
+
+@dataclass
+class ScanResult:
+    """Unfollowers of a scan and, for dual-edge scans, the follow snapshot."""
+
+    unfollowers: list[dict]
+    follow_snapshot: snapshot.FollowSnapshot | None = None
+
+
+@dataclass
+class LoginResult:
+    """Result of one login attempt with per-step latency in milliseconds."""
+
+    success: bool
+    state: LoginState | None = None
+    steps: dict[str, float] = field(default_factory=dict)
+
+    def record(self, step: str, started: float) -> float:
+        """Record the latency of a step that started at `started` and return now."""
+        now = time.perf_counter()
+        name = step
+        suffix = 2
+        while name in self.steps:
+            name = f"{step}_{suffix}"
+            suffix += 1
+        self.steps[name] = round((now - started) * 1000, 1)
+        return now
+
+    def timing_summary(self) -> str:
+        """One-line summary such as 'form 812ms, two_factor 1504ms'."""
+        return ", ".join(f"{name} {ms:.0f}ms" for name, ms in self.steps.items())
+
+
+async def wait_for_login_outcome(
+    page, timeout: int = LOGIN_STEP_TIMEOUT_MS
+) -> LoginState:
+    """
+    Wait for whichever login outcome appears first.
+
+    Args:
+        page: Playwright page object
+        timeout: Maximum wait in milliseconds
+
+    Returns:
+        The first LoginState observed, or LoginState.TIMEOUT
+    """
+    waiters = {
+        LoginState.TWO_FACTOR: page.wait_for_selector(
+            TWO_FACTOR_SELECTOR, timeout=timeout
+        ),
+        LoginState.POPUP: page.wait_for_selector(NOT_NOW_SELECTOR, timeout=timeout),
+        LoginState.HOME: page.wait_for_selector(HOME_FEED_SELECTOR, timeout=timeout),
+        LoginState.ERROR: page.wait_for_selector(LOGIN_ERROR_SELECTOR, timeout=timeout),
+        LoginState.CHALLENGE: page.wait_for_url(
+            lambda url: "challenge" in url, timeout=timeout
+        ),
+    }
+    tasks = {asyncio.ensure_future(waiter): state for state, waiter in waiters.items()}
+    pending = set(tasks)
+    outcome = LoginState.TIMEOUT
+
+    try:
+        while pending and outcome == LoginState.TIMEOUT:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                if task.exception() is None:
+                    outcome = tasks[task]
+                    break
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    return outcome
+
+
+async def wait_for_step_to_leave(
+    page, selector: str, timeout: int = LOGIN_STEP_TIMEOUT_MS
+) -> bool:
+    """
+    Wait until the element of a handled login step is gone, so the next
+    wait_for_login_outcome() does not observe the same step again.
+
+    Args:
+        page: Playwright page object
+        selector: Selector of the step that was just acted on
+        timeout: Maximum wait in milliseconds
+
+    Returns:
+        True if the element detached, False if it is still shown
+    """
+    try:
+        await page.wait_for_selector(selector, state="detached", timeout=timeout)
+        return True
+    except PlaywrightTimeout:
+        return False
 
 
 async def login_instagram(
     page, username: str, password: str, totp_secret: str | None = None
-):
+) -> LoginResult:
     """
     Log into Instagram.
 
+    Instead of fixed sleeps, every step waits for the first of several
+    outcomes (2FA input, "Not Now" popup, home feed, challenge URL or a
+    login error) and reacts to it, recording how long each step took.
+
     Args:
         page: Playwright page object
         username: Instagram username
         password: Instagram password
         totp_secret: Optional TOTP secret for 2FA
+
+    Returns:
+        LoginResult with success flag, final state and step latencies
     """
+    result = LoginResult(success=False)
+    started = time.perf_counter()
+
     print(f"[{username}] 인스타그램 로그인 페이지로 이동 중...")
-    await page.goto("https://www.instagram.com/accounts/login/")
-    await page.wait_for_load_state("networkidle")
+    await page.goto(
+        f"{graphql.INSTAGRAM_URL}/accounts/login/", wait_until="domcontentloaded"
+    )
     await page.wait_for_selector('input[name="username"]', timeout=10000)
+    started = result.record("form", started)
 
     print(f"[{username}] 계정 정보 입력 중...")
     await page.fill('input[name="username"]', username)
     await page.fill('input[name="password"]', password)
     await page.click('button[type="submit"]')
-    await page.wait_for_timeout(3000)
 
-    try:
-        two_fa_input = await page.wait_for_selector(
-            'input[name="verificationCode"]', timeout=5000
-        )
+    for _ in range(MAX_LOGIN_STEPS):
+        state = await wait_for_login_outcome(page)
+        started = result.record(state.value, started)
+        result.state = state
+
+        if state == LoginState.TWO_FACTOR:
+            if not totp_secret:
+                print(
+                    f"[{username}] 오류: 2단계 인증이 필요하지만 TOTP 시크릿이 제공되지 않았습니다"
+                )
+                break
 
-        if two_fa_input and totp_secret:
             print(f"[{username}] 2단계 인증 감지됨, TOTP 코드 생성 중...")
             totp_code = generate_totp(totp_secret)
             print(f"[{username}] 생성된 TOTP 코드: {totp_code}")
-            await page.fill('input[name="verificationCode"]', totp_code)
+            await page.fill(TWO_FACTOR_SELECTOR, totp_code)
             print(f"[{username}] 확인 버튼 클릭 중...")
 
-            try:
-                confirm_button = await page.wait_for_selector(
-                    'button:has-text("확인"), button:has-text("Confirm")', timeout=3000
-                )
-                await confirm_button.click()
-            except PlaywrightTimeout:
+            confirm_button = page.locator(
+                'button:has-text("확인"), button:has-text("Confirm")'
+            )
+            if await confirm_button.count():
+                await confirm_button.first.click()
+            else:
                 await page.click('button[type="submit"]')
 
-            await page.wait_for_timeout(5000)
-        elif two_fa_input and not totp_secret:
-            print(
-                f"[{username}] 오류: 2단계 인증이 필요하지만 TOTP 시크릿이 제공되지 않았습니다"
-            )
-            return False
-    except PlaywrightTimeout:
-        print(f"[{username}] 2단계 인증 불필요")
+            if not await wait_for_step_to_leave(page, TWO_FACTOR_SELECTOR):
+                print(f"[{username}] 로그인 중단: 2단계 인증 화면이 넘어가지 않습니다")
+                break
 
-    print(f"[{username}] 로그인 완료 대기 중...")
-    await page.wait_for_timeout(3000)
+        elif state == LoginState.POPUP:
+            print(f"[{username}] 팝업 닫는 중...")
+            await page.locator(NOT_NOW_SELECTOR).first.click()
+            if not await wait_for_step_to_leave(page, NOT_NOW_SELECTOR):
+                print(f"[{username}] 로그인 중단: 팝업이 닫히지 않습니다")
+                break
 
-    try:
-        print(f"[{username}] '로그인 정보 저장' 팝업 확인 중...")
-        save_info_button = await page.wait_for_selector(
-            'button:has-text("나중에 하기"), button:has-text("Not Now")', timeout=5000
-        )
-        if save_info_button:
-            print(f"[{username}] '로그인 정보 저장' 팝업 닫는 중...")
-            await save_info_button.click()
-            await page.wait_for_timeout(2000)
-    except PlaywrightTimeout:
-        print(f"[{username}] '로그인 정보 저장' 팝업 없음")
+        elif state == LoginState.HOME:
+            break
 
-    try:
-        print(f"[{username}] 알림 팝업 확인 중...")
-        notif_button = await page.wait_for_selector(
-            'button:has-text("나중에 하기"), button:has-text("Not Now")', timeout=5000
-        )
-        if notif_button:
-            print(f"[{username}] 알림 팝업 닫는 중...")
-            await notif_button.click()
-            await page.wait_for_timeout(2000)
-    except PlaywrightTimeout:
-        print(f"[{username}] 알림 팝업 없음")
+        else:
+            print(f"[{username}] 로그인 중단: {state.value}")
+            break
 
     current_url = page.url
     print(f"[{username}] 현재 URL: {current_url}")
+    print(f"[{username}] 로그인 단계별 소요 시간: {result.timing_summary()}")
 
-    if "challenge" in current_url or "login" in current_url:
+    if (
+        result.state != LoginState.HOME
+        or "challenge" in current_url
+        or "accounts/login" in current_url
+    ):
         print(f"[{username}] 로그인 실패 또는 추가 인증 필요")
-        return False
+        return result
 
     print(f"[{username}] 로그인 성공!")
-    return True
+    result.success = True
+    return result
 
 
-async def inject_unfollower_script(page):
+async def new_browser_context(
+    browser, request_stats: RequestBlockingStats, storage_state: dict | None = None
+):
+    """
+    Create an isolated browser context for one Instagram account
+    with the configured request-blocking policy applied.
+
+    Args:
+        browser: Shared Playwright browser instance
+        request_stats: Blocking counters of the user the context belongs to
+        storage_state: Optional saved storage_state to restore cookies from
+
+    Returns:
+        Playwright BrowserContext
+    """
+    context = await browser.new_context(
+        viewport={"width": 1280, "height": 720},
+        user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
+        storage_state=storage_state,
+    )
+    await install_request_policy(context, BLOCKING_POLICY, request_stats)
+    return context
+
+
+async def is_session_valid(page) -> bool:
     """
-    Inject the search_unfollower.js script into the page.
+    Probe whether the page's context is still logged into Instagram.
+    Costs a single page load of the home feed.
 
     Args:
         page: Playwright page object
+
+    Returns:
+        True if the session is logged in, False otherwise
+    """
+    await page.goto(
+        f"{graphql.INSTAGRAM_URL}/", wait_until="domcontentloaded", timeout=15000
+    )
+
+    if "accounts/login" in page.url or "challenge" in page.url:
+        return False
+
+    cookies = await page.context.cookies(graphql.INSTAGRAM_URL)
+    if not any(cookie["name"] == "sessionid" for cookie in cookies):
+        return False
+
+    return await page.locator('input[name="password"]').count() == 0
+
+
+async def restore_session(browser, username: str, request_stats: RequestBlockingStats):
+    """
+    Restore a saved Instagram session for a user if it is still valid.
+    Stale sessions are evicted from the session store.
+
+    Args:
+        browser: Shared Playwright browser instance
+        username: Instagram username
+        request_stats: Blocking counters for this user
+
+    Returns:
+        Tuple of (context, page) if restored, (None, None) otherwise
+    """
+    storage_state = session_store.load_session(username)
+    if storage_state is None:
+        return None, None
+
+    print(f"[{username}] 저장된 세션 확인 중...")
+    context = await new_browser_context(browser, request_stats, storage_state)
+    try:
+        page = await context.new_page()
+        if await is_session_valid(page):
+            print(f"[{username}] 저장된 세션으로 로그인 성공!")
+            return context, page
+    except Exception as e:
+        print(f"[{username}] 세션 확인 중 오류 발생: {str(e)}")
+
+    print(f"[{username}] 저장된 세션이 만료되어 삭제합니다")
+    session_store.evict_session(username)
+    await context.close()
+    return None, None
+
+
+@cache
+def unfollower_init_script() -> str:
+    """
+    Read search_unfollower.js once per process and wrap it for add_init_script.
+
+    The script replaces the page body as soon as it runs, so the init script
+    only defines it on the window; inject_unfollower_script() starts it once
+    the profile page has loaded.
+
+    Returns:
+        Init script source
+
+    Raises:
+        FileNotFoundError: If the script is missing
     """
     script_path = Path(__file__).parent / "script" / "search_unfollower.js"
 
@@ -137,8 +437,28 @@ async def inject_unfollower_script(page):
     with open(script_path, "r", encoding="utf-8") as f:
         script_content = f.read()
 
-    print("언팔로워 스크립트 주입 중...")
-    await page.evaluate(script_content)
+    return f"window.{UNFOLLOWER_SCRIPT_ENTRY} = () => {{\n{script_content}\n}};"
+
+
+async def register_unfollower_script(page):
+    """
+    Register the cached unfollower script on a page before it navigates.
+
+    Args:
+        page: Playwright page object
+    """
+    await page.add_init_script(script=unfollower_init_script())
+
+
+async def inject_unfollower_script(page):
+    """
+    Start the unfollower script registered by register_unfollower_script().
+
+    Args:
+        page: Playwright page object
+    """
+    print("언팔로워 스크립트 실행 중...")
+    await page.evaluate(f"window.{UNFOLLOWER_SCRIPT_ENTRY}()")
     await page.wait_for_timeout(1000)
 
 
@@ -151,7 +471,7 @@ async def collect_unfollowers(page, username: str):
         username: Instagram username
 
     Returns:
-        List of unfollower dicts
+        List of unfollower dicts, or None if the scan failed
     """
     print(f"[{username}] 언팔로워 UI 대기 중...")
 
@@ -159,7 +479,7 @@ async def collect_unfollowers(page, username: str):
         await page.wait_for_selector("button.run-scan", timeout=10000)
     except PlaywrightTimeout:
         print(f"[{username}] 오류: 조회 버튼을 찾을 수 없습니다")
-        return []
+        return None
 
     print(f"[{username}] 조회 버튼 클릭 중...")
     await page.click("button.run-scan")
@@ -180,7 +500,7 @@ async def collect_unfollowers(page, username: str):
         print(f"[{username}] 스캔 완료!")
     except PlaywrightTimeout:
         print(f"[{username}] 오류: 1시간 이내에 스캔이 완료되지 않았습니다")
-        return []
+        return None
 
     print(f"[{username}] 모든 항목 렌더링 대기 중...")
     await page.wait_for_timeout(2000)
@@ -220,114 +540,1086 @@ async def collect_unfollowers(page, username: str):
     return unfollowers_data
 
 
-async def process_user(
-    username: str, password: str, totp_secret: str | None, db_session
-):
+async def get_viewer_id(page) -> str | None:
     """
-    Process a single user: login, collect unfollowers, save to DB.
-    Retries login up to 5 times with browser restart on each attempt.
+    Get the numeric id of the logged-in account (ds_user_id cookie).
 
     Args:
-        username: Instagram username
-        password: Decrypted Instagram password
-        totp_secret: Decrypted TOTP secret (optional)
-        db_session: Database session
+        page: Logged-in Playwright page object
+
+    Returns:
+        User id, or None if the cookie is missing
     """
-    async with async_playwright() as p:
-        print(f"\n{'=' * 60}")
-        print(f"사용자 처리 중: {username}")
-        print(f"{'=' * 60}\n")
+    cookies = await page.context.cookies(graphql.INSTAGRAM_URL)
+    return next((c["value"] for c in cookies if c["name"] == "ds_user_id"), None)
+
+
+def graphql_headers(username: str) -> dict[str, str]:
+    """Headers the web client sends with graphql/query requests."""
+    return {
+        "X-IG-App-ID": "936619743392459",
+        "X-Requested-With": "XMLHttpRequest",
+        "Referer": f"{graphql.INSTAGRAM_URL}/{username}/",
+    }
+
 
-        max_retries = 5
-        login_success = False
-        browser = None
-        page = None
+async def fetch_follow_counts(
+    page, username: str, pacer: pacing.AdaptivePacer
+) -> precheck.FollowCounts | None:
+    """
+    Read the following and follower counts with one single-item page each.
+
+    Both requests go through the pacer like scan pages, and a throttling
+    response backs off the account and egress buckets.
 
-        for attempt in range(1, max_retries + 1):
+    Args:
+        page: Logged-in Playwright page object
+        username: Instagram username
+        pacer: Adaptive pacer of this owner
+
+    Returns:
+        FollowCounts, or None if either request failed
+    """
+    user_id = await get_viewer_id(page)
+    if not user_id:
+        return None
+
+    counts = {}
+    for edge, url in (
+        (graphql.EDGE_FOLLOW, graphql.build_following_url(user_id, first=1)),
+        (graphql.EDGE_FOLLOWED_BY, graphql.build_followers_url(user_id, first=1)),
+    ):
+        await pacer.wait()
+        try:
+            response = await page.request.get(url, headers=graphql_headers(username))
             try:
-                print(f"[{username}] 로그인 시도 {attempt}/{max_retries}")
+                payload = await response.json()
+            except Exception:
+                payload = None
+
+            signal = graphql.classify_response(response.status, payload)
+            if signal == graphql.RESPONSE_THROTTLED:
+                pacer.record_throttle()
+                raise ValueError(f"HTTP {response.status} 요청 제한")
+            if signal != graphql.RESPONSE_OK:
+                raise ValueError(f"HTTP {response.status}")
+            counts[edge] = graphql.parse_following_page(payload, edge).count
+        except Exception as e:
+            print(f"[{username}] 팔로잉/팔로워 수 확인 실패: {str(e)}")
+            return None
 
-                if browser:
-                    await browser.close()
-                    print(f"[{username}] 이전 브라우저 인스턴스 종료됨")
-                    await asyncio.sleep(2)
+        pacer.record_success()
 
-                browser = await p.chromium.launch(headless=HEADLESS_MODE)
-                context = await browser.new_context(
-                    viewport={"width": 1280, "height": 720},
-                    user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
-                )
-                page = await context.new_page()
+    return precheck.FollowCounts(
+        following=counts[graphql.EDGE_FOLLOW],
+        followers=counts[graphql.EDGE_FOLLOWED_BY],
+    )
 
-                login_success = await login_instagram(
-                    page, username, password, totp_secret
-                )
 
-                if login_success:
-                    print(f"[{username}] {attempt}번째 시도에서 로그인 성공")
-                    break
-                else:
-                    print(f"[{username}] {attempt}번째 시도에서 로그인 실패")
-                    if attempt < max_retries:
-                        print(f"[{username}] 새 브라우저로 재시도 중...")
+async def skip_if_unchanged(
+    page, username: str, async_session, metrics: UserRunMetrics
+) -> tuple[bool, precheck.FollowCounts | None]:
+    """
+    Precheck an owner's follow counts against the last full scan.
 
-            except Exception as e:
-                print(f"[{username}] 로그인 시도 {attempt} 중 오류 발생: {str(e)}")
-                if attempt < max_retries:
-                    print(f"[{username}] 재시도 중...")
+    Args:
+        page: Logged-in Playwright page object
+        username: Instagram username
+        async_session: Session maker for the collector engine
+        metrics: Metrics of this user
 
-        if not login_success:
-            print(f"[{username}] {max_retries}번의 시도 후 로그인 실패로 건너뜀")
-            if browser:
-                await browser.close()
-            return
+    Returns:
+        Tuple of (skip the full scan, counts to record after a full scan)
+    """
+    with metrics.phase("precheck"):
+        pacer = pacing.AdaptivePacer.for_account()
+        counts = await fetch_follow_counts(page, username, pacer)
+        metrics.throttle_count += pacer.throttles
+        if counts is None:
+            return False, None
+
+        async with async_session() as session:
+            stats = await owner_follow_stats_db.get_owner_follow_stats(
+                session, username
+            )
+            now = get_kst_now()
+            unchanged = stats is not None and precheck.can_skip_full_scan(
+                counts,
+                stats.following_count,
+                stats.follower_count,
+                stats.full_scan_at,
+                now,
+            )
+            if not unchanged or FORCE_FULL_SCAN:
+                return False, counts
+
+            await owner_follow_stats_db.record_unchanged_check(session, username, now)
+            await session.commit()
+
+    metrics.following_count = counts.following
+    print(
+        f"[{username}] 팔로잉 {counts.following}명, 팔로워 {counts.followers}명으로 "
+        f"지난 스캔과 같아 전체 스캔을 생략합니다"
+    )
+    return True, counts
+
+
+async def scan_edge(
+    page,
+    username: str,
+    user_id: str,
+    edge: str,
+    pacer: pacing.AdaptivePacer,
+    metrics: UserRunMetrics,
+    deadline: float,
+) -> list[dict] | None:
+    """
+    Page one follow connection of the owner through graphql/query.
 
+    Every page is appended to the edge's checkpoint, and a fresh checkpoint
+    from an interrupted run is resumed from its last end_cursor.
+
+    Args:
+        page: Logged-in Playwright page object
+        username: Instagram username
+        user_id: Viewer id (ds_user_id cookie)
+        edge: checkpoint.EDGE_FOLLOWING or checkpoint.EDGE_FOLLOWERS
+        pacer: Adaptive pacer shared by all connections of this owner
+        metrics: Metrics of this user (pages, counts, retries)
+        deadline: time.monotonic() deadline of the whole scan
+
+    Returns:
+        Compact user nodes, or None if the scan failed
+    """
+    if edge == checkpoint.EDGE_FOLLOWERS:
+        build_url, connection = graphql.build_followers_url, graphql.EDGE_FOLLOWED_BY
+    else:
+        build_url, connection = graphql.build_following_url, graphql.EDGE_FOLLOW
+    label = "팔로워" if edge == checkpoint.EDGE_FOLLOWERS else "팔로잉"
+    headers = graphql_headers(username)
+    failures = 0
+
+    saved = checkpoint.load_checkpoint(username, user_id, edge)
+    if saved:
+        nodes = saved.nodes
+        cursor = saved.end_cursor
+        pages = saved.pages
+        has_next_page = saved.has_next_page
+        print(
+            f"[{username}] {label} 체크포인트에서 이어서 수집합니다 "
+            f"({pages}페이지, {len(nodes)}/{saved.count}명)"
+        )
+    else:
+        nodes = []
+        cursor = None
+        pages = 0
+        has_next_page = True
+        checkpoint.start_checkpoint(username, user_id, edge)
+
+    while has_next_page:
+        if time.monotonic() > deadline:
+            print(f"[{username}] 오류: 1시간 이내에 스캔이 완료되지 않았습니다")
+            return None
+
+        await pacer.wait()
+        throttled = False
         try:
+            response = await page.request.get(
+                build_url(user_id, cursor), headers=headers
+            )
+            try:
+                payload = await response.json()
+            except Exception:
+                payload = None
+
+            signal = graphql.classify_response(response.status, payload)
+            if signal == graphql.RESPONSE_CHECKPOINT:
+                print(
+                    f"[{username}] 오류: 계정 확인(checkpoint)이 필요하여 "
+                    f"{label} 수집을 중단합니다"
+                )
+                return None
+            if signal == graphql.RESPONSE_THROTTLED:
+                throttled = True
+                pacer.record_throttle()
+                metrics.throttle_count += 1
+                raise ValueError(f"HTTP {response.status} 요청 제한")
+            if signal != graphql.RESPONSE_OK:
+                raise ValueError(f"HTTP {response.status}")
+            follow_page = graphql.parse_following_page(payload, connection)
+        except Exception as e:
+            failures += 1
+            metrics.scan_retries += 1
+            print(f"[{username}] {label} 페이지 요청 실패 ({failures}/5): {str(e)}")
+            if failures >= 5:
+                return None
+            if not throttled:
+                # 요청 제한은 pacer의 cooldown이 대기를 담당
+                await asyncio.sleep(5 * failures)
+            continue
+
+        pacer.record_success()
+
+        checkpoint.append_page(
+            username,
+            follow_page.end_cursor,
+            follow_page.has_next_page,
+            follow_page.count,
+            follow_page.nodes,
+            edge,
+        )
+        failures = 0
+        pages += 1
+        metrics.pages += 1
+        if edge == checkpoint.EDGE_FOLLOWERS:
+            metrics.follower_count = follow_page.count
+        else:
+            metrics.following_count = follow_page.count
+        nodes.extend(checkpoint.compact_node(node) for node in follow_page.nodes)
+        cursor = follow_page.end_cursor
+        has_next_page = follow_page.has_next_page
+        if pages == 1 or pages % 10 == 0:
+            print(f"[{username}] {label} {len(nodes)}/{follow_page.count}명 수집됨")
+
+    return nodes
+
+
+async def collect_unfollowers_via_network(
+    page, username: str, metrics: UserRunMetrics
+) -> ScanResult | None:
+    """
+    Collect unfollowers by paging the graphql/query endpoint directly.
+
+    Uses the context's cookies through page.request, so no profile page or
+    injected UI has to be rendered. The following and follower lists are
+    paged concurrently under one adaptive pacer (per-account and per-IP
+    token buckets), and both non-mutual sets are computed from them in
+    Python.
+
+    Args:
+        page: Logged-in Playwright page object
+        username: Instagram username
+        metrics: Metrics of this user (pages, following count, retries)
+
+    Returns:
+        ScanResult with the follow snapshot, or None if the scan failed
+    """
+    user_id = await get_viewer_id(page)
+    if not user_id:
+        print(f"[{username}] 오류: ds_user_id 쿠키를 찾을 수 없습니다")
+        return None
+
+    deadline = time.monotonic() + SCAN_TIMEOUT_SECONDS
+    pacer = pacing.AdaptivePacer.for_account()
+
+    print(f"[{username}] 네트워크 모드로 팔로잉/팔로워 목록 수집 중...")
+    following, followers = await asyncio.gather(
+        *(
+            scan_edge(page, username, user_id, edge, pacer, metrics, deadline)
+            for edge in (checkpoint.EDGE_FOLLOWING, checkpoint.EDGE_FOLLOWERS)
+        )
+    )
+    if following is None or followers is None:
+        return None
+
+    follow_snapshot = snapshot.FollowSnapshot(
+        following=[snapshot.compact_user(node) for node in following],
+        followers=[snapshot.compact_user(node) for node in followers],
+    )
+    analysis = snapshot.analyze(follow_snapshot)
+    unfollowers_data = [
+        snapshot.to_unfollower(user) for user in analysis.not_following_back
+    ]
+    metrics.pages_per_second = round(pacer.achieved_rate(), 3)
+    print(
+        f"[{username}] 페이지 속도 {metrics.pages_per_second}/s "
+        f"(계정 {pacer.account.rate:.2f}/s, IP {pacer.egress.rate:.2f}/s), "
+        f"요청 제한 {pacer.throttles}회, 대기 {pacer.waited_s:.1f}초"
+    )
+    print(
+        f"[{username}] 스캔 완료! {pacer.pages}페이지, "
+        f"{len(unfollowers_data)}명의 언팔로워, "
+        f"맞팔하지 않은 팔로워 {len(analysis.not_followed_back)}명 발견"
+    )
+    return ScanResult(unfollowers_data, follow_snapshot)
+
+
+async def scan_unfollowers(
+    page, username: str, metrics: UserRunMetrics
+) -> ScanResult | None:
+    """
+    Run the configured scan mode for a logged-in user.
+
+    Args:
+        page: Logged-in Playwright page object
+        username: Instagram username
+        metrics: Metrics of this user
+
+    Returns:
+        ScanResult (the dom mode has no snapshot), or None if the scan failed
+    """
+    if get_settings().COLLECTOR_SCAN_MODE == "dom":
+        with metrics.phase("navigation"):
             print(f"[{username}] 프로필로 이동 중...")
-            await page.goto(f"https://www.instagram.com/{username}/")
+            await register_unfollower_script(page)
+            await page.goto(f"{graphql.INSTAGRAM_URL}/{username}/")
             await page.wait_for_load_state("networkidle")
             await inject_unfollower_script(page)
-
+        with metrics.phase("scan"):
             unfollowers_data = await collect_unfollowers(page, username)
+        return None if unfollowers_data is None else ScanResult(unfollowers_data)
 
-            if unfollowers_data:
-                # 기존 언팔로워 삭제
-                print(f"[{username}] 기존 언팔로워 데이터 삭제 중...")
-                deleted_count = await unfollower_db.delete_unfollowers_by_owner(
-                    db_session, username
-                )
-                print(f"[{username}] {deleted_count}명의 기존 언팔로워 삭제 완료")
+    with metrics.phase("scan"):
+        return await collect_unfollowers_via_network(page, username, metrics)
 
-                # 새로운 언팔로워 저장
-                print(
-                    f"[{username}] {len(unfollowers_data)}명의 언팔로워를 데이터베이스에 저장 중..."
-                )
-                count = await unfollower_db.upsert_unfollowers(
-                    db_session, username, unfollowers_data
-                )
-                await db_session.commit()
-                print(f"[{username}] {count}명의 언팔로워 저장 완료")
+
+async def login_with_retries(
+    browser,
+    username: str,
+    password: str,
+    totp_secret: str | None,
+    metrics: UserRunMetrics,
+):
+    """
+    Log a user in, reusing a saved session when it is still valid.
+    Falls back to the full login flow up to 5 times with a fresh context
+    on each attempt, and saves the resulting session on success.
+
+    Args:
+        browser: Shared Playwright browser instance
+        username: Instagram username
+        password: Decrypted Instagram password
+        totp_secret: Decrypted TOTP secret (optional)
+        metrics: Metrics of this user (attempts, login steps, blocked requests)
+
+    Returns:
+        Tuple of (context, page) if logged in, (None, None) otherwise
+    """
+    context, page = await restore_session(browser, username, metrics.requests)
+    if page is not None:
+        return context, page
+
+    max_retries = 5
+
+    for attempt in range(1, max_retries + 1):
+        try:
+            print(f"[{username}] 로그인 시도 {attempt}/{max_retries}")
+
+            if context:
+                await context.close()
+                context = None
+                print(f"[{username}] 이전 브라우저 컨텍스트 종료됨")
+                await asyncio.sleep(2)
+
+            context = await new_browser_context(browser, metrics.requests)
+            page = await context.new_page()
+
+            metrics.login_attempts += 1
+            login_result = await login_instagram(page, username, password, totp_secret)
+            metrics.login_steps = login_result.steps
+
+            if login_result.success:
+                print(f"[{username}] {attempt}번째 시도에서 로그인 성공")
+                session_store.save_session(username, await context.storage_state())
+                return context, page
             else:
-                print(f"[{username}] 언팔로워를 찾을 수 없습니다")
+                print(f"[{username}] {attempt}번째 시도에서 로그인 실패")
+                if attempt < max_retries:
+                    print(f"[{username}] 새 브라우저 컨텍스트로 재시도 중...")
 
         except Exception as e:
-            print(f"[{username}] 오류: {str(e)}")
-            await db_session.rollback()
+            print(f"[{username}] 로그인 시도 {attempt} 중 오류 발생: {str(e)}")
+            if attempt < max_retries:
+                print(f"[{username}] 재시도 중...")
+
+    print(f"[{username}] {max_retries}번의 시도 후 로그인 실패로 건너뜀")
+    if context:
+        await context.close()
+    return None, None
+
+
+async def cache_avatars(page, username: str, async_session, metrics: UserRunMetrics):
+    """
+    Download the avatars of unfollowers that are not cached yet.
+
+    Downloads share the logged-in context's HTTP connection pool and run
+    AVATAR_DOWNLOAD_CONCURRENCY at a time, with no database connection
+    held meanwhile. Failures only leave the profile CDN URL in place, so
+    they never fail the collection.
+
+    Args:
+        page: Logged-in page of the owner
+        username: Owner username
+        async_session: Session maker for the collector engine
+        metrics: Metrics of this user
+    """
+    settings = get_settings()
+    try:
+        with metrics.phase("avatars"):
+            async with async_session() as session:
+                missing = await unfollower_db.get_unfollowers_without_avatar(
+                    session, username
+                )
+            if not missing:
+                return
+            keys = await avatars.fetch_avatars(
+                page.context.request, missing, settings.AVATAR_DOWNLOAD_CONCURRENCY
+            )
+            async with async_session() as session:
+                await unfollower_db.set_profile_image_keys(session, username, keys)
+                if keys:
+                    # 응답에 캐시 주소가 들어가므로 목록 ETag 갱신
+                    await unfollower_service_user_db.bump_unfollowers_version(
+                        session, username
+                    )
+                await session.commit()
+        metrics.avatars_cached = len(keys)
+        print(f"[{username}] 프로필 사진 캐시: {len(keys)}/{len(missing)}개 저장")
+    except Exception as e:
+        print(f"[{username}] 프로필 사진 캐시 오류 (무시): {str(e)}")
+
+
+async def apply_spooled_results(
+    async_session, owner: str
+) -> unfollower_service.UnfollowerDiff | None:
+    """
+    Apply the newest pending spooled result of an owner in one transaction.
+    Older pending results of the owner are superseded by it, so all of them
+    are moved to done/ once the transaction has committed.
+
+    Args:
+        async_session: Session maker for the collector engine
+        owner: Owner username
+
+    Returns:
+        Applied UnfollowerDiff, or None if nothing was pending
+    """
+    pending = await asyncio.to_thread(spool.list_pending, owner)
+    if not pending:
+        return None
+
+    latest = pending[-1]
+    unfollowers, follow_snapshot = await asyncio.to_thread(spool.read_result, latest)
+    async with async_session() as session:
+        diff = await unfollower_service.sync_unfollowers(session, owner, unfollowers)
+        if follow_snapshot is not None:
+            await follow_snapshot_db.upsert_follow_snapshot(
+                session, owner, follow_snapshot, latest.scanned_at
+            )
+        # 커밋과 함께 API 프로세스들의 언팔로워 응답 캐시 무효화
+        await cache_events.publish_invalidation(
+            session, response_cache.unfollowers_tag(owner)
+        )
+        await session.commit()
+
+    for result in pending:
+        spool.mark_done(result)
+    return diff
+
+
+async def load_spool(async_session) -> tuple[int, int]:
+    """
+    Loader stage: apply every pending spooled result to the database.
+    Owners are applied independently, so one failure leaves only that
+    owner's results pending for the next load.
+
+    Args:
+        async_session: Session maker for the collector engine
+
+    Returns:
+        Tuple of (owners applied, owners failed)
+    """
+    owners = sorted({result.owner for result in spool.list_pending()})
+    applied = failed = 0
+    applied_owners = []
+    for owner in owners:
+        try:
+            diff = await apply_spooled_results(async_session, owner)
+        except Exception as e:
+            print(f"[{owner}] 스풀 적용 실패 (다음 로드에서 다시 시도): {str(e)}")
+            failed += 1
+            continue
+        if diff is not None:
+            print(
+                f"[{owner}] 스풀 적용: {len(diff.added)}명 추가, "
+                f"{len(diff.removed)}명 삭제, {len(diff.updated)}명 갱신"
+            )
+            applied += 1
+            applied_owners.append(owner)
+
+    await complete_collect_retries(async_session, applied_owners)
+    pruned = spool.prune_done()
+    if owners or pruned:
+        print(
+            f"스풀 로드 완료: {applied}명 적용, {failed}명 실패, "
+            f"보관 기간이 지난 파일 {pruned}개 삭제"
+        )
+    return applied, failed
+
+
+async def record_follow_counts(
+    async_session, username: str, counts: precheck.FollowCounts
+):
+    """
+    Remember the counts a full scan was taken with for the next precheck.
+    A failure only means the next run scans the owner fully again.
+
+    Args:
+        async_session: Session maker for the collector engine
+        username: Owner username
+        counts: Counts read before the scan
+    """
+    try:
+        async with async_session() as session:
+            await owner_follow_stats_db.record_full_scan(
+                session, username, counts.following, counts.followers, get_kst_now()
+            )
+            await session.commit()
+    except Exception as e:
+        print(f"[{username}] 팔로잉/팔로워 수 저장 실패 (무시): {str(e)}")
+
+
+async def process_user(
+    browser,
+    username: str,
+    password: str,
+    totp_secret: str | None,
+    async_session,
+    metrics: UserRunMetrics,
+) -> bool:
+    """
+    Process a single user: login, collect unfollowers, save to DB.
+    Runs in an isolated browser context on the shared browser.
+
+    No database connection is held while logging in or scanning. The scan
+    result is spooled to disk first and then applied in one short
+    transaction; if that fails the result stays pending for the loader.
+
+    Args:
+        browser: Shared Playwright browser instance
+        username: Instagram username
+        password: Decrypted Instagram password
+        totp_secret: Decrypted TOTP secret (optional)
+        async_session: Session maker for the collector engine
+        metrics: Metrics of this user, finished with the outcome
+
+    Returns:
+        True if the scan succeeded and its diff was saved, or the follow
+        counts were unchanged; False otherwise
+    """
+    print(f"\n{'=' * 60}")
+    print(f"사용자 처리 중: {username}")
+    print(f"{'=' * 60}\n")
+
+    with metrics.phase("login"):
+        context, page = await login_with_retries(
+            browser, username, password, totp_secret, metrics
+        )
+    if page is None:
+        metrics.finish(OUTCOME_LOGIN_FAILED)
+        return False
+
+    try:
+        counts = None
+        if get_settings().COLLECTOR_PRECHECK:
+            skip, counts = await skip_if_unchanged(
+                page, username, async_session, metrics
+            )
+            if skip:
+                metrics.finish(OUTCOME_UNCHANGED)
+                return True
+
+        scan = await scan_unfollowers(page, username, metrics)
+
+        if scan is None:
+            print(f"[{username}] 스캔에 실패하여 기존 데이터를 유지합니다")
+            metrics.finish(OUTCOME_SCAN_FAILED)
+            return False
+
+        metrics.unfollower_count = len(scan.unfollowers)
+        with metrics.phase("spool"):
+            await asyncio.to_thread(
+                spool.write_result,
+                username,
+                scan.unfollowers,
+                get_kst_now(),
+                scan.follow_snapshot,
+            )
+        # 결과가 스풀에 안전하게 기록되었으므로 체크포인트는 더 이상 필요 없음
+        checkpoint.clear_checkpoint(username)
+
+        print(
+            f"[{username}] {len(scan.unfollowers)}명의 언팔로워를 기존 데이터와 비교하여 저장 중..."
+        )
+        try:
+            with metrics.phase("db_write"):
+                diff = await apply_spooled_results(async_session, username)
+        except Exception as e:
+            print(
+                f"[{username}] 데이터베이스 저장 오류 (결과는 스풀에 보관되어 "
+                f"다음 로드에서 적용됨): {str(e)}"
+            )
+            metrics.finish(OUTCOME_DB_FAILED, str(e))
+            return False
+
+        if diff is None:
+            # 동시에 실행된 로더(--load)가 이미 적용함
+            diff = unfollower_service.UnfollowerDiff()
+        if counts is not None:
+            await record_follow_counts(async_session, username, counts)
+        metrics.added_count = len(diff.added)
+        metrics.removed_count = len(diff.removed)
+        metrics.updated_count = len(diff.updated)
+        print(
+            f"[{username}] 저장 완료: {len(diff.added)}명 추가, "
+            f"{len(diff.removed)}명 삭제, {len(diff.updated)}명 갱신, "
+            f"{diff.unchanged}명 변경 없음"
+        )
+        if get_settings().AVATAR_CACHE_ENABLED:
+            await cache_avatars(page, username, async_session, metrics)
+        metrics.finish(OUTCOME_SUCCESS)
+        return True
+
+    except Exception as e:
+        print(f"[{username}] 오류: {str(e)}")
+        metrics.finish(OUTCOME_ERROR, str(e))
+        return False
+    finally:
+        await context.close()
+        if BLOCKING_POLICY.mode != MODE_OFF:
+            print(f"[{username}] {metrics.requests.summary()}")
+
+
+async def collect_user(browser, async_session, user, metrics: UserRunMetrics):
+    """
+    Decrypt the credentials of a service user and process it.
+
+    process_user opens its own short-lived sessions because an AsyncSession
+    must not be shared between concurrently running tasks, nor held open
+    across a scan.
+
+    Args:
+        browser: Shared Playwright browser instance
+        async_session: Session maker for the collector engine
+        user: UnfollowerServiceUser instance
+        metrics: Metrics of this user, finished with the outcome
+    """
+    try:
+        password = decrypt_data(user.password)
+        totp_secret = decrypt_data(user.totp_secret) if user.totp_secret else None
+
+        await process_user(
+            browser, user.username, password, totp_secret, async_session, metrics
+        )
+    except Exception as e:
+        print(f"[{user.username}] 사용자 처리 중 오류 발생: {str(e)}")
+        metrics.finish(OUTCOME_ERROR, str(e))
+
+
+def new_user_metrics(owner: str) -> UserRunMetrics:
+    """Create the metrics record of an owner for this run."""
+    return UserRunMetrics(
+        owner=owner, requests=RequestBlockingStats(mode=BLOCKING_POLICY.mode)
+    )
+
+
+def run_deadline() -> float | None:
+    """Monotonic deadline of this run from COLLECTOR_RUN_BUDGET_MINUTES."""
+    budget_minutes = get_settings().COLLECTOR_RUN_BUDGET_MINUTES
+    if budget_minutes <= 0:
+        return None
+    return time.monotonic() + budget_minutes * 60
+
+
+def fits_deadline(deadline: float | None, estimate_s: float) -> bool:
+    """Whether a scan of estimate_s seconds started now ends before the deadline."""
+    return deadline is None or time.monotonic() + estimate_s <= deadline
+
+
+def deferred_metrics(owner: str, estimate_s: float) -> UserRunMetrics:
+    """Metrics of an owner pushed to the next run by the time budget."""
+    print(
+        f"[{owner}] 예상 수집 시간 {estimate_s:.0f}초가 남은 예산을 넘어 다음 실행으로 미룸"
+    )
+    metrics = new_user_metrics(owner)
+    metrics.finish(OUTCOME_DEFERRED, f"estimated {estimate_s:.0f}s exceeds run budget")
+    return metrics
+
+
+async def run_user(
+    semaphore,
+    browser,
+    async_session,
+    user,
+    estimate_s: float = 0.0,
+    deadline: float | None = None,
+) -> UserRunMetrics:
+    """
+    Process one service user under the shared concurrency limit.
+    The estimate is checked again once a slot is free because earlier
+    owners may have taken longer than planned.
+
+    Args:
+        semaphore: Semaphore bounding the number of concurrent accounts
+        browser: Shared Playwright browser instance
+        async_session: Session maker for the collector engine
+        user: UnfollowerServiceUser instance
+        estimate_s: Estimated scan seconds of the user
+        deadline: Monotonic deadline of the run (None for unlimited)
+
+    Returns:
+        Finished UserRunMetrics of the user
+    """
+    async with semaphore:
+        if not fits_deadline(deadline, estimate_s):
+            return deferred_metrics(user.username, estimate_s)
+
+        metrics = new_user_metrics(user.username)
+        await collect_user(browser, async_session, user, metrics)
+        return metrics
+
+
+@asynccontextmanager
+async def browser_runtime(report: RunReport):
+    """
+    Start the Playwright driver and Chromium once for a whole run.
+
+    Every user and every login retry gets only a new BrowserContext on this
+    browser. The driver start and browser launch times are recorded on the
+    report so the saved startup overhead can be reported.
+
+    Args:
+        report: Report of this run
+
+    Yields:
+        Shared Playwright browser instance
+    """
+    started = time.perf_counter()
+    async with async_playwright() as p:
+        launched = time.perf_counter()
+        report.startup_ms["driver"] = (launched - started) * 1000
+        browser = await p.chromium.launch(headless=HEADLESS_MODE)
+        report.startup_ms["launch"] = (time.perf_counter() - launched) * 1000
+        print(
+            f"브라우저 시작: 드라이버 {report.startup_ms['driver']:.0f}ms, "
+            f"Chromium {report.startup_ms['launch']:.0f}ms"
+        )
+        try:
+            yield browser
         finally:
-            if browser:
-                await browser.close()
+            await browser.close()
 
 
-async def main():
-    print("=" * 60)
-    print("언팔로워 수집 스크립트")
-    print("=" * 60)
+def make_worker_id() -> str:
+    """Unique id of this worker process, recorded as the lease owner."""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
 
-    # Setup database
+
+async def hold_lease(async_session, owner: str, worker_id: str, lease_seconds: int):
+    """
+    Renew the lease of a claimed job until cancelled.
+    Returns only when the lease was lost to another worker.
+
+    Args:
+        async_session: Session maker for the collector engine
+        owner: Owner username of the job
+        worker_id: Id of this worker
+        lease_seconds: Lease duration
+    """
+    while True:
+        await asyncio.sleep(lease_seconds / 3)
+        try:
+            async with async_session() as session:
+                renewed = await collection_job_db.renew_collection_job_lease(
+                    session, owner, worker_id, lease_seconds
+                )
+                await session.commit()
+        except Exception as e:
+            # 일시적인 DB 오류는 다음 주기에 다시 시도 (lease 만료 전까지 여유 있음)
+            print(f"[{owner}] lease 갱신 실패: {str(e)}")
+            continue
+
+        if not renewed:
+            print(f"[{owner}] lease가 만료되어 다른 워커가 작업을 가져갔습니다")
+            return
+
+
+async def run_claimed_job(
+    browser, async_session, owner: str, worker_id: str, lease_seconds: int
+) -> UserRunMetrics:
+    """
+    Collect a claimed owner while holding its lease, then complete the job.
+    If the lease is lost midway the collection is cancelled so two workers
+    never write the same owner.
+
+    Args:
+        browser: Shared Playwright browser instance
+        async_session: Session maker for the collector engine
+        owner: Owner username of the claimed job
+        worker_id: Id of this worker
+        lease_seconds: Lease duration
+
+    Returns:
+        Finished UserRunMetrics of the owner
+    """
+    metrics = new_user_metrics(owner)
+    async with async_session() as session:
+        user = await unfollower_service_user_db.get_unfollower_service_user_by_username(
+            session, owner
+        )
+
+    if user is None:
+        metrics.finish(OUTCOME_ERROR, "unfollower_service_user not found")
+    else:
+        collect = asyncio.create_task(
+            collect_user(browser, async_session, user, metrics)
+        )
+        lease = asyncio.create_task(
+            hold_lease(async_session, owner, worker_id, lease_seconds)
+        )
+        await asyncio.wait({collect, lease}, return_when=asyncio.FIRST_COMPLETED)
+
+        if collect.done():
+            lease.cancel()
+        else:
+            collect.cancel()
+            metrics.finish(OUTCOME_ERROR, "lease lost")
+        await asyncio.gather(collect, lease, return_exceptions=True)
+
+    success = metrics.outcome in COMPLETED_OUTCOMES
+    try:
+        async with async_session() as session:
+            completed = await collection_job_db.complete_collection_job(
+                session,
+                owner,
+                worker_id,
+                success,
+                None if success else (metrics.error or metrics.outcome),
+            )
+            await session.commit()
+        if not completed:
+            print(f"[{owner}] lease가 없어 작업 결과를 기록하지 못했습니다")
+    except Exception as e:
+        # 기록에 실패해도 lease가 만료되면 다른 워커가 다시 수집함
+        print(f"[{owner}] 작업 완료 기록 실패: {str(e)}")
+
+    return metrics
+
+
+async def worker_loop(
+    browser,
+    async_session,
+    worker_id: str,
+    report: RunReport,
+    deadline: float | None = None,
+):
+    """
+    Claim and process jobs one at a time until the queue is empty or no
+    remaining job fits in the run budget. Jobs too long for the remaining
+    budget are skipped in favour of the next one that fits; run_worker
+    reports the ones left over as deferred.
+
+    Args:
+        browser: Shared Playwright browser instance
+        async_session: Session maker for the collector engine
+        worker_id: Id of this worker
+        report: Run report collecting the per-user metrics
+        deadline: Monotonic deadline of the run (None for unlimited)
+    """
     settings = get_settings()
-    engine = create_async_engine(settings.DATABASE_URL, echo=False)
-    async_session = async_sessionmaker(engine, expire_on_commit=False)
+    lease_seconds = settings.COLLECTOR_JOB_LEASE_SECONDS
+    while True:
+        remaining_s = None if deadline is None else deadline - time.monotonic()
+        async with async_session() as session:
+            job = await collection_job_db.claim_collection_job(
+                session,
+                worker_id,
+                lease_seconds,
+                settings.COLLECTOR_MAX_ATTEMPTS,
+                max_estimate_seconds=remaining_s,
+                default_estimate_seconds=settings.COLLECTOR_DEFAULT_SCAN_SECONDS,
+            )
+            owner = job.owner if job else None
+            await session.commit()
+
+        if owner is None:
+            return
+
+        print(f"[{owner}] 작업 점유 (worker: {worker_id})")
+        report.users.append(
+            await run_claimed_job(
+                browser, async_session, owner, worker_id, lease_seconds
+            )
+        )
+
+
+async def enqueue_all_users(async_session):
+    """
+    Queue every unfollower service user as a collection job, ranked by the
+    scheduler so workers claim the stalest, cheapest owners first.
+
+    Args:
+        async_session: Session maker for the collector engine
+    """
+    from sqlalchemy import select
+    from core.models import UnfollowerServiceUser
+
+    async with async_session() as session:
+        result = await session.execute(select(UnfollowerServiceUser.username))
+        owners = list(result.scalars().all())
+        stats = await collection_run_db.get_owner_stats(session, owners)
+        ranked = scheduler.plan_run(list(stats.values()), get_kst_now(), workers=1)
+        queued = await collection_job_db.enqueue_collection_jobs(
+            session, owners, {item.owner: item for item in ranked.scheduled}
+        )
+        await session.commit()
+
+    print(f"수집 작업 {queued}건 등록 (전체 사용자 {len(owners)}명)")
+
 
+async def run_worker(async_session, workers: int) -> RunReport:
+    """
+    Run `workers` job loops on one shared browser until the queue is empty.
+
+    Args:
+        async_session: Session maker for the collector engine
+        workers: Number of concurrent job loops
+
+    Returns:
+        Finished run report
+    """
+    worker_id = make_worker_id()
+    print(f"워커 시작: {worker_id} (동시 처리 수: {workers})\n")
+
+    deadline = run_deadline()
+    report = RunReport(workers=workers)
+    async with browser_runtime(report) as browser:
+        await asyncio.gather(
+            *(
+                worker_loop(browser, async_session, worker_id, report, deadline)
+                for _ in range(workers)
+            )
+        )
+
+    if deadline is not None:
+        # 예산 안에 들어가지 않아 남은 작업은 모두 다음 실행으로 미룸
+        settings = get_settings()
+        async with async_session() as session:
+            remaining = await collection_job_db.list_claimable_collection_jobs(
+                session, settings.COLLECTOR_MAX_ATTEMPTS
+            )
+        report.users.extend(
+            deferred_metrics(
+                job.owner,
+                (
+                    job.estimate_seconds
+                    if job.estimate_seconds is not None
+                    else settings.COLLECTOR_DEFAULT_SCAN_SECONDS
+                ),
+            )
+            for job in remaining
+        )
+    report.finished_at = get_kst_now()
+    return report
+
+
+def print_run_summary(report: RunReport):
+    """
+    Print per-user phase timings and the wall-clock time of the run
+    against the sequential estimate.
+
+    The sequential estimate is the sum of per-user durations, i.e. what the
+    same run would have taken with one account at a time.
+
+    Args:
+        report: Finished run report
+    """
+    summary = report.summary()
+    wall_clock = summary["wall_clock_s"]
+    sequential = summary["sequential_s"]
+    speedup = sequential / wall_clock if wall_clock > 0 else 0.0
+
+    print("\n" + "=" * 60)
+    print("실행 요약")
+    print("=" * 60)
+    for user in report.users:
+        phases = ", ".join(f"{k} {v / 1000:.1f}s" for k, v in user.phases.items())
+        print(
+            f"  {user.owner:<24} {user.outcome:<13} {user.total_ms / 1000:8.1f}s  "
+            f"{user.pages}페이지  ({phases})"
+        )
+    print("-" * 60)
+    print(f"  동시 처리 수: {report.workers}")
+    print(f"  결과: {summary['outcomes']}")
+    print(f"  실제 소요 시간: {wall_clock:.1f}s")
+    print(f"  순차 처리 예상 시간: {sequential:.1f}s")
+    print(f"  속도 향상: {speedup:.2f}x")
+    if report.startup_ms:
+        print(
+            f"  브라우저 시작: {sum(report.startup_ms.values()) / 1000:.1f}s "
+            f"(사용자/재시도마다 재시작했다면 약 {summary['startup_saved_s']:.1f}s 추가)"
+        )
+
+
+async def save_run_report(report: RunReport, async_session):
+    """
+    Write the run report to COLLECTOR_REPORT_DIR and the collection_run table.
+    A failure here is logged and never fails the run.
+
+    Args:
+        report: Finished run report
+        async_session: Session maker for the collector engine
+    """
+    report_dir = Path(get_settings().COLLECTOR_REPORT_DIR)
+    if not report_dir.is_absolute():
+        report_dir = project_root / report_dir
+
+    try:
+        path = report.write_jsonl(report_dir)
+        print(f"실행 리포트 저장: {path}")
+    except OSError as e:
+        print(f"실행 리포트 파일 저장 실패: {str(e)}")
+
+    try:
+        async with async_session() as session:
+            await collection_run_db.create_collection_runs(
+                session, report.run_id, report.users
+            )
+            await session.commit()
+    except Exception as e:
+        print(f"collection_run 테이블 저장 실패: {str(e)}")
+
+
+def print_schedule(plan: scheduler.SchedulePlan):
+    """
+    Print the start order and deferred owners of a run.
+
+    Args:
+        plan: Schedule of this run
+    """
+    print("수집 순서 (우선순위 = 데이터 경과 시간 / 예상 수집 시간):")
+    for index, item in enumerate(plan.scheduled, start=1):
+        print(
+            f"  {index:>3}. {item.owner:<24} 우선순위 {item.priority:8.2f}  "
+            f"경과 {item.staleness_h:6.1f}h  예상 {item.estimate_s:6.0f}s"
+        )
+    if plan.deferred:
+        owners = ", ".join(item.owner for item in plan.deferred)
+        print(f"예산 초과로 다음 실행으로 미룸 ({len(plan.deferred)}명): {owners}")
+    print()
+
+
+async def run_all_users(async_session, workers: int) -> RunReport | None:
+    """
+    Process every unfollower service user in this process.
+
+    Args:
+        async_session: Session maker for the collector engine
+        workers: Number of accounts processed concurrently
+
+    Returns:
+        Finished run report, or None if there are no users
+    """
     async with async_session() as session:
         # Fetch all unfollower service users
         print("\n언팔로워 서비스 사용자 조회 중...")
@@ -337,29 +1629,291 @@ async def main():
         result = await session.execute(select(UnfollowerServiceUser))
         users = result.scalars().all()
 
-        if not users:
-            print("unfollower_service_user 테이블에서 사용자를 찾을 수 없습니다")
+        stats = await collection_run_db.get_owner_stats(
+            session, [user.username for user in users]
+        )
+
+    if not users:
+        print("unfollower_service_user 테이블에서 사용자를 찾을 수 없습니다")
+        return None
+
+    print(f"처리할 사용자 {len(users)}명 발견 (동시 처리 수: {workers})\n")
+
+    deadline = run_deadline()
+    budget_minutes = get_settings().COLLECTOR_RUN_BUDGET_MINUTES
+    plan = scheduler.plan_run(
+        list(stats.values()),
+        get_kst_now(),
+        workers,
+        budget_minutes * 60 if budget_minutes > 0 else None,
+    )
+    print_schedule(plan)
+
+    users_by_name = {user.username: user for user in users}
+    report = RunReport(workers=workers)
+    report.users = [
+        deferred_metrics(item.owner, item.estimate_s) for item in plan.deferred
+    ]
+    async with browser_runtime(report) as browser:
+        # Semaphore는 FIFO이므로 gather 순서가 곧 시작 순서
+        semaphore = asyncio.Semaphore(workers)
+        results = await asyncio.gather(
+            *(
+                run_user(
+                    semaphore,
+                    browser,
+                    async_session,
+                    users_by_name[item.owner],
+                    item.estimate_s,
+                    deadline,
+                )
+                for item in plan.scheduled
+            )
+        )
+    report.users.extend(results)
+    report.finished_at = get_kst_now()
+    return report
+
+
+async def schedule_failed_collections(report: RunReport, async_session):
+    """
+    Queue owners whose collection failed in this run for a backoff retry.
+
+    Args:
+        report: Finished run report
+        async_session: Session maker for the collector engine
+    """
+    failed = [user for user in report.users if user.outcome in RETRYABLE_OUTCOMES]
+    if not failed:
+        return
+
+    try:
+        async with async_session() as session:
+            queued = 0
+            for user in failed:
+                queued += await retry_service.schedule_retry(
+                    session,
+                    RETRY_BATCH_COLLECT,
+                    user.owner,
+                    f"{graphql.INSTAGRAM_URL}/{user.owner}/",
+                    error=user.error or user.outcome,
+                )
+            await session.commit()
+        print(f"실패한 {len(failed)}명 중 {queued}명을 재시도 큐에 등록")
+    except Exception as e:
+        print(f"재시도 큐 등록 실패: {str(e)}")
+
+
+async def complete_collect_retries(async_session, owners: list[str]):
+    """
+    Complete pending collect retries of owners whose results reached the
+    database, so the retry worker does not scan them again.
+
+    Args:
+        async_session: Session maker for the collector engine
+        owners: Owners collected (or loaded from the spool) successfully
+    """
+    if not owners:
+        return
+
+    try:
+        async with async_session() as session:
+            completed = await retry_queue_db.complete_pending_retries(
+                session, RETRY_BATCH_COLLECT, owners
+            )
+            await session.commit()
+        if completed:
+            print(f"수집에 성공한 {completed}명의 대기 중인 재시도를 완료 처리")
+    except Exception as e:
+        print(f"재시도 큐 완료 처리 실패: {str(e)}")
+
+
+async def retry_loop(async_session):
+    """
+    Run due retry items one at a time until no item is pending any more.
+    Items whose next attempt is in the future keep the loop polling.
+
+    Args:
+        async_session: Session maker for the collector engine
+    """
+    settings = get_settings()
+    while True:
+        batch = await retry_service.process_due_retries(async_session, limit=1)
+        if batch.claimed:
+            continue
+
+        async with async_session() as session:
+            active = await retry_queue_db.count_active_retries(
+                session, [RETRY_BATCH_COLLECT]
+            )
+        if active == 0:
             return
+        await asyncio.sleep(settings.RETRY_POLL_SECONDS)
 
-        print(f"처리할 사용자 {len(users)}명 발견\n")
 
-        for user in users:
-            try:
-                password = decrypt_data(user.password)
-                totp_secret = (
-                    decrypt_data(user.totp_secret) if user.totp_secret else None
+async def run_retry_worker(async_session, workers: int) -> RunReport:
+    """
+    Re-run failed collections from verification_retry_queue on one shared
+    browser with `workers` concurrent retry loops.
+
+    Args:
+        async_session: Session maker for the collector engine
+        workers: Number of concurrent retry loops
+
+    Returns:
+        Finished run report
+    """
+    settings = get_settings()
+    report = RunReport(workers=workers)
+
+    async with async_session() as session:
+        released = await retry_queue_db.release_stale_retries(
+            session, [RETRY_BATCH_COLLECT], settings.RETRY_STALE_PROCESSING_SECONDS
+        )
+        await session.commit()
+    if released:
+        print(f"처리 중 멈춘 재시도 {released}건을 대기 상태로 되돌림")
+
+    async with browser_runtime(report) as browser:
+
+        async def retry_collect(item):
+            owner = item.shortcode
+            print(
+                f"[{owner}] 재시도 {item.retry_count + 1}/{settings.RETRY_MAX_ATTEMPTS}"
+            )
+            async with async_session() as session:
+                user = await unfollower_service_user_db.get_unfollower_service_user_by_username(
+                    session, owner
                 )
+            if user is None:
+                raise ValueError("unfollower_service_user not found")
+
+            # DB 저장 실패로 남은 스풀 결과가 있으면 다시 스캔하지 않고 적용만 함
+            diff = await apply_spooled_results(async_session, owner)
+            if diff is not None:
+                print(
+                    f"[{owner}] 스풀 결과 적용으로 재시도 완료: "
+                    f"{len(diff.added)}명 추가, {len(diff.removed)}명 삭제"
+                )
+                return
+
+            metrics = new_user_metrics(owner)
+            await collect_user(browser, async_session, user, metrics)
+            report.users.append(metrics)
+            if metrics.outcome not in COMPLETED_OUTCOMES:
+                raise RuntimeError(metrics.error or metrics.outcome)
 
-                await process_user(user.username, password, totp_secret, session)
+        retry_service.register_retry_handler(RETRY_BATCH_COLLECT, retry_collect)
+        await asyncio.gather(*(retry_loop(async_session) for _ in range(workers)))
 
-            except Exception as e:
-                print(f"[{user.username}] 사용자 처리 중 오류 발생: {str(e)}")
-                continue
+    report.finished_at = get_kst_now()
+    return report
+
+
+async def main(mode: str = "all") -> RunReport | None:
+    """
+    Run the collector in one of its modes (all, worker, retry, load, enqueue).
+
+    Args:
+        mode: Run mode selected on the command line
+
+    Returns:
+        Run report of the all/worker/retry modes, None otherwise
+    """
+    print("=" * 60)
+    print("언팔로워 수집 스크립트")
+    print("=" * 60)
+
+    # Setup database
+    settings = get_settings()
+    engine = create_collector_engine()
+    async_session = async_sessionmaker(engine, expire_on_commit=False)
+    workers = max(1, settings.COLLECTOR_WORKERS)
+    report = None
+
+    try:
+        if mode == "enqueue":
+            await enqueue_all_users(async_session)
+            return None
+
+        # 이전 실행에서 DB에 반영하지 못한 스캔 결과를 먼저 적용
+        await load_spool(async_session)
+        if mode == "load":
+            return None
+
+        if mode == "worker":
+            report = await run_worker(async_session, workers)
+        elif mode == "retry":
+            report = await run_retry_worker(async_session, workers)
+        else:
+            report = await run_all_users(async_session, workers)
+
+        if report is not None:
+            print_run_summary(report)
+            await save_run_report(report, async_session)
+            if mode != "retry":
+                # retry 모드의 실패는 retry_service가 backoff로 다시 예약함
+                await schedule_failed_collections(report, async_session)
+                await complete_collect_retries(
+                    async_session,
+                    [
+                        user.owner
+                        for user in report.users
+                        if user.outcome in COMPLETED_OUTCOMES
+                    ],
+                )
+        if settings.AVATAR_CACHE_ENABLED:
+            removed = await asyncio.to_thread(avatar_cache.evict_to_budget)
+            if removed:
+                print(f"프로필 사진 캐시 정리: {removed}개 삭제")
+    finally:
+        await engine.dispose()
 
     print("\n" + "=" * 60)
     print("스크립트 완료")
     print("=" * 60)
+    return report
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    parser = argparse.ArgumentParser(description="Instagram 언팔로워 수집")
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument(
+        "--enqueue",
+        action="store_true",
+        help="모든 사용자를 collection_job 큐에 등록하고 종료",
+    )
+    group.add_argument(
+        "--worker",
+        action="store_true",
+        help="collection_job 큐에서 작업을 점유하여 처리 (큐가 비면 종료)",
+    )
+    group.add_argument(
+        "--load",
+        action="store_true",
+        help="스풀에 남아 있는 스캔 결과를 DB에 적용하고 종료",
+    )
+    group.add_argument(
+        "--retry",
+        action="store_true",
+        help="재시도 큐의 실패한 수집을 backoff에 따라 다시 실행 (대기 중인 항목이 없으면 종료)",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="팔로잉/팔로워 수가 지난 스캔과 같아도 전체 스캔",
+    )
+    args = parser.parse_args()
+    FORCE_FULL_SCAN = args.force
+
+    if args.enqueue:
+        mode = "enqueue"
+    elif args.worker:
+        mode = "worker"
+    elif args.load:
+        mode = "load"
+    elif args.retry:
+        mode = "retry"
+    else:
+        mode = "all"
+    asyncio.run(main(mode))
@@ -0,0 +1,243 @@
+"""
+Benchmark the unfollower collector against the local fake Instagram server.
+
+Starts scripts/fake_instagram_server.py in-process, points the collector at
+it (INSTAGRAM_BASE_URL, temporary session/checkpoint/spool directories) and
+runs collect_unfollowers.main("all") once per round, so every round goes
+through the real entry point: shared browser runtime, precheck, scan,
+spool, database write and run report.
+
+The database must be a disposable Postgres (--database-url or
+COLLECTOR_BENCH_DATABASE_URL): all tables are dropped and recreated, and
+the synthetic accounts are registered as unfollower service users.
+
+Usage: python scripts/benchmark_collector.py --database-url postgresql+asyncpg://...
+           [--accounts 4] [--following 200 1000] [--workers 3] [--latency-ms 80]
+           [--jitter-ms 40] [--error-rate 0.0] [--two-factor] [--rounds 2]
+           [--force] [--no-pacing] [--headed] [--report-dir logs]
+
+With --rounds 2 the second round reuses the sessions saved by the first and,
+unless --force is given, skips the full scan through the follow-count
+precheck, so login, session-restore and precheck costs can be compared.
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import json
+import os
+import sys
+import tempfile
+import threading
+import urllib.request
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from scripts.fake_instagram_server import (
+    BENCH_PASSWORD,
+    BENCH_TOTP_SECRET,
+    FakeInstagramConfig,
+    make_server,
+)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Collector benchmark (no network)")
+    parser.add_argument(
+        "--database-url",
+        default=os.getenv("COLLECTOR_BENCH_DATABASE_URL"),
+        help="일회용 Postgres (모든 테이블을 지우고 다시 만듦)",
+    )
+    parser.add_argument("--accounts", type=int, default=4)
+    parser.add_argument("--following", type=int, nargs="+", default=[200, 1000])
+    parser.add_argument("--unfollower-percent", type=int, default=20)
+    parser.add_argument("--workers", type=int, default=3)
+    parser.add_argument("--latency-ms", type=int, default=80)
+    parser.add_argument("--jitter-ms", type=int, default=40)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--two-factor", action="store_true")
+    parser.add_argument("--rounds", type=int, default=1)
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="팔로잉/팔로워 수가 같아도 매 라운드 전체 스캔",
+    )
+    parser.add_argument(
+        "--no-pacing",
+        action="store_true",
+        help="적응형 페이지 속도 제한을 사실상 없애고 순수 처리량만 측정",
+    )
+    parser.add_argument("--headed", action="store_true")
+    parser.add_argument(
+        "--report-dir", default=None, help="실행 리포트(JSONL)를 저장할 디렉터리"
+    )
+    args = parser.parse_args()
+    if not args.database_url:
+        parser.error("--database-url 또는 COLLECTOR_BENCH_DATABASE_URL이 필요합니다")
+    return args
+
+
+def configure_environment(base_url: str, workdir: Path, args: argparse.Namespace):
+    """
+    Point the collector at the fake server before any core module is imported,
+    since settings are read once and cached.
+    """
+    from cryptography.fernet import Fernet
+
+    os.environ["DATABASE_URL"] = args.database_url
+    os.environ["INSTAGRAM_BASE_URL"] = base_url
+    os.environ["INSTAGRAM_SESSION_DIR"] = str(workdir / "sessions")
+    os.environ["COLLECTOR_CHECKPOINT_DIR"] = str(workdir / "checkpoints")
+    os.environ["COLLECTOR_SPOOL_DIR"] = str(workdir / "spool")
+    os.environ["COLLECTOR_REPORT_DIR"] = str(
+        Path(args.report_dir).resolve() if args.report_dir else workdir / "reports"
+    )
+    os.environ["COLLECTOR_RUN_BUDGET_MINUTES"] = "0"
+    os.environ["AVATAR_CACHE_ENABLED"] = "false"
+    os.environ["CACHE_INVALIDATION_LISTEN"] = "false"
+    os.environ["COLLECTOR_SCAN_MODE"] = "network"
+    os.environ["COLLECTOR_WORKERS"] = str(args.workers)
+    os.environ["ENCRYPTION_KEY"] = Fernet.generate_key().decode()
+    os.environ["HEADLESS"] = "false" if args.headed else "true"
+    if args.no_pacing:
+        for name in (
+            "COLLECTOR_PACING_START_RATE",
+            "COLLECTOR_PACING_MAX_RATE",
+            "COLLECTOR_EGRESS_MAX_RATE",
+        ):
+            os.environ[name] = "1000"
+        os.environ["COLLECTOR_PACING_BURST"] = "1000"
+
+
+def load_collector():
+    """Import playwright/collect_unfollowers.py as a module."""
+    path = project_root / "playwright" / "collect_unfollowers.py"
+    spec = importlib.util.spec_from_file_location("collect_unfollowers", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+async def prepare_database(usernames: list[str], two_factor: bool):
+    """
+    Recreate every table in the disposable database and register the
+    synthetic accounts as unfollower service users.
+
+    Args:
+        usernames: Synthetic account usernames
+        two_factor: Whether the accounts need a TOTP secret
+    """
+    from core.crypto import encrypt_data
+    from core.database import Base, create_collector_engine
+    from core.models import SnsRaiseUser, UnfollowerServiceUser
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+
+    engine = create_collector_engine()
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+            await conn.run_sync(Base.metadata.create_all)
+
+        async with async_sessionmaker(engine)() as session:
+            session.add_all([SnsRaiseUser(username=owner) for owner in usernames])
+            await session.flush()
+            session.add_all(
+                [
+                    UnfollowerServiceUser(
+                        username=owner,
+                        password=encrypt_data(BENCH_PASSWORD),
+                        totp_secret=(
+                            encrypt_data(BENCH_TOTP_SECRET) if two_factor else None
+                        ),
+                    )
+                    for owner in usernames
+                ]
+            )
+            await session.commit()
+    finally:
+        await engine.dispose()
+
+
+def print_round(round_no: int, report, server_requests: dict):
+    """Print per-account and aggregate throughput of one round."""
+    summary = report.summary()
+    wall_clock = summary["wall_clock_s"] or 1e-9
+
+    print(f"\n=== Round {round_no} ===")
+    print(
+        f"{'account':<12} {'outcome':<13} {'following':>9} {'pages':>6} "
+        f"{'login s':>8} {'scan s':>8} {'total s':>8} {'follow/s':>9}"
+    )
+    for user in report.users:
+        scan_s = user.phases.get("scan", 0.0) / 1000
+        rate = (user.following_count or 0) / scan_s if scan_s else 0.0
+        print(
+            f"{user.owner:<12} {user.outcome:<13} {user.following_count or 0:>9} "
+            f"{user.pages:>6} {user.phases.get('login', 0.0) / 1000:>8.2f} "
+            f"{scan_s:>8.2f} {user.total_ms / 1000:>8.2f} {rate:>9.1f}"
+        )
+
+    following = sum(user.following_count or 0 for user in report.users)
+    print("-" * 80)
+    print(f"workers: {report.workers}, outcomes: {summary['outcomes']}")
+    print(
+        f"wall clock {wall_clock:.2f}s, sequential {summary['sequential_s']:.2f}s, "
+        f"{summary['pages'] / wall_clock:.1f} pages/s, "
+        f"{following / wall_clock:.1f} following/s"
+    )
+    print(f"startup avoided by the shared browser: ~{summary['startup_saved_s']:.2f}s")
+    print(f"server requests: {server_requests}")
+
+
+def fetch_server_requests(base_url: str) -> dict:
+    """Request counters of the fake server."""
+    with urllib.request.urlopen(f"{base_url}/__stats") as response:
+        return json.loads(response.read())["requests"]
+
+
+async def main():
+    args = parse_args()
+    config = FakeInstagramConfig(
+        accounts=args.accounts,
+        following=args.following,
+        unfollower_percent=args.unfollower_percent,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        two_factor=args.two_factor,
+    )
+    server = make_server(config)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_port}"
+    print(f"가짜 Instagram 서버: {base_url}")
+
+    with tempfile.TemporaryDirectory(prefix="collector_bench_") as workdir:
+        configure_environment(base_url, Path(workdir), args)
+        await prepare_database(config.usernames(), args.two_factor)
+        collector = load_collector()
+        collector.FORCE_FULL_SCAN = args.force
+
+        for round_no in range(1, args.rounds + 1):
+            before = fetch_server_requests(base_url)
+            report = await collector.main("all")
+            after = fetch_server_requests(base_url)
+            if report is None:
+                print("수집할 사용자가 없어 벤치마크를 중단합니다")
+                break
+
+            delta = {
+                kind: count - before.get(kind, 0)
+                for kind, count in after.items()
+                if count - before.get(kind, 0)
+            }
+            print_round(round_no, report, delta)
+
+    server.shutdown()
+    server.server_close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
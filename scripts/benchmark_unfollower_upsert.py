@@ -0,0 +1,97 @@
+"""
+Benchmark the chunked unfollower upsert against the configured database.
+Every run happens inside a transaction that is rolled back, so no data is kept.
+
+Usage: python scripts/benchmark_unfollower_upsert.py [--rows 1000 10000 100000]
+                                                     [--chunk-sizes 500 2000 5000]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.database import close_db, get_session_maker
+from core.db import unfollower_db
+from core.models import SnsRaiseUser
+
+BENCH_OWNER = "__bench_upsert__"
+
+
+def make_unfollowers(count: int) -> list[dict]:
+    """Generate synthetic unfollower rows."""
+    return [
+        {
+            "unfollower_username": f"bench_user_{i:06d}",
+            "unfollower_fullname": f"Bench User {i}",
+            "unfollower_profile_url": f"https://scontent.cdninstagram.com/v/t51/{i}.jpg",
+        }
+        for i in range(count)
+    ]
+
+
+async def run_once(rows: int, chunk_size: int) -> float:
+    """
+    Upsert `rows` synthetic unfollowers once and return elapsed seconds.
+    The transaction is rolled back afterwards.
+    """
+    unfollowers = make_unfollowers(rows)
+    session_maker = get_session_maker()
+    async with session_maker() as db:
+        try:
+            db.add(SnsRaiseUser(username=BENCH_OWNER))
+            await db.flush()
+
+            started = time.perf_counter()
+            await unfollower_db.upsert_unfollowers(
+                db, BENCH_OWNER, unfollowers, chunk_size=chunk_size
+            )
+            return time.perf_counter() - started
+        finally:
+            await db.rollback()
+
+
+async def run_benchmark(row_counts: list[int], chunk_sizes: list[int]):
+    """Run every (rows, chunk size) combination and print a throughput table."""
+    print(f"{'rows':>8} {'chunk':>6} {'statements':>10} {'seconds':>9} {'rows/s':>10}")
+    print("-" * 48)
+    try:
+        for rows in row_counts:
+            for chunk_size in chunk_sizes:
+                effective = min(
+                    chunk_size,
+                    unfollower_db.MAX_BIND_PARAMS
+                    // unfollower_db.UPSERT_PARAMS_PER_ROW,
+                )
+                statements = -(-rows // effective)
+                elapsed = await run_once(rows, chunk_size)
+                print(
+                    f"{rows:>8} {effective:>6} {statements:>10} "
+                    f"{elapsed:>9.2f} {rows / elapsed:>10.0f}"
+                )
+    finally:
+        await close_db()
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument(
+        "--chunk-sizes",
+        type=int,
+        nargs="+",
+        default=[500, unfollower_db.UPSERT_CHUNK_SIZE, 5000],
+    )
+    args = parser.parse_args()
+
+    print("=== Unfollower Upsert Benchmark ===\n")
+    asyncio.run(run_benchmark(args.rows, args.chunk_sizes))
+
+
+if __name__ == "__main__":
+    main()
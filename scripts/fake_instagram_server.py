@@ -0,0 +1,475 @@
+"""
+Local stand-in for the parts of Instagram the unfollower collector touches:
+the login form, the 2FA step, the home feed and paginated graphql/query
+responses of the following and follower lists, for synthetic accounts.
+
+Accounts are named bench_0000, bench_0001, ... and share one password (and
+one TOTP secret when --two-factor is set). Each account follows the number
+of accounts given by --following (cycled over the accounts), and
+--unfollower-percent of them do not follow back. The followers are the
+accounts that do follow back plus one extra follower per ten followings
+that the owner does not follow.
+
+Usage: python scripts/fake_instagram_server.py [--port 8765] [--accounts 4]
+           [--following 200 1000] [--latency-ms 80] [--jitter-ms 40]
+           [--error-rate 0.02] [--two-factor]
+
+Point the collector at it with INSTAGRAM_BASE_URL=http://127.0.0.1:8765
+"""
+
+import argparse
+import json
+import random
+import secrets
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pyotp
+
+BENCH_PASSWORD = "bench-password"
+BENCH_TOTP_SECRET = "JBSWY3DPEHPK3PXP"
+# core.collector.graphql.FOLLOWERS_QUERY_HASH (import하면 설정이 먼저 캐시됨)
+FOLLOWERS_QUERY_HASH = "c76146de99bb02f6415203be841dd25a"
+# 1x1 transparent PNG, lets the request-blocking policy be measured
+PIXEL_PNG = bytes.fromhex(
+    "89504e470d0a1a0a0000000d4948445200000001000000010806000000"
+    "1f15c4890000000d49444154789c6360000002000154a24f5d0000000049454e44ae426082"
+)
+
+
+@dataclass
+class FakeInstagramConfig:
+    """Synthetic accounts and network behaviour of the fake server."""
+
+    accounts: int = 4
+    following: list[int] = field(default_factory=lambda: [200, 1000])
+    unfollower_percent: int = 20
+    latency_ms: int = 80
+    jitter_ms: int = 40
+    error_rate: float = 0.0
+    two_factor: bool = False
+    seed: int = 1
+
+    def usernames(self) -> list[str]:
+        """Usernames of all synthetic accounts."""
+        return [f"bench_{i:04d}" for i in range(self.accounts)]
+
+    def following_count(self, username: str) -> int:
+        """Number of accounts a synthetic account follows."""
+        index = int(username.rsplit("_", 1)[1])
+        return self.following[index % len(self.following)]
+
+    def follows_back(self, index: int) -> bool:
+        """Whether the index-th followed account follows its owner back."""
+        # 같은 계정은 실행마다 같은 결과가 되도록 인덱스로 결정
+        return (index * 37) % 100 >= self.unfollower_percent
+
+    def followers(self, username: str) -> list[str]:
+        """Usernames following a synthetic account, in a stable order."""
+        following = self.following_count(username)
+        mutual = [
+            f"{username}_f{i:05d}" for i in range(following) if self.follows_back(i)
+        ]
+        fans = [f"{username}_r{i:05d}" for i in range(following // 10)]
+        return mutual + fans
+
+    def user_id(self, username: str) -> str:
+        """Numeric id of a synthetic account (the ds_user_id cookie)."""
+        return str(10_000_000 + int(username.rsplit("_", 1)[1]))
+
+
+class FakeInstagramState:
+    """Sessions and request counters shared by all handler threads."""
+
+    def __init__(self, config: FakeInstagramConfig):
+        self.config = config
+        self.rng = random.Random(config.seed)
+        self.lock = threading.Lock()
+        self.sessions: dict[str, str] = {}
+        self.requests: Counter = Counter()
+        self.owners_by_id = {
+            config.user_id(username): username for username in config.usernames()
+        }
+
+    def count(self, kind: str) -> None:
+        with self.lock:
+            self.requests[kind] += 1
+
+    def should_fail(self) -> bool:
+        with self.lock:
+            return self.rng.random() < self.config.error_rate
+
+    def delay(self) -> None:
+        """Sleep for the configured latency plus uniform jitter."""
+        with self.lock:
+            jitter = self.rng.uniform(0, self.config.jitter_ms)
+        time.sleep((self.config.latency_ms + jitter) / 1000)
+
+    def new_session(self, username: str) -> str:
+        token = secrets.token_hex(16)
+        with self.lock:
+            self.sessions[token] = username
+        return token
+
+    def session_user(self, token: str | None) -> str | None:
+        with self.lock:
+            return self.sessions.get(token or "")
+
+
+def following_page(
+    config: FakeInstagramConfig,
+    base_url: str,
+    owner: str,
+    first: int,
+    after: str | None,
+) -> dict:
+    """
+    Build one graphql/query page of the edge_follow connection.
+
+    Args:
+        config: Server configuration
+        base_url: Base URL of the server, used for profile picture URLs
+        owner: Username whose following list is paged
+        first: Page size requested by the client
+        after: end_cursor of the previous page (an offset here)
+
+    Returns:
+        Response payload shaped like Instagram's
+    """
+    total = config.following_count(owner)
+    start = int(after) if after else 0
+    end = min(start + first, total)
+    edges = []
+    for i in range(start, end):
+        username = f"{owner}_f{i:05d}"
+        edges.append(
+            {
+                "node": {
+                    "id": str(20_000_000 + i),
+                    "username": username,
+                    "full_name": f"Following {i}",
+                    "profile_pic_url": f"{base_url}/static/{username}.png",
+                    "is_verified": False,
+                    "follows_viewer": config.follows_back(i),
+                    "followed_by_viewer": True,
+                    "requested_by_viewer": False,
+                }
+            }
+        )
+
+    return {
+        "data": {
+            "user": {
+                "edge_follow": {
+                    "count": total,
+                    "page_info": {
+                        "has_next_page": end < total,
+                        "end_cursor": str(end) if end < total else None,
+                    },
+                    "edges": edges,
+                }
+            }
+        },
+        "status": "ok",
+    }
+
+
+def followers_page(
+    config: FakeInstagramConfig,
+    base_url: str,
+    owner: str,
+    first: int,
+    after: str | None,
+) -> dict:
+    """
+    Build one graphql/query page of the edge_followed_by connection.
+
+    Args:
+        config: Server configuration
+        base_url: Base URL of the server, used for profile picture URLs
+        owner: Username whose follower list is paged
+        first: Page size requested by the client
+        after: end_cursor of the previous page (an offset here)
+
+    Returns:
+        Response payload shaped like Instagram's
+    """
+    followers = config.followers(owner)
+    start = int(after) if after else 0
+    end = min(start + first, len(followers))
+    edges = [
+        {
+            "node": {
+                "id": str(30_000_000 + i),
+                "username": followers[i],
+                "full_name": f"Follower {i}",
+                "profile_pic_url": f"{base_url}/static/{followers[i]}.png",
+                "is_verified": False,
+                "follows_viewer": True,
+                # 맞팔로우(_f) 계정만 owner가 팔로우함
+                "followed_by_viewer": "_f" in followers[i][len(owner) :],
+                "requested_by_viewer": False,
+            }
+        }
+        for i in range(start, end)
+    ]
+
+    return {
+        "data": {
+            "user": {
+                "edge_followed_by": {
+                    "count": len(followers),
+                    "page_info": {
+                        "has_next_page": end < len(followers),
+                        "end_cursor": str(end) if end < len(followers) else None,
+                    },
+                    "edges": edges,
+                }
+            }
+        },
+        "status": "ok",
+    }
+
+
+LOGIN_PAGE = """<!doctype html><html><body>
+<form method="post" action="/accounts/login/">
+<input name="username"><input name="password" type="password">
+<button type="submit">Log in</button>
+</form>{error}</body></html>"""
+
+TWO_FACTOR_PAGE = """<!doctype html><html><body>
+<form method="post" action="/accounts/login/two_factor/">
+<input type="hidden" name="username" value="{username}">
+<input name="verificationCode"><button type="submit">Confirm</button>
+</form></body></html>"""
+
+HOME_PAGE = """<!doctype html><html><body>
+<svg aria-label="Home"></svg><img src="/static/pixel.png">
+</body></html>"""
+
+
+class FakeInstagramHandler(BaseHTTPRequestHandler):
+    """Request handler; the server's state is attached to the class."""
+
+    state: FakeInstagramState
+    base_url = ""
+
+    def log_message(self, format, *args):
+        pass
+
+    def _cookies(self) -> SimpleCookie:
+        return SimpleCookie(self.headers.get("Cookie", ""))
+
+    def _session_user(self) -> str | None:
+        morsel = self._cookies().get("sessionid")
+        return self.state.session_user(morsel.value if morsel else None)
+
+    def _send(self, status: int, body: bytes, content_type: str, headers=None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in headers or []:
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _html(self, html: str, headers=None):
+        self._send(200, html.encode(), "text/html; charset=utf-8", headers)
+
+    def _json(self, status: int, payload: dict):
+        self._send(status, json.dumps(payload).encode(), "application/json")
+
+    def _redirect(self, location: str, headers=None):
+        self._send(302, b"", "text/plain", [("Location", location), *(headers or [])])
+
+    def _form(self) -> dict[str, str]:
+        length = int(self.headers.get("Content-Length", 0))
+        fields = parse_qs(self.rfile.read(length).decode())
+        return {key: values[0] for key, values in fields.items()}
+
+    def _login_cookies(self, username: str) -> list[tuple[str, str]]:
+        token = self.state.new_session(username)
+        user_id = self.state.config.user_id(username)
+        return [
+            ("Set-Cookie", f"sessionid={token}; Path=/; HttpOnly"),
+            ("Set-Cookie", f"ds_user_id={user_id}; Path=/"),
+            ("Set-Cookie", f"csrftoken={secrets.token_hex(8)}; Path=/"),
+        ]
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        config = self.state.config
+
+        if url.path == "/__stats":
+            with self.state.lock:
+                requests = dict(self.state.requests)
+            self._json(
+                200, {"requests": requests, "sessions": len(self.state.sessions)}
+            )
+            return
+
+        if url.path.startswith("/static/"):
+            self.state.count("static")
+            self._send(200, PIXEL_PNG, "image/png")
+            return
+
+        self.state.delay()
+
+        if url.path == "/accounts/login/":
+            self.state.count("login_page")
+            self._html(LOGIN_PAGE.format(error=""))
+            return
+
+        if url.path == "/accounts/login/two_factor/":
+            self.state.count("two_factor_page")
+            username = parse_qs(url.query).get("username", [""])[0]
+            self._html(TWO_FACTOR_PAGE.format(username=username))
+            return
+
+        if url.path == "/graphql/query/":
+            self.state.count("graphql")
+            owner = self._session_user()
+            if owner is None:
+                self._json(401, {"message": "login_required", "status": "fail"})
+                return
+            if self.state.should_fail():
+                self.state.count("graphql_429")
+                self._json(
+                    429, {"message": "Please wait a few minutes", "status": "fail"}
+                )
+                return
+
+            query = parse_qs(url.query)
+            variables = json.loads(query["variables"][0])
+            target = self.state.owners_by_id.get(variables["id"])
+            if target is None:
+                self._json(404, {"message": "user not found", "status": "fail"})
+                return
+            is_followers = query.get("query_hash", [""])[0] == FOLLOWERS_QUERY_HASH
+            build_page = followers_page if is_followers else following_page
+            self._json(
+                200,
+                build_page(
+                    config,
+                    self.base_url,
+                    target,
+                    int(variables["first"]),
+                    variables.get("after"),
+                ),
+            )
+            return
+
+        if url.path == "/":
+            self.state.count("home")
+            if self._session_user() is None:
+                self._redirect("/accounts/login/")
+                return
+            self._html(HOME_PAGE)
+            return
+
+        self.state.count("profile")
+        self._html(HOME_PAGE)
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        config = self.state.config
+        self.state.delay()
+        form = self._form()
+        username = form.get("username", "")
+
+        if url.path == "/accounts/login/":
+            self.state.count("login_submit")
+            if (
+                username not in self.state.owners_by_id.values()
+                or form.get("password") != BENCH_PASSWORD
+            ):
+                self._html(
+                    LOGIN_PAGE.format(
+                        error='<div id="slfErrorAlert">잘못된 비밀번호입니다.</div>'
+                    )
+                )
+                return
+            if config.two_factor:
+                self._redirect(f"/accounts/login/two_factor/?username={username}")
+                return
+            self._redirect("/", self._login_cookies(username))
+            return
+
+        if url.path == "/accounts/login/two_factor/":
+            self.state.count("two_factor_submit")
+            code = form.get("verificationCode", "")
+            if not pyotp.TOTP(BENCH_TOTP_SECRET).verify(code, valid_window=1):
+                self._html(TWO_FACTOR_PAGE.format(username=username))
+                return
+            self._redirect("/", self._login_cookies(username))
+            return
+
+        self._json(404, {"message": "not found", "status": "fail"})
+
+
+def make_server(
+    config: FakeInstagramConfig, host: str = "127.0.0.1", port: int = 0
+) -> ThreadingHTTPServer:
+    """
+    Create (but do not start) a fake Instagram server.
+
+    Args:
+        config: Synthetic accounts and network behaviour
+        host: Bind address
+        port: Bind port (0 picks a free port)
+
+    Returns:
+        ThreadingHTTPServer; its base URL is http://{host}:{server_port}
+    """
+    handler = type(
+        "BoundFakeInstagramHandler",
+        (FakeInstagramHandler,),
+        {"state": FakeInstagramState(config)},
+    )
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    handler.base_url = f"http://{host}:{server.server_port}"
+    return server
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Fake Instagram server for benchmarks")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--accounts", type=int, default=4)
+    parser.add_argument("--following", type=int, nargs="+", default=[200, 1000])
+    parser.add_argument("--unfollower-percent", type=int, default=20)
+    parser.add_argument("--latency-ms", type=int, default=80)
+    parser.add_argument("--jitter-ms", type=int, default=40)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--two-factor", action="store_true")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    config = FakeInstagramConfig(
+        accounts=args.accounts,
+        following=args.following,
+        unfollower_percent=args.unfollower_percent,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        two_factor=args.two_factor,
+    )
+    server = make_server(config, args.host, args.port)
+    print(f"가짜 Instagram 서버: http://{args.host}:{server.server_port}")
+    print(f"계정: {', '.join(config.usernames())} / 비밀번호: {BENCH_PASSWORD}")
+    if config.two_factor:
+        print(f"TOTP 시크릿: {BENCH_TOTP_SECRET}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
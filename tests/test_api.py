@@ -1,7 +1,15 @@
 """Basic API tests."""
 
+import asyncio
+import json
+from datetime import datetime
+from types import SimpleNamespace
 import pytest
 from httpx import AsyncClient
+from starlette.requests import Request
+from backend.routes import public
+from core import cache_events, conditional, response_cache
+from core.db import collection_run_db
 
 
 @pytest.mark.asyncio
@@ -46,3 +54,150 @@ async def test_admin_endpoint_without_token(client: AsyncClient):
     """Test admin endpoint without authentication."""
     response = await client.get("/api/admin/sns-users")
     assert response.status_code == 403  # Forbidden without token
+
+
+def test_conditional_get_validators():
+    """Only If-None-Match is honoured; If-Modified-Since alone never yields 304."""
+
+    def request(**headers):
+        raw = [(k.replace("_", "-").encode(), v.encode()) for k, v in headers.items()]
+        return Request({"type": "http", "headers": raw})
+
+    validator = conditional.make_validator(3, 10)
+    assert "Last-Modified" not in validator.headers
+    since = "Sat, 17 Oct 2026 00:00:00 GMT"
+
+    assert conditional.is_not_modified(request(if_none_match=validator.etag), validator)
+    assert conditional.is_not_modified(
+        request(if_none_match=f'W/"other", {validator.etag}'), validator
+    )
+    assert not conditional.is_not_modified(request(if_modified_since=since), validator)
+    assert not conditional.is_not_modified(
+        request(if_none_match='W/"stale"', if_modified_since=since), validator
+    )
+    assert not conditional.is_not_modified(request(), validator)
+    assert conditional.make_validator(3, 11).etag != validator.etag
+
+
+@pytest.mark.asyncio
+async def test_response_cache_lru_tags_and_single_flight():
+    """Concurrent misses share one load; tags and LRU drop entries."""
+    cache = response_cache.ResponseCache(max_entries=2, ttl_seconds=60)
+    loads = []
+
+    async def loader():
+        loads.append(1)
+        await asyncio.sleep(0)
+        return b"[]"
+
+    results = await asyncio.gather(
+        *(cache.get_or_load("a", ["announcements"], loader) for _ in range(3))
+    )
+    assert [body for body, _ in results] == [b"[]"] * 3
+    assert len(loads) == 1
+    assert await cache.get_or_load("a", ["announcements"], loader) == (b"[]", True)
+
+    cache.set("b", b"1", ["unfollowers:x"])
+    cache.set("c", b"2", ["unfollowers:y"])
+    assert cache.get("a") is None  # LRU
+    assert cache.invalidate_tags("unfollowers:x") == 1
+    assert cache.get("b") is None and cache.get("c") == b"2"
+
+    async def stale_loader():
+        # 로드 중에 관리자가 수정
+        cache.invalidate_tags("announcements")
+        return b"old"
+
+    assert await cache.get_or_load("d", ["announcements"], stale_loader) == (
+        b"old",
+        False,
+    )
+    assert cache.get("d") is None
+    assert cache.report()["hits"] == 1
+
+
+def test_invalidation_listener_applies_other_processes_events():
+    """Notifications from other processes evict their tags; own ones are skipped."""
+    cache = response_cache.ResponseCache(max_entries=10, ttl_seconds=60)
+    listener = cache_events.InvalidationListener(None, cache, "test")
+    cache.set("a", b"[]", [response_cache.TAG_ANNOUNCEMENTS])
+    cache.set("b", b"[]", [response_cache.unfollowers_tag("x")])
+
+    listener.handle(
+        json.dumps({"origin": cache_events.ORIGIN, "tags": ["announcements"]})
+    )
+    assert cache.get("a") == b"[]"
+
+    listener.handle(json.dumps({"origin": "other", "tags": ["announcements"]}))
+    listener.handle("not json")
+    assert cache.get("a") is None and cache.get("b") == b"[]"
+    assert listener.received == 2
+
+
+@pytest.mark.asyncio
+async def test_open_history_entries_take_last_seen_from_latest_run(monkeypatch):
+    """Open entries are last seen by the latest completed run, not a stored column."""
+    last_run = datetime(2026, 10, 17, 9)
+
+    async def get_last_completed_at(db, owner):
+        return last_run
+
+    monkeypatch.setattr(
+        collection_run_db, "get_last_completed_at", get_last_completed_at
+    )
+
+    def entry(username, first_seen_at, last_seen_at=None, resolved_at=None):
+        return SimpleNamespace(
+            unfollower_username=username,
+            unfollower_fullname="",
+            first_seen_at=first_seen_at,
+            last_seen_at=last_seen_at,
+            resolved_at=resolved_at,
+        )
+
+    responses = await public._history_entries(
+        None,
+        "owner",
+        [
+            entry("open", datetime(2026, 10, 1)),
+            entry("opened_now", datetime(2026, 10, 17, 10)),
+            entry(
+                "resolved",
+                datetime(2026, 9, 1),
+                datetime(2026, 9, 20),
+                datetime(2026, 9, 21),
+            ),
+        ],
+    )
+
+    assert [r.last_seen_at for r in responses] == [
+        last_run,
+        datetime(2026, 10, 17, 10),
+        datetime(2026, 9, 20),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_response_cache_waiter_survives_cancelled_leader():
+    """A waiter loads itself when the caller it was waiting on is cancelled."""
+    cache = response_cache.ResponseCache(max_entries=10, ttl_seconds=60)
+    started = asyncio.Event()
+
+    async def stuck_loader():
+        started.set()
+        await asyncio.Event().wait()
+
+    async def follower_loader():
+        return b"[]"
+
+    leader = asyncio.create_task(cache.get_or_load("a", [], stuck_loader))
+    await started.wait()
+    follower = asyncio.create_task(cache.get_or_load("a", [], follower_loader))
+    await asyncio.sleep(0)
+
+    leader.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+
+    assert await follower == (b"[]", False)
+    assert cache.get("a") == b"[]"
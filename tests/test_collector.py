@@ -0,0 +1,403 @@
+"""Unfollower collector tests (no browser or database required)."""
+
+import io
+import json
+import os
+import random
+from datetime import datetime, timedelta
+import pytest
+from cryptography.fernet import Fernet
+from PIL import Image
+from core import avatar_cache
+from core.config import get_settings
+from core.collector import (
+    checkpoint,
+    graphql,
+    metrics,
+    pacing,
+    precheck,
+    routing,
+    scheduler,
+    session_store,
+    snapshot,
+    spool,
+)
+from core.services import retry_service, unfollower_service
+
+
+@pytest.fixture
+def collector_settings(tmp_path, monkeypatch):
+    """Point collector settings at a temporary directory."""
+    monkeypatch.setenv("INSTAGRAM_SESSION_DIR", str(tmp_path / "sessions"))
+    monkeypatch.setenv("COLLECTOR_CHECKPOINT_DIR", str(tmp_path / "checkpoints"))
+    monkeypatch.setenv("ENCRYPTION_KEY", Fernet.generate_key().decode())
+    get_settings.cache_clear()
+    yield get_settings()
+    get_settings.cache_clear()
+
+
+def test_session_store_round_trip(collector_settings):
+    """Saved sessions are encrypted on disk and load back unchanged."""
+    state = {"cookies": [{"name": "sessionid", "value": "abc"}], "origins": []}
+    session_store.save_session("tester", state)
+
+    raw = session_store._session_path("tester").read_text(encoding="utf-8")
+    assert "sessionid" not in raw
+    assert session_store.load_session("tester") == state
+
+
+def test_session_store_evicts_unreadable_session(collector_settings):
+    """A session that cannot be decrypted is evicted instead of returned."""
+    path = session_store._session_path("tester")
+    path.parent.mkdir(parents=True)
+    path.write_text("not-a-fernet-token", encoding="utf-8")
+
+    assert session_store.load_session("tester") is None
+    assert not path.exists()
+
+
+def test_follow_pages_yield_unfollowers_through_snapshot():
+    """Followed accounts missing from the follower pages are unfollowers."""
+
+    def connection_payload(edge, users, has_next_page=False, end_cursor=None):
+        return {
+            "data": {
+                "user": {
+                    edge: {
+                        "count": len(users),
+                        "page_info": {
+                            "has_next_page": has_next_page,
+                            "end_cursor": end_cursor,
+                        },
+                        "edges": [{"node": user} for user in users],
+                    }
+                }
+            }
+        }
+
+    mutual = {
+        "username": "mutual",
+        "full_name": "Mutual",
+        "profile_pic_url": "https://cdn/m.jpg",
+    }
+    one_way = {
+        "username": "one_way",
+        "full_name": None,
+        "profile_pic_url": "https://cdn/o.jpg",
+    }
+    fan = {"username": "fan", "full_name": "Fan", "profile_pic_url": ""}
+
+    following_page = graphql.parse_following_page(
+        connection_payload(graphql.EDGE_FOLLOW, [mutual, one_way], True, "QVFD"),
+        graphql.EDGE_FOLLOW,
+    )
+    followers_page = graphql.parse_following_page(
+        connection_payload(graphql.EDGE_FOLLOWED_BY, [mutual, fan]),
+        graphql.EDGE_FOLLOWED_BY,
+    )
+
+    assert following_page.count == 2
+    assert following_page.has_next_page is True
+    assert following_page.end_cursor == "QVFD"
+    assert followers_page.has_next_page is False
+
+    follow_snapshot = snapshot.FollowSnapshot(
+        following=[
+            snapshot.compact_user(checkpoint.compact_node(node))
+            for node in following_page.nodes
+        ],
+        followers=[
+            snapshot.compact_user(checkpoint.compact_node(node))
+            for node in followers_page.nodes
+        ],
+    )
+    analysis = snapshot.analyze(follow_snapshot)
+
+    assert [snapshot.to_unfollower(user) for user in analysis.not_following_back] == [
+        {
+            "unfollower_username": "one_way",
+            "unfollower_fullname": "",
+            "unfollower_profile_url": "https://cdn/o.jpg",
+        }
+    ]
+    assert [user[0] for user in analysis.not_followed_back] == ["fan"]
+
+
+def test_parse_following_page_rejects_unexpected_payload():
+    """Error payloads (e.g. rate limits) are not mistaken for empty pages."""
+    with pytest.raises(ValueError):
+        graphql.parse_following_page({"message": "Please wait", "status": "fail"})
+
+
+def test_compute_unfollower_diff():
+    """Only new, gone and changed unfollowers end up in the diff."""
+    existing = {
+        "kept": ("Kept", "https://cdn/k.jpg"),
+        "renamed": ("Old Name", "https://cdn/r.jpg"),
+        "gone": ("Gone", "https://cdn/g.jpg"),
+    }
+    scanned = [
+        {
+            "unfollower_username": "kept",
+            "unfollower_fullname": "Kept",
+            "unfollower_profile_url": "https://cdn/k.jpg",
+        },
+        {
+            "unfollower_username": "renamed",
+            "unfollower_fullname": "New Name",
+            "unfollower_profile_url": "https://cdn/r.jpg",
+        },
+        {
+            "unfollower_username": "new",
+            "unfollower_fullname": "New",
+            "unfollower_profile_url": "https://cdn/n.jpg",
+        },
+    ]
+
+    diff = unfollower_service.compute_unfollower_diff(existing, scanned)
+
+    assert [u["unfollower_username"] for u in diff.added] == ["new"]
+    assert diff.removed == ["gone"]
+    assert [u["unfollower_username"] for u in diff.updated] == ["renamed"]
+    assert diff.avatar_changed == set()
+    assert diff.unchanged == 1
+
+    # 서명(query string)만 바뀐 URL은 같은 사진, 경로가 바뀌면 새 사진
+    stored = {
+        "kept": ("Kept", "https://cdn/k.jpg?oh=1"),
+        "renamed": ("New Name", "https://cdn/old.jpg?oh=1"),
+    }
+    rescanned = [
+        {**scanned[0], "unfollower_profile_url": "https://cdn/k.jpg?oh=2"},
+        {**scanned[1], "unfollower_profile_url": "https://cdn/r.jpg?oh=2"},
+    ]
+    diff = unfollower_service.compute_unfollower_diff(stored, rescanned)
+    assert [u["unfollower_username"] for u in diff.updated] == ["kept", "renamed"]
+    assert diff.avatar_changed == {"renamed"}
+
+
+def test_checkpoint_resumes_from_last_complete_page(collector_settings):
+    """A torn trailing line is cut off and the last full page is resumed."""
+    checkpoint.start_checkpoint("owner", "42")
+    checkpoint.append_page("owner", "c1", True, 3, [{"username": "a", "x": 1}])
+    checkpoint.append_page("owner", "c2", True, 3, [{"username": "b"}])
+    with open(checkpoint._checkpoint_path("owner"), "a", encoding="utf-8") as f:
+        f.write('{"end_cursor": "c3", "nod')
+
+    saved = checkpoint.load_checkpoint("owner", "42")
+
+    assert saved.end_cursor == "c2"
+    assert saved.pages == 2
+    assert [node["username"] for node in saved.nodes] == ["a", "b"]
+    assert "x" not in saved.nodes[0]
+
+    # 잘린 줄은 잘려 나가고 이어서 추가한 페이지가 그대로 읽힘
+    checkpoint.append_page("owner", "c3", False, 3, [{"username": "c"}])
+    resumed = checkpoint.load_checkpoint("owner", "42")
+
+    assert resumed.end_cursor == "c3"
+    assert resumed.pages == 3
+    assert [node["username"] for node in resumed.nodes] == ["a", "b", "c"]
+
+
+def test_checkpoint_for_other_viewer_is_discarded(collector_settings):
+    """Cursors belong to one viewer id and are never reused for another."""
+    checkpoint.start_checkpoint("owner", "42")
+    checkpoint.append_page("owner", "c1", True, 3, [{"username": "a"}])
+
+    assert checkpoint.load_checkpoint("owner", "43") is None
+    assert not checkpoint._checkpoint_path("owner").exists()
+
+
+def test_blocking_policy_classifies_requests():
+    """Media and analytics hosts are blocked; GraphQL and scripts are not."""
+    policy = routing.BlockingPolicy(hosts=("google-analytics.com",))
+
+    assert policy.classify("https://scontent.cdninstagram.com/a.jpg", "image") == (
+        "image"
+    )
+    assert policy.classify("https://www.google-analytics.com/g/collect", "xhr") == (
+        "analytics"
+    )
+    assert policy.classify("https://www.instagram.com/graphql/query/", "fetch") is None
+    assert policy.classify("https://static.cdninstagram.com/app.js", "script") is None
+
+
+def test_run_report_writes_user_lines_and_summary(tmp_path):
+    """Each owner is one JSONL line, followed by the run summary line."""
+    user = metrics.UserRunMetrics(owner="owner")
+    with user.phase("scan"):
+        user.pages = 3
+    user.requests.requests["image"] += 2
+    user.finish(metrics.OUTCOME_SUCCESS)
+    report = metrics.RunReport(workers=2, users=[user])
+    report.finished_at = user.finished_at
+
+    lines = report.write_jsonl(tmp_path).read_text().splitlines()
+    records = [json.loads(line) for line in lines]
+
+    assert [record["type"] for record in records] == ["user", "run"]
+    assert records[0]["phases"]["scan"] >= 0
+    assert records[0]["requests"]["requests"] == {"image": 2}
+    assert records[1]["outcomes"] == {"success": 1}
+    assert records[1]["pages"] == 3
+
+
+def test_plan_run_ranks_stale_cheap_owners_first_and_defers_overflow():
+    """Stale owners go first; owners ending past the budget are deferred."""
+    now = datetime(2026, 1, 2, 12, 0)
+    stats = [
+        scheduler.OwnerStats("fresh", now - timedelta(hours=1), 60.0, 500),
+        scheduler.OwnerStats("stale", now - timedelta(hours=48), 60.0, 500),
+        scheduler.OwnerStats("huge", now - timedelta(hours=48), 3000.0, 50000),
+    ]
+
+    plan = scheduler.plan_run(stats, now, workers=1, budget_s=600)
+
+    assert [item.owner for item in plan.scheduled] == ["stale", "fresh"]
+    assert [item.owner for item in plan.deferred] == ["huge"]
+
+
+def test_retry_backoff_grows_exponentially_with_jitter_and_cap():
+    """Delays stay within [ceiling/2, ceiling] and stop growing at the cap."""
+    settings = get_settings()
+    rng = random.Random(7)
+
+    for retry_count in range(10):
+        ceiling = min(
+            settings.RETRY_MAX_DELAY_SECONDS,
+            settings.RETRY_BASE_DELAY_SECONDS * 2**retry_count,
+        )
+        delay = retry_service.backoff_seconds(retry_count, rng)
+        assert ceiling / 2 <= delay <= ceiling
+
+
+def test_avatar_cache_dedups_downscales_and_evicts_oldest(tmp_path, monkeypatch):
+    """Identical images share a key; eviction removes least recently used."""
+    monkeypatch.setenv("AVATAR_CACHE_DIR", str(tmp_path / "avatars"))
+    monkeypatch.setenv("AVATAR_SIZE_PX", "32")
+    get_settings.cache_clear()
+
+    def png(color: str) -> bytes:
+        output = io.BytesIO()
+        Image.new("RGB", (320, 320), color).save(output, format="PNG")
+        return output.getvalue()
+
+    try:
+        old_key = avatar_cache.store_avatar(png("red"))
+        assert avatar_cache.store_avatar(png("red")) == old_key
+        with Image.open(avatar_cache.avatar_path(old_key)) as image:
+            assert image.size == (32, 32)
+
+        new_key = avatar_cache.store_avatar(png("blue"))
+        os.utime(avatar_cache.avatar_path(old_key), (0, 0))
+        size = avatar_cache.avatar_path(new_key).stat().st_size
+        budget = int(size / avatar_cache.EVICTION_TARGET_RATIO) + 1
+
+        assert avatar_cache.evict_to_budget(budget) == 1
+        assert avatar_cache.touch_avatar(old_key) is None
+        assert avatar_cache.touch_avatar(new_key) is not None
+        assert avatar_cache.touch_avatar("../etc/passwd") is None
+    finally:
+        get_settings.cache_clear()
+
+
+def test_spool_lists_pending_oldest_first_and_moves_done(tmp_path, monkeypatch):
+    """Spooled results round-trip and leave pending/ once marked done."""
+    monkeypatch.setenv("COLLECTOR_SPOOL_DIR", str(tmp_path / "spool"))
+    get_settings.cache_clear()
+    unfollowers = [
+        {
+            "unfollower_username": "ghost",
+            "unfollower_fullname": "유령",
+            "unfollower_profile_url": "https://cdn.example/ghost.jpg",
+        }
+    ]
+
+    try:
+        newer = spool.write_result("alice", unfollowers, datetime(2026, 1, 2))
+        older = spool.write_result("alice", [], datetime(2026, 1, 1))
+        spool.write_result("alice.bob", [], datetime(2026, 1, 3))
+
+        pending = spool.list_pending("alice")
+        assert [result.path for result in pending] == [older.path, newer.path]
+        assert spool.read_result(pending[-1]) == (unfollowers, None)
+
+        for result in pending:
+            spool.mark_done(result)
+        assert [result.owner for result in spool.list_pending()] == ["alice.bob"]
+        assert spool.prune_done(max_age_days=-1) == 2
+    finally:
+        get_settings.cache_clear()
+
+
+def test_precheck_skips_only_unchanged_recent_scans():
+    """Unchanged counts skip the scan until the last full scan gets too old."""
+    now = datetime(2026, 10, 17, 12, 0)
+    max_days = get_settings().COLLECTOR_PRECHECK_MAX_SKIP_DAYS
+    counts = precheck.FollowCounts(following=300, followers=250)
+
+    recent = now - timedelta(days=1)
+    assert precheck.can_skip_full_scan(counts, 300, 250, recent, now)
+    assert not precheck.can_skip_full_scan(counts, 300, 251, recent, now)
+    assert not precheck.can_skip_full_scan(counts, None, None, None, now)
+
+    expired = now - timedelta(days=max_days)
+    assert not precheck.can_skip_full_scan(counts, 300, 250, expired, now)
+
+
+def test_snapshot_analysis_finds_both_non_mutual_sets():
+    """Both directions are computed from the two lists, in scan order."""
+    following = [["a", "A", "pa"], ["b", "B", "pb"], ["c", "C", "pc"]]
+    followers = [["b", "B", "pb"], ["d", "D", "pd"]]
+    follow_snapshot = snapshot.FollowSnapshot(following, followers)
+
+    analysis = snapshot.analyze(follow_snapshot)
+
+    assert [u[0] for u in analysis.not_following_back] == ["a", "c"]
+    assert [u[0] for u in analysis.not_followed_back] == ["d"]
+    assert snapshot.decode_users(snapshot.encode_users(following)) == following
+    assert snapshot.to_unfollower(following[0]) == {
+        "unfollower_username": "a",
+        "unfollower_fullname": "A",
+        "unfollower_profile_url": "pa",
+    }
+
+
+def test_adaptive_pacer_speeds_up_and_backs_off_whole_egress():
+    """Healthy pages raise both rates; a throttle halves them with a cooldown."""
+    settings = get_settings()
+    egress = pacing.TokenBucket(rate=1.0, capacity=2, min_rate=0.1, max_rate=3.0)
+    pacer = pacing.AdaptivePacer(
+        account=pacing.TokenBucket(rate=1.0, capacity=2, min_rate=0.1, max_rate=2.0),
+        egress=egress,
+    )
+    other = pacing.AdaptivePacer(
+        account=pacing.TokenBucket(rate=1.0, capacity=2, min_rate=0.1, max_rate=2.0),
+        egress=egress,
+    )
+
+    for _ in range(100):
+        pacer.record_success()
+    assert pacer.account.rate == 2.0
+    assert egress.rate == 3.0
+
+    pacer.record_throttle()
+    assert pacer.throttles == 1
+    assert pacer.account.rate == 2.0 * settings.COLLECTOR_PACING_DECREASE
+    assert egress.rate == 3.0 * settings.COLLECTOR_PACING_DECREASE
+    # 같은 IP의 다른 계정도 cooldown 동안 대기
+    assert other.egress.reserve() >= settings.COLLECTOR_THROTTLE_COOLDOWN_SECONDS
+
+
+def test_classify_response_detects_throttling_and_checkpoints():
+    """Throttling and checkpoint responses are told apart from other errors."""
+    wait = {"message": "Please wait a few minutes", "status": "fail"}
+    assert graphql.classify_response(429, wait) == graphql.RESPONSE_THROTTLED
+    assert graphql.classify_response(400, wait) == graphql.RESPONSE_THROTTLED
+    assert (
+        graphql.classify_response(400, {"message": "checkpoint_required"})
+        == graphql.RESPONSE_CHECKPOINT
+    )
+    assert graphql.classify_response(500, None) == graphql.RESPONSE_ERROR
+    assert graphql.classify_response(200, {"data": {}}) == graphql.RESPONSE_OK
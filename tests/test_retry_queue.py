@@ -0,0 +1,232 @@
+"""Retry queue tests.
+
+Like tests/test_collection_job.py these need a real Postgres (SKIP LOCKED
+and the partial unique index) and are skipped unless
+COLLECTOR_TEST_DATABASE_URL points at a disposable database.
+"""
+
+import os
+from contextlib import asynccontextmanager
+from datetime import timedelta
+import pytest
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from core.config import get_settings
+from core.database import Base
+from core.db import retry_queue_db
+from core.models import VerificationRetryQueue
+from core.services import retry_service
+from core.utils import get_kst_now
+
+TEST_DATABASE_URL = os.getenv("COLLECTOR_TEST_DATABASE_URL")
+
+pytestmark = pytest.mark.skipif(
+    not TEST_DATABASE_URL, reason="COLLECTOR_TEST_DATABASE_URL is not set"
+)
+
+TABLES = [VerificationRetryQueue.__table__]
+BATCH = "collect"
+
+
+@asynccontextmanager
+async def retry_queue():
+    """Fresh verification_retry_queue table."""
+    engine = create_async_engine(TEST_DATABASE_URL)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all, tables=TABLES)
+        await conn.run_sync(Base.metadata.create_all, tables=TABLES)
+
+    try:
+        yield async_sessionmaker(engine, expire_on_commit=False)
+    finally:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all, tables=TABLES)
+        await engine.dispose()
+
+
+async def enqueue(session, owner: str, batch_type: str = BATCH, delay_s: int = -1):
+    """Queue an item due delay_s seconds from now (past by default)."""
+    return await retry_queue_db.enqueue_retry(
+        session,
+        batch_type,
+        owner,
+        f"https://www.instagram.com/{owner}/",
+        get_kst_now() + timedelta(seconds=delay_s),
+    )
+
+
+async def statuses(session_maker) -> dict[str, tuple[str, int]]:
+    """(status, retry_count) of every item by shortcode."""
+    async with session_maker() as session:
+        result = await session.execute(select(VerificationRetryQueue))
+        return {
+            item.shortcode: (item.status, item.retry_count)
+            for item in result.scalars().all()
+        }
+
+
+@pytest.mark.asyncio
+async def test_enqueue_dedups_only_active_items():
+    """The partial unique index keeps one pending/processing item per key."""
+    async with retry_queue() as session_maker:
+        async with session_maker() as session:
+            first = await enqueue(session, "owner_a")
+            duplicate = await enqueue(session, "owner_a")
+            other_batch = await enqueue(session, "owner_a", batch_type="verify")
+            await session.commit()
+
+        async with session_maker() as session:
+            [item] = await retry_queue_db.claim_due_retries(session, [BATCH], 10)
+            await retry_queue_db.mark_retry_completed(session, item.id)
+            await session.commit()
+
+        async with session_maker() as session:
+            requeued = await enqueue(session, "owner_a")
+            await session.commit()
+
+    assert (first, duplicate, other_batch, requeued) == (True, False, True, True)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_claims_skip_locked_and_future_items():
+    """A row locked by one worker is skipped; items not yet due are not claimed."""
+    async with retry_queue() as session_maker:
+        async with session_maker() as session:
+            await enqueue(session, "owner_a", delay_s=-20)
+            await enqueue(session, "owner_b", delay_s=-10)
+            await enqueue(session, "owner_later", delay_s=3600)
+            await session.commit()
+
+        async with session_maker() as first, session_maker() as second:
+            claimed_1 = await retry_queue_db.claim_due_retries(first, [BATCH], 1)
+            claimed_2 = await retry_queue_db.claim_due_retries(second, [BATCH], 10)
+            await first.commit()
+            await second.commit()
+
+        assert [item.shortcode for item in claimed_1] == ["owner_a"]
+        assert [item.shortcode for item in claimed_2] == ["owner_b"]
+        assert await statuses(session_maker) == {
+            "owner_a": (retry_queue_db.RETRY_PROCESSING, 0),
+            "owner_b": (retry_queue_db.RETRY_PROCESSING, 0),
+            "owner_later": (retry_queue_db.RETRY_PENDING, 0),
+        }
+
+
+@pytest.mark.asyncio
+async def test_mark_failed_reschedules_or_gives_up():
+    """A failed attempt goes back to pending, or to failed without a next attempt."""
+    async with retry_queue() as session_maker:
+        async with session_maker() as session:
+            await enqueue(session, "owner_a")
+            await enqueue(session, "owner_b")
+            await session.commit()
+
+        async with session_maker() as session:
+            items = await retry_queue_db.claim_due_retries(session, [BATCH], 10)
+            by_owner = {item.shortcode: item.id for item in items}
+            await retry_queue_db.mark_retry_failed(
+                session,
+                by_owner["owner_a"],
+                "scan_failed",
+                get_kst_now() + timedelta(hours=1),
+            )
+            await retry_queue_db.mark_retry_failed(
+                session, by_owner["owner_b"], "scan_failed", None
+            )
+            await session.commit()
+
+        async with session_maker() as session:
+            due = await retry_queue_db.claim_due_retries(session, [BATCH], 10)
+            await session.commit()
+
+        assert due == []
+        assert await statuses(session_maker) == {
+            "owner_a": (retry_queue_db.RETRY_PENDING, 1),
+            "owner_b": (retry_queue_db.RETRY_FAILED, 1),
+        }
+
+
+@pytest.mark.asyncio
+async def test_release_stale_returns_only_stuck_items():
+    """Items processing for longer than the stale threshold become pending again."""
+    async with retry_queue() as session_maker:
+        async with session_maker() as session:
+            await enqueue(session, "owner_stuck")
+            await enqueue(session, "owner_busy")
+            await retry_queue_db.claim_due_retries(session, [BATCH], 10)
+            await session.execute(
+                update(VerificationRetryQueue)
+                .where(VerificationRetryQueue.shortcode == "owner_stuck")
+                .values(last_attempt_at=get_kst_now() - timedelta(hours=2))
+            )
+            await session.commit()
+
+        async with session_maker() as session:
+            released = await retry_queue_db.release_stale_retries(
+                session, [BATCH], 3600
+            )
+            claimed = await retry_queue_db.claim_due_retries(session, [BATCH], 10)
+            await session.commit()
+
+    assert released == 1
+    assert [item.shortcode for item in claimed] == ["owner_stuck"]
+
+
+@pytest.mark.asyncio
+async def test_complete_pending_leaves_processing_items():
+    """A scheduled success completes pending items, not ones a worker is running."""
+    async with retry_queue() as session_maker:
+        async with session_maker() as session:
+            await enqueue(session, "owner_running")
+            await retry_queue_db.claim_due_retries(session, [BATCH], 10)
+            await enqueue(session, "owner_pending")
+            await session.commit()
+
+        async with session_maker() as session:
+            completed = await retry_queue_db.complete_pending_retries(
+                session, BATCH, ["owner_running", "owner_pending", "owner_none"]
+            )
+            await session.commit()
+
+        assert completed == 1
+        assert await statuses(session_maker) == {
+            "owner_running": (retry_queue_db.RETRY_PROCESSING, 0),
+            "owner_pending": (retry_queue_db.RETRY_COMPLETED, 0),
+        }
+
+
+@pytest.mark.asyncio
+async def test_process_due_retries_fails_item_after_max_attempts(monkeypatch):
+    """A handler that keeps failing ends in failed after RETRY_MAX_ATTEMPTS."""
+    monkeypatch.setenv("RETRY_MAX_ATTEMPTS", "2")
+    get_settings.cache_clear()
+    monkeypatch.setattr(retry_service, "_handlers", {})
+
+    async def failing_handler(item):
+        raise RuntimeError("scan_failed")
+
+    retry_service.register_retry_handler(BATCH, failing_handler)
+    try:
+        async with retry_queue() as session_maker:
+            async with session_maker() as session:
+                await enqueue(session, "owner_a")
+                await session.commit()
+
+            first = await retry_service.process_due_retries(session_maker)
+            async with session_maker() as session:
+                # 백오프를 기다리지 않고 바로 다시 시도
+                await session.execute(
+                    update(VerificationRetryQueue).values(
+                        next_attempt_at=get_kst_now() - timedelta(seconds=1)
+                    )
+                )
+                await session.commit()
+            second = await retry_service.process_due_retries(session_maker)
+
+            assert (first.rescheduled, first.failed) == (1, 0)
+            assert (second.rescheduled, second.failed) == (0, 1)
+            assert await statuses(session_maker) == {
+                "owner_a": (retry_queue_db.RETRY_FAILED, 2)
+            }
+    finally:
+        get_settings.cache_clear()
@@ -91,6 +91,7 @@ export interface Unfollower {
   unfollower_username: string;
   unfollower_fullname: string;
   unfollower_profile_url: string;
+  unfollower_profile_image?: string | null;
   created_at: string | null;
   updated_at: string | null;
 }
@@ -98,6 +99,7 @@ export interface Unfollower {
 export interface UnfollowersResponse {
   owner: string;
   count: number;
+  next_cursor: string | null;
   unfollowers: Unfollower[];
 }
 